@@ -0,0 +1,312 @@
+"""Benchmark suite for the K-factor engine and the Streamlit page.
+
+Four tiers are timed:
+
+* ``micro``  – the K methods and the geometry kernels, on a scalar and on
+  arrays of 1e3 … 1e7 elements;
+* ``macro``  – every figure builder in ``charts``, with every cache it
+  reads cleared;
+* ``script`` – a headless run of ``main.py`` through Streamlit's AppTest,
+  cold (first run in a fresh session) and warm (a rerun of the same one);
+* ``batch``  – a table of 4e6 bends with material and method names: the
+  string encoding alone, ``compute_batch``, and ``compute_batch_parallel``
+  on 2, 4 … CPU-count workers (pool start-up excluded), with the speed-up
+  over one process printed for each. These timings depend on the core
+  count and memory bandwidth more than on the code, so the tier is reported
+  only: it is neither saved to nor compared with the baseline.
+
+Usage::
+
+    python -m benchmarks.run                    # compare against baseline
+    python -m benchmarks.run --save             # (re)write the baseline
+    python -m benchmarks.run --only micro --max-size 100000
+
+Results are compared with ``benchmarks/baseline.json``; the run exits with
+status 1 if any benchmark is slower than ``threshold × baseline``. Timings
+are machine specific, so the baseline must be regenerated with ``--save``
+on whichever machine runs the comparison.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import timeit
+from pathlib import Path
+
+import numpy as np
+
+import kfactor
+from kfactor import (
+    bend_allowance, bend_deduction, k_analytical, k_analytical_vec, k_din6935,
+    k_din6935_vec, k_logistic, k_logistic_vec, overbend_angle, springback_angle,
+)
+
+ROOT = Path(__file__).resolve().parent.parent
+BASELINE = Path(__file__).resolve().parent / "baseline.json"
+SIZES = (10**3, 10**4, 10**5, 10**6, 10**7)
+DEFAULT_THRESHOLD = 1.5
+BATCH_ROWS = 4 * 10**6
+TIERS = ("micro", "macro", "script", "batch")
+REPORT_ONLY = ("batch",)      # timed and printed, never saved or compared
+
+
+def measure(fn, repeat: int = 5) -> float:
+    """Best-of-``repeat`` wall time of one call to ``fn``, in seconds."""
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+# ─── Micro ───────────────────────────────────────────────────────────────
+def micro_cases(max_size: int):
+    rng = np.random.default_rng(0)
+    scalar = {
+        "k_logistic":   lambda: k_logistic.__wrapped__(2.5),
+        "k_analytical": lambda: k_analytical.__wrapped__(2.5),
+        "k_din6935":    lambda: k_din6935.__wrapped__(2.5),
+        "k_logistic[cached]": lambda: k_logistic(2.5),
+        "bend_allowance": lambda: bend_allowance(0.42, 90, 2.0, 1.5),
+        "bend_deduction": lambda: bend_deduction(3.1, 2.0, 1.5, 90),
+        "springback_angle": lambda: springback_angle(90, 2.0, 1.5, 215, 193_000),
+    }
+    for name, fn in scalar.items():
+        yield f"micro/{name}/scalar", fn
+
+    for n in (s for s in SIZES if s <= max_size):
+        r_s   = rng.uniform(0.1, 20, n)
+        angle = rng.uniform(10, 170, n)
+        t     = rng.uniform(0.5, 6, n)
+        r     = r_s * t
+        K     = k_logistic_vec(r_s)
+        BA    = bend_allowance(K, angle, r, t)
+        vector = {
+            "k_logistic_vec":   lambda: k_logistic_vec(r_s),
+            "k_analytical_vec": lambda: k_analytical_vec(r_s),
+            "k_din6935_vec":    lambda: k_din6935_vec(r_s),
+            "bend_allowance":   lambda: bend_allowance(K, angle, r, t),
+            "bend_deduction":   lambda: bend_deduction(BA, r, t, angle),
+            "springback_angle": lambda: springback_angle(angle, r, t, 215, 193_000),
+            "overbend_angle":   lambda: overbend_angle(angle, r, t, 215, 193_000),
+        }
+        for name, fn in vector.items():
+            yield f"micro/{name}/{n:.0e}", fn
+
+
+# ─── Macro ───────────────────────────────────────────────────────────────
+def uncached(fn):
+    """The builder beneath the in-memory and disk cache layers."""
+    while hasattr(fn, "cache") or hasattr(fn, "disk_cache"):
+        fn = fn.__wrapped__
+    return fn
+
+def cold(fn, *inner):
+    """:func:`uncached` ``fn``, with the caches of the memoised helpers it
+    calls (``inner``) cleared before every call."""
+    fn = uncached(fn)
+
+    def call(*args, **kwargs):
+        for helper in inner:
+            helper.cache_clear()
+        return fn(*args, **kwargs)
+    return call
+
+def macro_cases():
+    import charts
+
+    r, t, bend_angle, method, unit_lbl = 2.0, 1.5, 90, "Logistic fit", "mm"
+    r_s = r / t
+    K   = kfactor.k_for_method(r_s, method)
+    BA  = bend_allowance(K, bend_angle, r, t)
+    BD  = bend_deduction(BA, r, t, bend_angle)
+    mat = "Steel – SS 304"
+
+    cases = {
+        "build_fig1":      lambda: uncached(charts.build_fig1)(r_s, K, t, method, bend_angle, BA, unit_lbl),
+        "build_fig_div":   lambda: cold(charts.build_fig_div, charts._fig_div_base)(r_s),
+        "build_fig_xs":    lambda: uncached(charts.build_fig_xs)(r, t, K, bend_angle, 50.0, 30.0, unit_lbl),
+        "heatmap_grids":   lambda: uncached(charts.heatmap_grids)(t, method),
+        "build_fig_hm_ba": lambda: cold(charts.build_fig_hm_ba, charts.heatmap_grids)(r_s, t, method, bend_angle, BA, unit_lbl),
+        "build_fig_hm_bd": lambda: cold(charts.build_fig_hm_bd, charts.heatmap_grids)(r_s, t, method, bend_angle, BD, unit_lbl),
+        "build_fig_sb":    lambda: uncached(charts.build_fig_sb)(r, t, mat, bend_angle),
+        "build_fig_mat":   lambda: uncached(charts.build_fig_mat)(K, mat),
+    }
+    for name, fn in cases.items():
+        yield f"macro/{name}", fn
+
+
+# ─── Full script ─────────────────────────────────────────────────────────
+def script_results(repeat: int = 3) -> dict[str, float]:
+    """Cold and warm headless runs of ``main.py``.
+
+    "cold" clears the figure caches first, so it includes building every
+    figure; "warm" reruns an already-rendered session with nothing changed.
+    """
+    import charts
+    from streamlit.testing.v1 import AppTest
+
+    builders = [getattr(charts, n) for n in dir(charts) if hasattr(getattr(charts, n), "cache_clear")]
+    cold, warm = [], []
+    for _ in range(repeat):
+        for fn in builders:
+            fn.cache_clear()
+        at = AppTest.from_file(str(ROOT / "main.py"), default_timeout=120)
+        t0 = time.perf_counter()
+        at.run()
+        cold.append(time.perf_counter() - t0)
+        if at.exception:
+            raise RuntimeError(f"main.py raised: {at.exception[0].message}")
+        t0 = time.perf_counter()
+        at.run()
+        warm.append(time.perf_counter() - t0)
+    return {"script/cold": min(cold), "script/warm": min(warm)}
+
+
+# ─── Batch ───────────────────────────────────────────────────────────────
+def batch_table(n: int) -> dict[str, np.ndarray]:
+    rng = np.random.default_rng(0)
+    materials = np.array(list(kfactor.MATERIALS), dtype=object)
+    methods   = np.array(kfactor.METHOD_REGISTRY.names(), dtype=object)
+    t = rng.uniform(0.5, 6, n)
+    return {
+        "r":        rng.uniform(0.1, 20, n) * t,
+        "t":        t,
+        "angle":    rng.uniform(10, 170, n),
+        "material": materials[rng.integers(len(materials), size=n)],
+        "method":   methods[rng.integers(len(methods), size=n)],
+    }
+
+def batch_cases(n: int):
+    from concurrent.futures import ProcessPoolExecutor
+
+    from kfactor.batch import encode_materials, encode_methods
+    from kfactor.parallel import default_workers
+
+    table = batch_table(n)
+    yield f"batch/encode/{n:.0e}", lambda: (encode_methods(table["method"]),
+                                           encode_materials(table["material"]))
+    yield f"batch/compute_batch/{n:.0e}", lambda: kfactor.compute_batch(table)
+
+    cpus = default_workers()
+    for workers in sorted({w for w in (2, 4, 8, 16) if w < cpus} | {cpus} - {1}):
+        shard = -(-n // workers)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # Warm the pool so worker start-up is not part of the timing.
+            list(pool.map(abs, range(workers)))
+            yield (f"batch/compute_batch_parallel[{workers}]/{n:.0e}",
+                   lambda: kfactor.compute_batch_parallel(table, chunksize=shard, executor=pool))
+
+
+# ─── Driver ──────────────────────────────────────────────────────────────
+def run(tiers, max_size: int, log=print) -> dict[str, float]:
+    # The disk cache stays off unless KFACTOR_DISK_CACHE is set, so macro
+    # cases and cold script runs compute rather than read back results.
+    os.environ.setdefault("KFACTOR_DISK_CACHE", "0")
+    results: dict[str, float] = {}
+
+    def timed(cases):
+        for name, fn in cases:
+            results[name] = measure(fn)
+            log(f"  {name:<40s} {fmt(results[name])}")
+
+    if "micro" in tiers:
+        log("micro")
+        timed(micro_cases(max_size))
+    if "macro" in tiers:
+        log("macro")
+        timed(macro_cases())
+    if "batch" in tiers:
+        log("batch")
+        n = min(BATCH_ROWS, max_size)
+        timed(batch_cases(n))
+        serial = results[f"batch/compute_batch/{n:.0e}"]
+        for name, secs in results.items():
+            if name.startswith("batch/compute_batch_parallel"):
+                log(f"  {name:<40s} {serial / secs:8.2f}× vs one process")
+    if "script" in tiers:
+        log("script")
+        for name, secs in script_results().items():
+            results[name] = secs
+            log(f"  {name:<40s} {fmt(secs)}")
+    return results
+
+
+def fmt(secs: float) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("µs", 1e-6)):
+        if secs >= scale:
+            return f"{secs / scale:8.2f} {unit}"
+    return f"{secs / 1e-9:8.2f} ns"
+
+
+def reported_only(name: str) -> bool:
+    return name.split("/", 1)[0] in REPORT_ONLY
+
+
+def compare(results: dict[str, float], baseline: dict[str, float],
+            threshold: float) -> list[str]:
+    """Names of benchmarks slower than ``threshold`` × their baseline."""
+    failed = []
+    print(f"\n{'benchmark':<40s} {'baseline':>11s} {'current':>11s}  ratio")
+    for name, secs in results.items():
+        if reported_only(name):
+            print(f"{name:<40s} {'—':>11s} {fmt(secs)}    not compared")
+            continue
+        ref = baseline.get(name)
+        if ref is None:
+            print(f"{name:<40s} {'—':>11s} {fmt(secs)}    new")
+            continue
+        ratio = secs / ref
+        flag = "  REGRESSION" if ratio > threshold else ""
+        print(f"{name:<40s} {fmt(ref)} {fmt(secs)}  {ratio:5.2f}{flag}")
+        if ratio > threshold:
+            failed.append(name)
+    return failed
+
+
+def build_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(prog="python -m benchmarks.run", description=__doc__.split("\n\n")[0])
+    p.add_argument("--only", nargs="+", choices=TIERS, default=list(TIERS),
+                   help="benchmark tiers to run (default: all)")
+    p.add_argument("--max-size", type=int, default=SIZES[-1],
+                   help="largest array size for micro benchmarks and row count cap for "
+                        "batch ones (default: %(default)g)")
+    p.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                   help="fail when current > threshold × baseline (default: %(default)s)")
+    p.add_argument("--baseline", type=Path, default=BASELINE,
+                   help="baseline file (default: benchmarks/baseline.json)")
+    p.add_argument("--save", action="store_true",
+                   help="write results to the baseline file instead of comparing")
+    return p
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    results = run(args.only, args.max_size)
+
+    if args.save:
+        stored = json.loads(args.baseline.read_text())["results"] if args.baseline.exists() else {}
+        stored.update({k: v for k, v in results.items() if not reported_only(k)})
+        args.baseline.write_text(json.dumps({
+            "machine": f"{platform.machine()} · {platform.processor() or platform.system()}",
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "engine": kfactor.__version__,
+            "results": stored,
+        }, indent=2) + "\n")
+        print(f"\nbaseline written to {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print(f"\nno baseline at {args.baseline}; run with --save first", file=sys.stderr)
+        return 2
+    baseline = json.loads(args.baseline.read_text())["results"]
+    failed = compare(results, baseline, args.threshold)
+    if failed:
+        print(f"\n{len(failed)} benchmark(s) regressed beyond {args.threshold}×", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
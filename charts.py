@@ -0,0 +1,678 @@
+"""Plotly figure builders for the K-Factor Calculator page.
+
+Kept free of Streamlit so the figures can be built, cached and timed
+outside a running app (see ``benchmarks/``).
+"""
+import base64
+
+import numpy as np
+import pandas as pd
+import plotly
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+from kfactor import (
+    MATERIAL_STORE, METHOD_REGISTRY, METHODS, MaterialStore,
+    bend_allowance, bend_grid, k_for_method, memoize, overbend_angle, springback_angle,
+)
+from kfactor.diskcache import disk_cached, source_digest
+from kfactor.instrument import instrumented
+from kfactor.lod import decimate_grid, simplify
+from kfactor.methods import CURVE_PREFIX
+from kfactor.reference import DIVERGENCE_REFERENCE, RS_RANGE, is_static, reference_assets
+from kfactor.sweep import ResultCube, sweep
+
+# ─── Chart Style ─────────────────────────────────────────────────────────
+PLOT_LAYOUT = dict(
+    paper_bgcolor="#f8faf8",
+    plot_bgcolor="#ffffff",
+    font=dict(family="Plus Jakarta Sans", color="#4a6e4a", size=12),
+    legend=dict(bgcolor="rgba(255,255,255,0.9)", bordercolor="#d4ead4", borderwidth=1,
+                font=dict(size=11)),
+    margin=dict(l=10, r=10, t=48, b=10),
+)
+GRID_STYLE = dict(gridcolor="#e8f5e8", zerolinecolor="#d4ead4", linecolor="#d4ead4")
+C_GREEN   = "#16a34a"
+C_PURPLE  = "#7c3aed"
+C_BLUE    = "#0891b2"
+C_AMBER   = "#d97706"
+C_RED     = "#dc2626"
+
+# (line colour, dash, divergence fill) per built-in method; methods
+# registered later cycle through METHOD_PALETTE.
+METHOD_STYLES = {
+    "Logistic fit":             (C_GREEN,  "solid", "rgba(22,163,74,0.10)"),
+    "Analytical (Wang-Wenner)": (C_PURPLE, "dash",  "rgba(124,58,237,0.06)"),
+    "DIN 6935 empirical":       (C_BLUE,   "dot",   "rgba(8,145,178,0.06)"),
+}
+METHOD_PALETTE = [(C_AMBER, "dashdot", "rgba(217,119,6,0.06)"),
+                  (C_RED,   "longdash", "rgba(220,38,38,0.06)"),
+                  ("#db2777", "dashdot", "rgba(219,39,119,0.06)")]
+
+def method_style(method: str, i: int = 0) -> tuple[str, str, str]:
+    return METHOD_STYLES.get(method) or METHOD_PALETTE[i % len(METHOD_PALETTE)]
+
+# ─── Figure Cache ────────────────────────────────────────────────────────
+# Each figure is built by a function whose parameters are exactly the inputs
+# it depends on, so a rerun triggered by an unrelated widget reuses the
+# figure built last time. Entries are shared across sessions: callers must
+# not mutate a returned figure. Builders are instrumented inside the cache,
+# so their call counts are actual builds.
+#
+# Below the in-process cache, figures of the built-in methods also go to the
+# host-wide disk cache (kfactor.diskcache), so a new replica or a restarted
+# app starts warm. Registered and curve: methods can mean different things
+# in different processes and are only cached in memory. Entries are keyed
+# on this file's source, the plotly version and the reference assets (the
+# kfactor sources already stamp the cache file), and figures are stored as
+# plain dicts of arrays rather than pickled plotly objects.
+FIGURE_CACHE_SIZE = 256
+figure_cache = memoize(maxsize=FIGURE_CACHE_SIZE)
+
+def _builtin_methods_only(*args, **kwargs) -> bool:
+    for a in (*args, *kwargs.values()):
+        for name in (a if isinstance(a, tuple) else (a,)):
+            if isinstance(name, str) and name not in METHODS and (
+                    name in METHOD_REGISTRY or name.startswith(CURVE_PREFIX)):
+                return False
+    return True
+
+def _plain(obj):
+    """``to_plotly_json()`` output with plotly's ``{dtype, bdata}`` typed arrays decoded."""
+    if isinstance(obj, dict):
+        if "bdata" in obj and "dtype" in obj:
+            a = np.frombuffer(base64.b64decode(obj["bdata"]), dtype=obj["dtype"])
+            if "shape" in obj:      # "rows, cols" for 2-D arrays
+                a = a.reshape([int(n) for n in str(obj["shape"]).split(",")])
+            return a
+        return {k: _plain(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return type(obj)(_plain(v) for v in obj)
+    return obj
+
+def _encode_figure(value):
+    if isinstance(value, go.Figure):
+        return ("figure", _plain(value.to_plotly_json()))
+    return ("value", value)
+
+def _decode_figure(record):
+    kind, value = record
+    return go.Figure(value) if kind == "figure" else value
+
+durable = disk_cached(
+    when=_builtin_methods_only,
+    version=f"{source_digest(__file__)}-plotly{plotly.__version__}-{reference_assets().version}",
+    encode=_encode_figure, decode=_decode_figure,
+)
+
+
+# ─── Level of Detail ─────────────────────────────────────────────────────
+# Curves are sent to the browser simplified (kfactor.lod): points are kept
+# where the curve bends and dropped on straight stretches, within about half
+# a pixel of the full-resolution line. Sweep heatmaps are strided down to a
+# cell budget. The curve builders take ``full_resolution=True`` for the
+# report's chart export (see charts_html).
+LOD_TOLERANCE  = 5e-4
+LOD_MIN_POINTS = 24
+LOD_MAX_CELLS  = 40_000
+
+def _lod(x, *ys, full_resolution: bool = False) -> tuple[np.ndarray, ...]:
+    if full_resolution:
+        return (x, *ys)
+    return simplify(x, *ys, tol=LOD_TOLERANCE, min_points=LOD_MIN_POINTS)
+
+
+# ─── Reference Curves ───────────────────────────────────────────────────
+# Curves of the built-in methods come from the precomputed reference assets
+# (kfactor.reference), loaded once per process at import; only registered
+# and curve: methods are evaluated here.
+rs_range = RS_RANGE
+REFERENCE = reference_assets()
+
+@memoize(maxsize=16)
+def reference_curves(methods: tuple[str, ...], registry_version: int) -> dict[str, np.ndarray]:
+    """K over ``rs_range`` for each method; ``registry_version`` keys out replaced methods."""
+    return {m: REFERENCE.curves[m] if is_static(m) else METHOD_REGISTRY.get(m).vec(rs_range)
+            for m in methods}
+
+def _curves(methods: tuple[str, ...]) -> dict[str, np.ndarray]:
+    return reference_curves(tuple(methods), METHOD_REGISTRY.version)
+
+def _divergence(methods: tuple[str, ...]) -> dict[str, np.ndarray]:
+    """|K − K_DIN| × 1000 over ``rs_range`` per method."""
+    if all(map(is_static, (*methods, DIVERGENCE_REFERENCE))):
+        return {m: REFERENCE.divergence[m] for m in methods}
+    curves = _curves(tuple(dict.fromkeys((*methods, DIVERGENCE_REFERENCE))))
+    return {m: np.abs(curves[m] - curves[DIVERGENCE_REFERENCE]) * 1000 for m in methods}
+
+# ── BA family of curves (r = 1t, 2t, 4t, 8t) ──
+angles_deg = np.linspace(1, 180, 360)
+r_multiples = [(1, 1.0), (2, 0.72), (4, 0.45), (8, 0.25)]
+
+# ── Heatmap axes ──
+rs_vals_hm  = np.linspace(0.1, 8.0, 40)
+angle_vals  = np.linspace(10, 170, 35)
+
+
+# ─── Figure Builders ─────────────────────────────────────────────────────
+@figure_cache
+@durable
+@instrumented
+def build_fig1(r_s: float, K: float, t: float, method: str, bend_angle: int, BA: float, unit_lbl: str,
+               methods: tuple[str, ...] = METHODS, full_resolution: bool = False):
+    curves = _curves(methods)
+    fig1 = make_subplots(
+        rows=1, cols=2,
+        subplot_titles=["K-Factor vs r/t  —  All Methods + Uncertainty Band",
+                        "Bend Allowance vs Angle  —  r = 1t, 2t, 4t, 8t"],
+        horizontal_spacing=0.10,
+    )
+
+    # Uncertainty band
+    band_x, band_hi, band_lo = _lod(rs_range, np.maximum.reduce(list(curves.values())),
+                                    np.minimum.reduce(list(curves.values())),
+                                    full_resolution=full_resolution)
+    fig1.add_trace(go.Scatter(
+        x=np.concatenate([band_x, band_x[::-1]]),
+        y=np.concatenate([band_hi, band_lo[::-1]]),
+        fill="toself",
+        fillcolor="rgba(22,163,74,0.09)",
+        line=dict(color="rgba(0,0,0,0)"),
+        name="Method spread",
+        hoverinfo="skip",
+    ), row=1, col=1)
+
+    # K curves
+    for i, (m, arr) in enumerate(curves.items()):
+        color, dash, _ = method_style(m, i)
+        x, y = _lod(rs_range, arr, full_resolution=full_resolution)
+        fig1.add_trace(go.Scatter(
+            x=x, y=y, name=METHOD_REGISTRY.get(m).label,
+            line=dict(color=color, width=2, dash=dash),
+            hovertemplate="r/t=%{x:.2f}<br>K=%{y:.4f}<extra></extra>",
+        ), row=1, col=1)
+
+    # User point (star)
+    fig1.add_trace(go.Scatter(
+        x=[r_s], y=[K], name="Your calc",
+        mode="markers",
+        marker=dict(color=C_GREEN, size=14, symbol="star",
+                    line=dict(color="white", width=2)),
+        hovertemplate=f"r/t={r_s:.3f}<br>K={K:.4f}<extra>Your calc</extra>",
+    ), row=1, col=1)
+
+    # Ref line K=0.5 with annotation
+    fig1.add_hline(y=0.5, line=dict(color="#9ab89a", dash="dot", width=1.2), row=1, col=1)
+    fig1.add_annotation(
+        x=22, y=0.503,
+        text="K = 0.5  (mid-plane)",
+        font=dict(size=10, color="#9ab89a", family="IBM Plex Mono"),
+        showarrow=False, xref="x", yref="y",
+    )
+
+    # BA family of curves
+    ba_colors = [C_GREEN, "#0891b2", "#7c3aed", "#d97706"]
+    for (mult, _), color in zip(r_multiples, ba_colors):
+        r_i  = mult * t
+        K_i  = k_for_method(r_i / t, method)
+        x, ba_i = _lod(angles_deg, bend_allowance(K_i, angles_deg, r_i, t),
+                       full_resolution=full_resolution)
+        fig1.add_trace(go.Scatter(
+            x=x, y=ba_i,
+            name=f"r = {mult}t",
+            line=dict(color=color, width=2),
+            hovertemplate=f"r={mult}t, α=%{{x:.0f}}°<br>BA=%{{y:.3f}} {unit_lbl}<extra></extra>",
+        ), row=1, col=2)
+
+    # Current point on BA chart
+    fig1.add_vline(x=bend_angle, line=dict(color=C_GREEN, dash="dot", width=1.5), row=1, col=2)
+    fig1.add_trace(go.Scatter(
+        x=[bend_angle], y=[BA],
+        mode="markers",
+        marker=dict(color=C_GREEN, size=11, symbol="circle", line=dict(color="white", width=2)),
+        showlegend=False,
+        hovertemplate=f"α={bend_angle}°<br>BA={BA:.3f} {unit_lbl}<extra>Your calc</extra>",
+    ), row=1, col=2)
+
+    fig1.update_layout(height=420, **PLOT_LAYOUT)
+    for ax in ["xaxis", "xaxis2", "yaxis", "yaxis2"]:
+        fig1.update_layout(**{ax: {**GRID_STYLE}})
+    fig1.update_xaxes(title_text="r/t ratio",       row=1, col=1)
+    fig1.update_yaxes(title_text="K-Factor",         row=1, col=1, range=[0.28, 0.52])
+    fig1.update_xaxes(title_text="Bend angle (°)",   row=1, col=2)
+    fig1.update_yaxes(title_text=f"Bend Allowance ({unit_lbl})", row=1, col=2)
+    fig1.update_annotations(font=dict(color="#4a6e4a", size=12))
+    return fig1
+
+
+@memoize(maxsize=16)
+def _fig_div_base(methods: tuple[str, ...], registry_version: int, full_resolution: bool) -> dict:
+    """The divergence chart without the user's r/t marker, as a figure dict."""
+    ref_label = METHOD_REGISTRY.get(DIVERGENCE_REFERENCE).label
+    divergence = _divergence(tuple(m for m in methods if m != DIVERGENCE_REFERENCE))
+
+    fig_div = go.Figure()
+    for i, m in enumerate(methods):
+        if m == DIVERGENCE_REFERENCE:
+            continue
+        color, dash, fill = method_style(m, i)
+        x, y = _lod(rs_range, divergence[m], full_resolution=full_resolution)
+        fig_div.add_trace(go.Scatter(
+            x=x, y=y,
+            name=f"|{METHOD_REGISTRY.get(m).label} − {ref_label}|",
+            line=dict(color=color, width=2, dash=dash),
+            fill="tozeroy", fillcolor=fill,
+            hovertemplate="r/t=%{x:.2f}<br>ΔK=%{y:.2f}×10⁻³<extra></extra>",
+        ))
+    fig_div.update_layout(
+        title=dict(text="Method Divergence vs DIN 6935  (×10⁻³)", font=dict(size=13), x=0),
+        xaxis_title="r/t ratio",
+        yaxis_title="ΔK  (×10⁻³)",
+        height=340, **PLOT_LAYOUT,
+    )
+    fig_div.update_xaxes(**GRID_STYLE)
+    fig_div.update_yaxes(**GRID_STYLE)
+    return fig_div.to_dict()
+
+@figure_cache
+@durable
+@instrumented
+def build_fig_div(r_s: float, methods: tuple[str, ...] = METHODS, full_resolution: bool = False):
+    # Only the marker depends on the inputs: overlay it on the shared base.
+    base = _fig_div_base(tuple(methods), METHOD_REGISTRY.version, full_resolution)
+    marker = dict(type="line", xref="x", yref="y domain", x0=r_s, x1=r_s, y0=0, y1=1,
+                  line=dict(color=C_GREEN, dash="dot", width=1.5))
+    return go.Figure({"data": base["data"], "layout": {**base["layout"], "shapes": [marker]}},
+                     skip_invalid=True)
+
+
+@figure_cache
+@durable
+@instrumented
+def build_fig_xs(r: float, t: float, K: float, bend_angle: int,
+                 leg1: float, leg2: float, unit_lbl: str):
+    angle_rad = np.radians(bend_angle)
+    R_neutral = r + K * t
+    R_outer   = r + t
+
+    # Arc points — neutral axis
+    arc_angles = np.linspace(np.pi / 2, np.pi / 2 + angle_rad, 80)
+    na_x = R_neutral * np.cos(arc_angles)
+    na_y = R_neutral * np.sin(arc_angles)
+
+    # Outer arc
+    arc_out_x = R_outer * np.cos(arc_angles)
+    arc_out_y = R_outer * np.sin(arc_angles)
+
+    # Inner arc
+    arc_in_x = r * np.cos(arc_angles)
+    arc_in_y = r * np.sin(arc_angles)
+
+    # Flanges from arc endpoints
+    start_dir = np.array([np.cos(arc_angles[0]),  np.sin(arc_angles[0])])
+    end_dir   = np.array([np.cos(arc_angles[-1]), np.sin(arc_angles[-1])])
+
+    # Flange A (right side, perpendicular to start tangent going right/down)
+    tang_start = np.array([-start_dir[1], start_dir[0]])
+    flange_len = min(leg1 if leg1 > 0 else 40, 80)
+    fa_out_start = np.array([arc_out_x[0], arc_out_y[0]])
+    fa_in_start  = np.array([arc_in_x[0],  arc_in_y[0]])
+    fa_out_end   = fa_out_start - tang_start * flange_len
+    fa_in_end    = fa_in_start  - tang_start * flange_len
+
+    # Flange B (left side)
+    tang_end = np.array([-end_dir[1], end_dir[0]])
+    flange_len_b = min(leg2 if leg2 > 0 else 25, 80)
+    fb_out_start = np.array([arc_out_x[-1], arc_out_y[-1]])
+    fb_in_start  = np.array([arc_in_x[-1],  arc_in_y[-1]])
+    fb_out_end   = fb_out_start + tang_end * flange_len_b
+    fb_in_end    = fb_in_start  + tang_end * flange_len_b
+
+    fig_xs = go.Figure()
+
+    # Full sheet polygon for fill
+    poly_x = (
+        [fa_out_end[0], fa_in_end[0], fa_in_start[0]] +
+        list(arc_in_x[::-1]) +
+        [arc_in_x[0], fa_in_start[0], fa_out_start[0]] +
+        list(arc_out_x) +
+        [fb_out_start[0], fb_out_end[0], fb_in_end[0], fb_in_start[0]] +
+        list(arc_in_x) +
+        [arc_in_x[-1], fb_in_start[0]]
+    )
+    poly_y = (
+        [fa_out_end[1], fa_in_end[1], fa_in_start[1]] +
+        list(arc_in_y[::-1]) +
+        [arc_in_y[0], fa_in_start[1], fa_out_start[1]] +
+        list(arc_out_y) +
+        [fb_out_start[1], fb_out_end[1], fb_in_end[1], fb_in_start[1]] +
+        list(arc_in_y) +
+        [arc_in_y[-1], fb_in_start[1]]
+    )
+
+    # Sheet fill
+    fig_xs.add_trace(go.Scatter(
+        x=poly_x, y=poly_y,
+        fill="toself", fillcolor="rgba(22,163,74,0.12)",
+        line=dict(color=C_GREEN, width=1.8),
+        name="Sheet cross-section",
+        hoverinfo="skip",
+    ))
+
+    # Neutral axis arc (dashed)
+    fig_xs.add_trace(go.Scatter(
+        x=list(na_x), y=list(na_y),
+        line=dict(color=C_AMBER, width=2, dash="dash"),
+        name=f"Neutral axis  K={K:.4f}",
+        hovertemplate="Neutral axis<extra></extra>",
+    ))
+
+    # Flange A lines
+    for xpts, ypts in [
+        ([fa_out_start[0], fa_out_end[0]], [fa_out_start[1], fa_out_end[1]]),
+        ([fa_in_start[0],  fa_in_end[0]],  [fa_in_start[1],  fa_in_end[1]]),
+    ]:
+        fig_xs.add_trace(go.Scatter(x=xpts, y=ypts, line=dict(color=C_GREEN, width=1.8),
+                                    showlegend=False, hoverinfo="skip"))
+    fig_xs.add_trace(go.Scatter(
+        x=[fa_out_end[0], fa_in_end[0]], y=[fa_out_end[1], fa_in_end[1]],
+        line=dict(color=C_GREEN, width=1.8), showlegend=False, hoverinfo="skip",
+    ))
+
+    # Flange B lines
+    for xpts, ypts in [
+        ([fb_out_start[0], fb_out_end[0]], [fb_out_start[1], fb_out_end[1]]),
+        ([fb_in_start[0],  fb_in_end[0]],  [fb_in_start[1],  fb_in_end[1]]),
+    ]:
+        fig_xs.add_trace(go.Scatter(x=xpts, y=ypts, line=dict(color=C_GREEN, width=1.8),
+                                    showlegend=False, hoverinfo="skip"))
+    fig_xs.add_trace(go.Scatter(
+        x=[fb_out_end[0], fb_in_end[0]], y=[fb_out_end[1], fb_in_end[1]],
+        line=dict(color=C_GREEN, width=1.8), showlegend=False, hoverinfo="skip",
+    ))
+
+    # Neutral axis position annotation (Kt from inner radius)
+    mid_idx = len(arc_angles) // 2
+    fig_xs.add_annotation(
+        x=na_x[mid_idx], y=na_y[mid_idx],
+        text=f"  K·t = {K*t:.3f} {unit_lbl}",
+        font=dict(size=10, color=C_AMBER, family="IBM Plex Mono"),
+        showarrow=True, arrowhead=2, arrowcolor=C_AMBER, arrowsize=0.8,
+        ax=30, ay=-30,
+    )
+
+    fig_xs.update_layout(
+        title=dict(text=f"Bend Cross-Section  —  {bend_angle}°  r={r} t={t} {unit_lbl}", font=dict(size=13), x=0),
+        height=340,
+        showlegend=True,
+        yaxis=dict(scaleanchor="x", scaleratio=1, **GRID_STYLE),
+        xaxis=dict(**GRID_STYLE),
+        **PLOT_LAYOUT,
+    )
+    fig_xs.update_xaxes(title_text=unit_lbl)
+    fig_xs.update_yaxes(title_text=unit_lbl)
+    return fig_xs
+
+
+@figure_cache
+@durable
+@instrumented
+def heatmap_grids(t: float, method: str):
+    return bend_grid(rs_vals_hm, angle_vals, t, method)
+
+
+@figure_cache
+@durable
+@instrumented
+def build_fig_hm_ba(r_s: float, t: float, method: str, bend_angle: int, BA: float, unit_lbl: str):
+    BA_grid, _, _ = heatmap_grids(t, method)
+    fig_hm_ba = go.Figure()
+    fig_hm_ba.add_trace(go.Heatmap(
+        z=BA_grid,
+        x=rs_vals_hm,
+        y=angle_vals,
+        colorscale=[
+            [0.0,  "#f0faf0"],
+            [0.25, "#86efac"],
+            [0.55, "#16a34a"],
+            [0.80, "#166534"],
+            [1.0,  "#052e16"],
+        ],
+        colorbar=dict(title=dict(text=f"BA ({unit_lbl})", font=dict(size=11)),
+                      tickfont=dict(size=10), len=0.85),
+        hovertemplate="r/t=%{x:.2f}<br>Angle=%{y:.0f}°<br>BA=%{z:.3f}<extra></extra>",
+    ))
+    # Crosshair lines
+    fig_hm_ba.add_hline(y=bend_angle, line=dict(color="white", width=1.5, dash="dot"))
+    fig_hm_ba.add_vline(x=r_s,        line=dict(color="white", width=1.5, dash="dot"))
+    fig_hm_ba.add_trace(go.Scatter(
+        x=[r_s], y=[bend_angle],
+        mode="markers",
+        marker=dict(color="white", size=11, symbol="star",
+                    line=dict(color=C_AMBER, width=2)),
+        name="Your calc",
+        hovertemplate=f"r/t={r_s:.3f}<br>Angle={bend_angle}°<br>BA={BA:.3f}<extra>Your calc</extra>",
+    ))
+    fig_hm_ba.update_layout(
+        title=dict(text=f"Bend Allowance Heatmap  (t = {t} {unit_lbl}, method: {method})",
+                   font=dict(size=13), x=0),
+        xaxis_title="r/t ratio",
+        yaxis_title="Bend angle (°)",
+        height=370, **PLOT_LAYOUT,
+    )
+    fig_hm_ba.update_xaxes(**GRID_STYLE)
+    fig_hm_ba.update_yaxes(**GRID_STYLE)
+    return fig_hm_ba
+
+
+@figure_cache
+@durable
+@instrumented
+def build_fig_hm_bd(r_s: float, t: float, method: str, bend_angle: int, BD: float, unit_lbl: str):
+    _, BD_grid, _ = heatmap_grids(t, method)
+    fig_hm_bd = go.Figure()
+    fig_hm_bd.add_trace(go.Heatmap(
+        z=BD_grid,
+        x=rs_vals_hm,
+        y=angle_vals,
+        colorscale=[
+            [0.0,  "#f0faf0"],
+            [0.35, "#fde68a"],
+            [0.65, "#d97706"],
+            [0.85, "#92400e"],
+            [1.0,  "#451a03"],
+        ],
+        colorbar=dict(title=dict(text=f"BD ({unit_lbl})", font=dict(size=11)),
+                      tickfont=dict(size=10), len=0.85),
+        hovertemplate="r/t=%{x:.2f}<br>Angle=%{y:.0f}°<br>BD=%{z:.3f}<extra></extra>",
+    ))
+    fig_hm_bd.add_hline(y=bend_angle, line=dict(color="white", width=1.5, dash="dot"))
+    fig_hm_bd.add_vline(x=r_s,        line=dict(color="white", width=1.5, dash="dot"))
+    fig_hm_bd.add_trace(go.Scatter(
+        x=[r_s], y=[bend_angle],
+        mode="markers",
+        marker=dict(color="white", size=11, symbol="star",
+                    line=dict(color=C_GREEN, width=2)),
+        name="Your calc",
+        hovertemplate=f"r/t={r_s:.3f}<br>Angle={bend_angle}°<br>BD={BD:.3f}<extra>Your calc</extra>",
+    ))
+    fig_hm_bd.update_layout(
+        title=dict(text=f"Bend Deduction Heatmap  (t = {t} {unit_lbl}, method: {method})",
+                   font=dict(size=13), x=0),
+        xaxis_title="r/t ratio",
+        yaxis_title="Bend angle (°)",
+        height=370, **PLOT_LAYOUT,
+    )
+    fig_hm_bd.update_xaxes(**GRID_STYLE)
+    fig_hm_bd.update_yaxes(**GRID_STYLE)
+    return fig_hm_bd
+
+
+@figure_cache
+@instrumented
+def build_fig_sb(r: float, t: float, mat_choice: str, bend_angle: int,
+                 store: MaterialStore = MATERIAL_STORE, full_resolution: bool = False):
+    mat    = store[mat_choice]
+    E_mpa  = mat["E_mpa"]
+    sb_arr = springback_angle(angles_deg, r, t, mat["yield_mpa"], E_mpa)
+    overbend_arr = overbend_angle(angles_deg, r, t, mat["yield_mpa"], E_mpa)
+    x, sb_arr, overbend_arr = _lod(angles_deg, sb_arr, overbend_arr, full_resolution=full_resolution)
+
+    fig_sb = go.Figure()
+    fig_sb.add_trace(go.Scatter(
+        x=x, y=sb_arr,
+        name="Springback Δθ",
+        line=dict(color=C_AMBER, width=2.5),
+        fill="tozeroy", fillcolor="rgba(217,119,6,0.08)",
+        hovertemplate="α=%{x:.0f}°<br>Δθ=%{y:.2f}°<extra></extra>",
+    ))
+    fig_sb.add_trace(go.Scatter(
+        x=x, y=overbend_arr,
+        name="Required overbend",
+        line=dict(color=C_RED, width=1.8, dash="dash"),
+        hovertemplate="α=%{x:.0f}°<br>Overbend=%{y:.1f}°<extra></extra>",
+    ))
+    # User point
+    sb_user = springback_angle(bend_angle, r, t, mat["yield_mpa"], E_mpa)
+    fig_sb.add_vline(x=bend_angle, line=dict(color=C_AMBER, dash="dot", width=1.5))
+    fig_sb.add_trace(go.Scatter(
+        x=[bend_angle], y=[sb_user],
+        mode="markers",
+        marker=dict(color=C_AMBER, size=11, symbol="circle",
+                    line=dict(color="white", width=2)),
+        showlegend=False,
+        hovertemplate=f"α={bend_angle}°<br>Δθ={sb_user:.2f}°<extra>Your calc</extra>",
+    ))
+    fig_sb.add_annotation(
+        x=bend_angle, y=sb_user,
+        text=f" +{sb_user:.1f}°",
+        font=dict(size=11, color=C_AMBER, family="IBM Plex Mono"),
+        showarrow=False, xanchor="left",
+    )
+    fig_sb.update_layout(
+        title=dict(text=f"Springback vs Bend Angle  —  {mat_choice}", font=dict(size=13), x=0),
+        xaxis_title="Nominal bend angle (°)",
+        yaxis_title="Springback Δθ (°)",
+        height=360, **PLOT_LAYOUT,
+    )
+    fig_sb.update_xaxes(**GRID_STYLE)
+    fig_sb.update_yaxes(**GRID_STYLE)
+    return fig_sb
+
+
+@figure_cache
+@instrumented
+def build_fig_mat(K: float, mat_choice: str, store: MaterialStore = MATERIAL_STORE):
+    ids        = store.filter()
+    mat_names  = store.gather("name", ids)
+    k_vals     = store.gather("typical_k", ids)
+    uts_vals   = store.gather("uts_mpa", ids)
+
+    bar_colors = np.where(ids == store.id(mat_choice), C_GREEN, "#b6d4b6")
+    short_names = np.char.replace(np.char.replace(mat_names, "Steel – ", ""), "Aluminum ", "Al ")
+
+    fig_mat = go.Figure()
+    fig_mat.add_trace(go.Bar(
+        y=short_names,
+        x=k_vals,
+        orientation="h",
+        marker=dict(color=bar_colors, line=dict(color="#d4ead4", width=0.5)),
+        text=np.char.mod("%.2f", k_vals),
+        textposition="outside",
+        textfont=dict(size=10, family="IBM Plex Mono", color="#4a6e4a"),
+        hovertemplate="%{y}<br>K = %{x:.3f}<extra></extra>",
+        name="Reference K",
+    ))
+    # UTS as a secondary scatter
+    fig_mat.add_trace(go.Scatter(
+        y=short_names,
+        x=uts_vals / uts_vals.max() * (k_vals.max() - k_vals.min()) * 0.8 + k_vals.min(),
+        mode="markers",
+        marker=dict(color=C_PURPLE, size=7, symbol="diamond",
+                    line=dict(color="white", width=1)),
+        name="UTS (scaled)",
+        hovertemplate="%{y}<br>UTS=%{customdata} MPa<extra></extra>",
+        customdata=uts_vals,
+    ))
+    fig_mat.add_vline(x=K, line=dict(color=C_GREEN, dash="dot", width=1.5))
+    fig_mat.add_annotation(
+        x=K, y=-0.8,
+        text=f"  Your K={K:.4f}",
+        font=dict(size=10, color=C_GREEN, family="IBM Plex Mono"),
+        showarrow=False, xanchor="left",
+    )
+    fig_mat.update_layout(
+        title=dict(text="Reference K  ·  Material Comparison  (◆ = UTS scaled)",
+                   font=dict(size=13), x=0),
+        xaxis=dict(title="K-Factor", range=[0.28, 0.54], **GRID_STYLE),
+        yaxis=dict(**GRID_STYLE),
+        height=360, **PLOT_LAYOUT,
+        bargap=0.28,
+    )
+    return fig_mat
+
+
+SWEEP_AXIS_TITLES = {"method": "Method", "material": "Material", "t": "Thickness t",
+                     "r": "Inner radius r", "angle": "Bend angle (°)"}
+
+@instrumented
+def build_fig_sweep(z, x, y, x_dim: str, y_dim: str, output: str, title: str, unit_lbl: str):
+    """Heatmap of one 2-D slice of a sweep cube; ``z`` has shape (len(y), len(x)).
+
+    Strided to :data:`LOD_MAX_CELLS`; the slice's CSV download is the full data.
+    """
+    z, x, y = decimate_grid(z, x, y, LOD_MAX_CELLS)
+    unit = "°" if output == "springback" else "" if output == "K" else f" {unit_lbl}"
+    def axis_title(d):
+        return SWEEP_AXIS_TITLES[d] + (f" ({unit_lbl})" if d in ("r", "t") else "")
+
+    fig = go.Figure(go.Heatmap(
+        z=z, x=x, y=y,
+        colorscale=[[0.0, "#f0faf0"], [0.25, "#86efac"], [0.55, "#16a34a"],
+                    [0.80, "#166534"], [1.0, "#052e16"]],
+        colorbar=dict(title=dict(text=output, font=dict(size=11)), tickfont=dict(size=10), len=0.85),
+        hovertemplate=f"{x_dim}=%{{x}}<br>{y_dim}=%{{y}}<br>{output}=%{{z:.4f}}{unit}<extra></extra>",
+    ))
+    fig.update_layout(
+        title=dict(text=title, font=dict(size=13), x=0),
+        xaxis_title=axis_title(x_dim), yaxis_title=axis_title(y_dim),
+        height=420, **PLOT_LAYOUT,
+    )
+    fig.update_xaxes(**GRID_STYLE)
+    fig.update_yaxes(**GRID_STYLE)
+    return fig
+
+
+# ─── Shared Data ─────────────────────────────────────────────────────────
+# Non-figure results the page reuses. They live here rather than in main.py:
+# Streamlit re-executes the page script in a fresh namespace on every full
+# rerun, so a cache defined there would start empty each time.
+@memoize(maxsize=4)
+def reference_table(registry_version: int) -> tuple[pd.DataFrame, list[str]]:
+    """The K reference table and its K column names; input independent."""
+    k_cols = {f"{m.label} K": REFERENCE.table[m.name] if is_static(m.name)
+              else np.round(m.vec(REFERENCE.rs_table), 4) for m in METHOD_REGISTRY}
+    df_ref = pd.DataFrame({
+        "r/t":  REFERENCE.rs_table,
+        **k_cols,
+        "Zone": ["Sharp" if x < 1 else "Standard" if x < 5 else "Gentle" for x in REFERENCE.rs_table],
+    })
+    return df_ref, list(k_cols)
+
+@memoize(maxsize=4)
+def sweep_cube(r_lo: float, r_hi: float, r_n: int, t_vals: tuple, a_lo: float, a_hi: float,
+               a_n: int, materials: tuple, methods: tuple, registry_version: int,
+               store: MaterialStore) -> ResultCube:
+    """In-memory sweep for the page; ``registry_version`` and ``store`` (the
+    current default store) key out replaced methods and reloaded catalogs."""
+    return sweep(np.linspace(r_lo, r_hi, r_n), t_vals, np.linspace(a_lo, a_hi, a_n),
+                 materials or None, methods)
+
+
+# ─── Export ──────────────────────────────────────────────────────────────
+def charts_html(figs) -> str:
+    """Standalone HTML page holding ``figs``; plotly.js is loaded from its CDN."""
+    parts = [fig.to_html(full_html=False, include_plotlyjs="cdn" if i == 0 else False)
+             for i, fig in enumerate(figs)]
+    return "<!DOCTYPE html>\n<html><head><meta charset=\"utf-8\"></head><body>\n" \
+        + "\n".join(parts) + "\n</body></html>\n"
@@ -0,0 +1,40 @@
+"""Sheet-metal bending engine behind the K-Factor Calculator.
+
+Importable without Streamlit or Plotly; only NumPy is required.
+"""
+from .engine import (
+    LOGISTIC_COEFFS,
+    METHODS,
+    bend_allowance,
+    bend_deduction,
+    bend_grid,
+    flat_length,
+    k_analytical,
+    k_analytical_vec,
+    k_din6935,
+    k_din6935_vec,
+    k_for_method,
+    k_for_method_vec,
+    k_logistic,
+    k_logistic_vec,
+    logistic_vec,
+    min_bend_radius,
+    outside_setback,
+    springback_angle,
+)
+from .materials import (
+    MATERIAL_FIELDS, MATERIAL_STORE, MATERIALS, MaterialStore, default_store, set_default_store,
+)
+from .methods import METHOD_REGISTRY, KMethod, get_method, method_names, register_method
+from .batch import BATCH_INPUTS, BATCH_OUTPUTS, compute_batch, k_by_method, material_props
+from .parallel import compute_batch_parallel
+from .flat import flat_pattern, flat_patterns
+from .springback import compensate_bends, overbend_angle
+from .calibrate import fit_k, solve_k
+from .curves import CurveRegistry, fit_curves, fit_logistic
+from .catalog import CatalogWatcher, load_catalog, read_catalog
+from .lut import KTable, build_table, load_or_build
+from .memo import LRUCache, memoize
+from .precision import LENGTH_STEPS, describe_precision, length_format, snap, snap_length
+
+__version__ = "0.1.0"
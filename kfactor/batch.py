@@ -0,0 +1,128 @@
+import numpy as np
+
+from .engine import bend_allowance, outside_setback, springback_angle
+from .materials import default_store
+from .methods import METHOD_REGISTRY
+
+BATCH_INPUTS  = ("r", "t", "angle", "material", "method")
+BATCH_OUTPUTS = ("K", "BA", "BD", "OSSB", "springback")
+
+def _column(table, name: str, default=None) -> np.ndarray:
+    try:
+        col = table[name]
+    except KeyError:
+        if default is None:
+            raise KeyError(f"Batch table is missing required column {name!r}") from None
+        return default
+    return np.asarray(col)
+
+def _group_codes(values) -> tuple[np.ndarray, np.ndarray]:
+    """Sorted distinct labels (as str) and each row's index into them."""
+    values = np.asarray(values).ravel()
+    if values.dtype == object:
+        # np.unique would sort every row with Python comparisons; number the
+        # distinct values through a dict instead and sort only those.
+        seen = {}
+        codes = np.fromiter((seen.setdefault(v, len(seen)) for v in values.tolist()),
+                            dtype=np.intp, count=len(values))
+        uniq = np.array([str(v) for v in seen], dtype=str)
+    else:
+        uniq, codes = np.unique(values, return_inverse=True)
+        uniq = uniq.astype(str)
+    labels, remap = np.unique(uniq, return_inverse=True)
+    return labels, remap[codes]
+
+def material_props(names) -> tuple[np.ndarray, np.ndarray]:
+    """Gather (yield_mpa, E_mpa) per row; unknown or blank materials give NaN.
+
+    ``names`` may be material names or integer IDs from :func:`default_store`.
+    """
+    codes, yield_u, E_u = encode_materials(names)
+    return yield_u[codes], E_u[codes]
+
+# ─── Encoding ────────────────────────────────────────────────────────────
+# String columns are reduced to integer codes plus small lookup tables so
+# the per-row work is pure array arithmetic (and cheap to share between
+# processes, see kfactor.parallel).
+
+def encode_methods(methods) -> tuple[np.ndarray, tuple[str, ...]]:
+    if np.ndim(methods) == 0:
+        uniq, codes = np.array([str(methods)]), None
+    else:
+        uniq, codes = _group_codes(methods)
+    names = tuple(str(m) for m in uniq)
+    unknown = [m for m in names if m not in METHOD_REGISTRY]
+    if unknown:
+        raise ValueError(f"Unknown K method(s): {unknown}")
+    return codes, names
+
+def encode_materials(names, store=None) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Returns (codes, yield_u, E_u): material IDs per row plus the store's property columns.
+
+    ``names`` may be material names or integer material IDs. Unknown names
+    (and ID -1) index the columns' trailing NaN sentinel.
+    """
+    store = default_store() if store is None else store
+    names = np.asarray(names)
+    codes = names.astype(np.intp, copy=False) if names.dtype.kind in "iu" else store.ids(names)
+    return codes, store.table("yield_mpa"), store.table("E_mpa")
+
+def k_by_method(r_s: np.ndarray, methods) -> np.ndarray:
+    """K per row, dispatching once per distinct method rather than once per row."""
+    codes, names = encode_methods(methods)
+    return _k_by_codes(r_s, codes, names)
+
+def _k_by_codes(r_s: np.ndarray, codes, names, k_tables: dict | None = None) -> np.ndarray:
+    # Each distinct method is resolved once per call, then applied to its rows.
+    k_tables = k_tables or {}
+    kernels = [k_tables.get(m) or METHOD_REGISTRY.get(m).vec for m in names]
+    if codes is None or len(names) == 1:
+        return kernels[0](r_s)
+    k = np.empty(r_s.shape, dtype=float)
+    for i, k_fn in enumerate(kernels):
+        sel = codes == i
+        k[sel] = k_fn(r_s[sel])
+    return k
+
+def evaluate_rows(r, t, angle, method_codes, method_names, mat_codes, yield_u, E_u,
+                  out: np.ndarray | None = None, k_tables: dict | None = None) -> np.ndarray:
+    """Evaluate encoded rows into ``out`` of shape (len(BATCH_OUTPUTS), n)."""
+    if out is None:
+        out = np.empty((len(BATCH_OUTPUTS), len(r)), dtype=float)
+    K, BA, BD, OSSB, SB = out
+    K[:]    = _k_by_codes(r / t, method_codes, method_names, k_tables)
+    BA[:]   = bend_allowance(K, angle, r, t)
+    OSSB[:] = outside_setback(angle, r, t)
+    BD[:]   = 2 * OSSB - BA
+    if mat_codes is None:
+        SB[:] = np.nan
+    else:
+        SB[:] = springback_angle(angle, r, t, yield_u[mat_codes], E_u[mat_codes])
+    return out
+
+def compute_batch(table, method: str = "Logistic fit", k_tables: dict | None = None) -> dict:
+    """Evaluate a columnar table of bends.
+
+    ``table`` is any mapping of column name to 1-D array (dict, DataFrame,
+    Arrow table converted with ``to_pydict``) holding ``r``, ``t``, ``angle``
+    and optionally ``material`` (names, or integer IDs from
+    :func:`kfactor.materials.default_store`) and ``method``. ``method`` is the default
+    used when the table has no method column. Returns a dict of float arrays
+    keyed by ``BATCH_OUTPUTS``; springback is NaN for rows without a known
+    material. ``k_tables`` optionally maps method names to
+    :class:`kfactor.lut.KTable` objects used instead of the exact formula.
+    """
+    r     = _column(table, "r").astype(float, copy=False)
+    t     = _column(table, "t").astype(float, copy=False)
+    angle = _column(table, "angle").astype(float, copy=False)
+
+    method_codes, method_names = encode_methods(_column(table, "method", method))
+    materials = _column(table, "material", np.array([]))
+    if materials.size:
+        mat_codes, yield_u, E_u = encode_materials(materials)
+    else:
+        mat_codes = yield_u = E_u = None
+
+    out = evaluate_rows(r, t, angle, method_codes, method_names, mat_codes, yield_u, E_u,
+                        k_tables=k_tables)
+    return dict(zip(BATCH_OUTPUTS, out))
@@ -0,0 +1,138 @@
+"""Inverse solve: effective K from measured test coupons.
+
+A coupon with flanges ``a`` and ``b`` bent through ``angle`` at inside
+radius ``r`` in sheet ``t`` has developed length ``flat``. Bend allowance is
+linear in K, ``BA(K) = BA(0) + K·(BA(1) − BA(0))``, so each sample gives K
+in closed form, and a per-group K fitted by least squares on the flat
+length has a closed form too:
+
+    K̂ = Σ wᵢ yᵢ / Σ wᵢ²,   wᵢ = BA₁ᵢ − BA₀ᵢ,   yᵢ = measured BAᵢ − BA₀ᵢ
+
+(a regression through the origin, so coupons whose length is more
+sensitive to K — large angle, thick sheet — weigh more). The standard error
+comes from the flat-length residuals and the confidence interval uses a
+Student-t quantile with n − 1 degrees of freedom.
+"""
+import math
+from statistics import NormalDist
+
+import numpy as np
+
+from .batch import _column, _group_codes
+from .engine import bend_allowance, flat_length, outside_setback
+from .flat import FLANGE_DIMS
+
+CALIBRATION_INPUTS = ("flange_a", "flange_b", "flat", "r", "t", "angle")
+
+def _measured_ba(flange_a, flange_b, flat, r, t, angle, dims: str) -> np.ndarray:
+    if dims not in FLANGE_DIMS:
+        raise ValueError(f"dims must be one of {FLANGE_DIMS}, got {dims!r}")
+    ba = flat - flat_length(flange_a, flange_b, 0.0)
+    if dims == "outside":
+        # Outside dimensions: flat = a + b − BD and BD = 2·OSSB − BA.
+        ba = ba + 2 * outside_setback(angle, r, t)
+    return ba
+
+def _linear_terms(flange_a, flange_b, flat, r, t, angle, dims: str):
+    """(w, y) with measured BA − BA(0) = K·w for every sample."""
+    arrays = np.broadcast_arrays(*(np.asarray(x, dtype=float)
+                                   for x in (flange_a, flange_b, flat, r, t, angle)))
+    flange_a, flange_b, flat, r, t, angle = arrays
+    ba0 = bend_allowance(0.0, angle, r, t)
+    w = bend_allowance(1.0, angle, r, t) - ba0
+    y = _measured_ba(flange_a, flange_b, flat, r, t, angle, dims) - ba0
+    return w, y
+
+def solve_k(flange_a, flange_b, flat, r, t, angle, dims: str = "flat") -> np.ndarray:
+    """Effective K per sample; NaN where the bend angle or thickness is zero."""
+    w, y = _linear_terms(flange_a, flange_b, flat, r, t, angle, dims)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(w != 0, y / w, np.nan)
+
+def _t_cdf(x: float, df: int) -> float:
+    """Student-t CDF for integer ``df`` (Abramowitz & Stegun 26.7.3–4)."""
+    theta = math.atan(x / math.sqrt(df))
+    c2, s = math.cos(theta) ** 2, math.sin(theta)
+    if df % 2:
+        term, acc = math.cos(theta), 0.0
+        for k in range(1, (df - 1) // 2 + 1):
+            acc += term
+            term *= c2 * 2 * k / (2 * k + 1)
+        a = 2 / math.pi * (theta + s * acc if df > 1 else theta)
+    else:
+        term, acc = 1.0, 0.0
+        for k in range(1, df // 2 + 1):
+            acc += term
+            term *= c2 * (2 * k - 1) / (2 * k)
+        a = s * acc
+    return (1 + a) / 2
+
+def _t_quantile(p: float, df: int) -> float:
+    z = NormalDist().inv_cdf(p)
+    if df == 1:
+        return math.tan(math.pi * (p - 0.5))
+    if df == 2:
+        return (2 * p - 1) / math.sqrt(2 * p * (1 - p))
+    # Cornish–Fisher start, then Newton steps on the exact CDF where the
+    # expansion is not yet accurate to double precision.
+    q = (z + (z**3 + z) / (4 * df) + (5 * z**5 + 16 * z**3 + 3 * z) / (96 * df**2)
+         + (3 * z**7 + 19 * z**5 + 17 * z**3 - 15 * z) / (384 * df**3)
+         + (79 * z**9 + 776 * z**7 + 1482 * z**5 - 1920 * z**3 - 945 * z) / (92160 * df**4))
+    if df > 200:
+        return q
+    log_norm = math.lgamma((df + 1) / 2) - math.lgamma(df / 2) - 0.5 * math.log(df * math.pi)
+    for _ in range(8):
+        pdf = math.exp(log_norm - (df + 1) / 2 * math.log1p(q * q / df))
+        step = (_t_cdf(q, df) - p) / pdf
+        q -= step
+        if abs(step) < 1e-12 * max(1.0, abs(q)):
+            break
+    return q
+
+def t_quantile(p: float, df) -> np.ndarray:
+    """Student-t quantile for integer degrees of freedom (NaN where df < 1)."""
+    df = np.asarray(df)
+    out = np.full(df.shape, np.nan)
+    for d in np.unique(df[df >= 1]):
+        out[df == d] = _t_quantile(p, int(d))
+    return out
+
+def fit_k(samples, by: str | None = "material", confidence: float = 0.95,
+          dims: str = "flat") -> dict:
+    """Least-squares K per group of coupon measurements.
+
+    ``samples`` is a columnar mapping (dict, DataFrame) with
+    ``CALIBRATION_INPUTS`` and, when ``by`` is given, a grouping column
+    (default ``material``). Returns a dict of per-group arrays: the group
+    label, ``n``, fitted ``K``, its standard error ``se``, the
+    ``confidence`` interval ``ci_low``/``ci_high``, ``k_std`` (spread of the
+    per-sample K) and ``rms`` (flat-length residual). Groups of one sample
+    get NaN uncertainty.
+    """
+    w, y = _linear_terms(*(_column(samples, c).astype(float, copy=False)
+                           for c in CALIBRATION_INPUTS), dims)
+    if by is None:
+        labels, codes = np.array(["all"]), np.zeros(len(w), dtype=np.intp)
+    else:
+        labels, codes = _group_codes(_column(samples, by))
+    m = len(labels)
+
+    n   = np.bincount(codes, minlength=m)
+    sww = np.bincount(codes, w * w, m)
+    swy = np.bincount(codes, w * y, m)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        K = swy / sww
+        resid = y - K[codes] * w
+        sse = np.bincount(codes, resid * resid, m)
+        dof = n - 1
+        se  = np.where(dof > 0, np.sqrt(sse / np.maximum(dof, 1) / sww), np.nan)
+        half = t_quantile(0.5 + confidence / 2, dof) * se
+        rms = np.sqrt(sse / n)
+
+        k_i = y / w
+        k_mean = np.bincount(codes, k_i, m) / n
+        k_var = np.bincount(codes, (k_i - k_mean[codes]) ** 2, m) / np.maximum(dof, 1)
+        k_std = np.where(dof > 0, np.sqrt(k_var), np.nan)
+
+    return {by or "group": labels, "n": n, "K": K, "se": se,
+            "ci_low": K - half, "ci_high": K + half, "k_std": k_std, "rms": rms}
@@ -0,0 +1,242 @@
+"""Material catalogs loaded from CSV, JSON or Parquet files.
+
+A catalog file has one row per material with a ``name`` (or ``material``)
+column, an optional ``family`` column and any of
+:data:`kfactor.materials.MATERIAL_FIELDS`. JSON may be either a list of
+such records or a ``{name: {field: value}}`` mapping like
+:data:`kfactor.materials.MATERIALS`.
+
+The first load compiles the file into a directory of ``.npy`` columns under
+``~/.cache/kfactor/materials`` (``$KFACTOR_MATERIALS_CACHE``). Every later
+load, in any process, memory-maps those columns read-only, so worker
+processes share one copy through the page cache and only build the name
+index on startup. The compiled copy is rebuilt when the source file's size
+or mtime changes::
+
+    store = load_catalog("alloys.csv")
+    kfactor.set_default_store(store)          # or: export KFACTOR_MATERIALS=alloys.csv
+
+:class:`CatalogWatcher` reloads a catalog when its file changes. Reloads
+keep material IDs stable: existing names keep their IDs, new names are
+appended, and removed names become empty rows that gather NaN.
+"""
+import csv
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+
+from .materials import MATERIAL_FIELDS, TEXT_FIELDS, MaterialStore
+
+CACHE_ENV = "KFACTOR_MATERIALS_CACHE"
+DEFAULT_CACHE = Path.home() / ".cache" / "kfactor" / "materials"
+CATALOG_SUFFIXES = {".csv", ".json", ".parquet", ".pq"}
+KEEP_VERSIONS = 2
+NAME_COLUMNS = ("name", "material")
+
+
+# ─── Reading ─────────────────────────────────────────────────────────────
+def _float(value) -> float:
+    if value is None or (isinstance(value, str) and not value.strip()):
+        return np.nan
+    return float(value)
+
+def _records_to_store(records: list[dict]) -> MaterialStore:
+    if not records:
+        raise ValueError("material catalog is empty")
+    key = next((k for k in NAME_COLUMNS if k in records[0]), None)
+    if key is None:
+        raise ValueError(f"material catalog needs a {' or '.join(NAME_COLUMNS)!r} column")
+    columns = {"name": [str(r[key]).strip() for r in records]}
+    if "family" in records[0]:
+        columns["family"] = [str(r.get("family") or "").strip() for r in records]
+    for f in MATERIAL_FIELDS:
+        if f in records[0]:
+            columns[f] = [_float(r.get(f)) for r in records]
+    return MaterialStore(columns)
+
+def _read_parquet(path: Path) -> list[dict]:
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as exc:
+        raise ImportError("Parquet catalogs need pyarrow: pip install pyarrow") from exc
+    return pq.read_table(path).to_pylist()
+
+def read_catalog(path) -> MaterialStore:
+    """Parse a CSV, JSON or Parquet catalog into an in-memory store."""
+    path = Path(path)
+    suffix = path.suffix.lower()
+    if suffix == ".csv":
+        with open(path, newline="", encoding="utf-8-sig") as f:
+            records = list(csv.DictReader(f))
+    elif suffix == ".json":
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if isinstance(data, dict):
+            records = [{"name": name, **props} for name, props in data.items()]
+        else:
+            records = data
+    elif suffix in (".parquet", ".pq"):
+        records = _read_parquet(path)
+    else:
+        raise ValueError(f"unsupported catalog format {suffix!r}; expected one of "
+                         f"{sorted(CATALOG_SUFFIXES)}")
+    return _records_to_store(records)
+
+
+# ─── Compiled (memory-mapped) form ───────────────────────────────────────
+# <cache>/<stem>-<hash>/meta.json points at the current v<N>/ directory of
+# padded .npy columns. A reload writes v<N+1>/ and then swaps meta.json, so
+# processes still mapping v<N> keep a consistent view.
+def _cache_dir(src: Path, cache_root=None) -> Path:
+    root = Path(cache_root or os.environ.get(CACHE_ENV) or DEFAULT_CACHE)
+    digest = hashlib.sha1(str(src.resolve()).encode()).hexdigest()[:12]
+    return root / f"{src.stem}-{digest}"
+
+def _source_stamp(src: Path) -> dict:
+    st = src.stat()
+    return {"source": str(src.resolve()), "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+def _read_meta(cache: Path) -> dict | None:
+    try:
+        return json.loads((cache / "meta.json").read_text())
+    except (OSError, ValueError):
+        return None
+
+def _write_json(path: Path, payload: dict) -> None:
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    with os.fdopen(fd, "w") as out:
+        json.dump(payload, out)
+    os.replace(tmp, path)
+
+def save_store(store: MaterialStore, cache: Path, stamp: dict) -> Path:
+    """Write ``store`` as the next version under ``cache``; returns the version directory."""
+    cache.mkdir(parents=True, exist_ok=True)
+    meta = _read_meta(cache) or {}
+    version = meta.get("version", 0) + 1
+    target = cache / f"v{version}"
+    tmp = Path(tempfile.mkdtemp(dir=cache, prefix=".build-"))
+    try:
+        for f in (*TEXT_FIELDS, *MATERIAL_FIELDS):
+            np.save(tmp / f"{f}.npy", np.ascontiguousarray(store.table(f)))
+        os.replace(tmp, target)
+    except OSError:
+        shutil.rmtree(tmp, ignore_errors=True)
+        if target.is_dir():
+            return target       # another process compiled the same version first
+        raise
+    _write_json(cache / "meta.json", {**stamp, "version": version, "rows": len(store)})
+    for old in cache.glob("v*"):
+        if old.name[1:].isdigit() and int(old.name[1:]) <= version - KEEP_VERSIONS:
+            shutil.rmtree(old, ignore_errors=True)
+    return target
+
+def open_store(directory, mmap: bool = True) -> MaterialStore:
+    """Open a compiled version directory; columns are read-only memory maps."""
+    directory = Path(directory)
+    mode = "r" if mmap else None
+    padded = {f: np.load(directory / f"{f}.npy", mmap_mode=mode)
+              for f in (*TEXT_FIELDS, *MATERIAL_FIELDS)}
+    return MaterialStore._from_padded(padded)
+
+def compile_catalog(src, cache_root=None, previous: MaterialStore | None = None,
+                    force: bool = False) -> Path:
+    """Compile ``src`` unless its compiled copy is current; returns the version directory.
+
+    With ``previous``, material IDs from that store are kept (see
+    :meth:`MaterialStore.merged`).
+    """
+    src = Path(src)
+    cache = _cache_dir(src, cache_root)
+    stamp = _source_stamp(src)
+    meta = _read_meta(cache)
+    if not force and meta and all(meta.get(k) == v for k, v in stamp.items()):
+        target = cache / f"v{meta['version']}"
+        if target.is_dir():
+            return target
+    store = read_catalog(src)
+    if previous is not None:
+        store = previous.merged(store)
+    elif meta and (cache / f"v{meta['version']}").is_dir():
+        store = open_store(cache / f"v{meta['version']}", mmap=False).merged(store)
+    return save_store(store, cache, stamp)
+
+def load_catalog(path, cache_root=None, mmap: bool = True) -> MaterialStore:
+    """Material store for a catalog file (compiled on first use) or a compiled version directory."""
+    path = Path(path)
+    if path.is_dir():
+        return open_store(path, mmap)
+    return open_store(compile_catalog(path, cache_root), mmap)
+
+
+# ─── Watching ────────────────────────────────────────────────────────────
+class CatalogWatcher:
+    """Keeps a catalog's store current with its file.
+
+    :attr:`store` re-checks the file's size and mtime at most every
+    ``interval`` seconds and reloads on change. :meth:`start` polls from a
+    background thread instead. ``on_change(store)`` runs after each reload.
+    A file that fails to parse mid-edit keeps the previous store.
+    """
+
+    def __init__(self, path, interval: float = 2.0, cache_root=None,
+                 on_change: Callable[[MaterialStore], None] | None = None):
+        self.path = Path(path)
+        self.interval = interval
+        self.cache_root = cache_root
+        self.on_change = on_change
+        self.reloads = 0
+        self.error: Exception | None = None
+        self._lock = threading.Lock()
+        self._stamp = _source_stamp(self.path)
+        self._store = load_catalog(self.path, cache_root)
+        self._checked = time.monotonic()
+        self._stop: threading.Event | None = None
+
+    @property
+    def store(self) -> MaterialStore:
+        if time.monotonic() - self._checked >= self.interval:
+            self.poll()
+        return self._store
+
+    def poll(self) -> bool:
+        """Reload if the file changed; returns True when a new store was loaded."""
+        with self._lock:
+            self._checked = time.monotonic()
+            try:
+                stamp = _source_stamp(self.path)
+                if stamp == self._stamp:
+                    return False
+                target = compile_catalog(self.path, self.cache_root, previous=self._store)
+                self._store = open_store(target)
+            except (OSError, ValueError) as exc:
+                self.error = exc
+                return False
+            self._stamp, self.error = stamp, None
+            self.reloads += 1
+            store = self._store
+        if self.on_change is not None:
+            self.on_change(store)
+        return True
+
+    def start(self) -> "CatalogWatcher":
+        if self._stop is None:
+            self._stop = threading.Event()
+            threading.Thread(target=self._run, name="catalog-watcher", daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        if self._stop is not None:
+            self._stop.set()
+            self._stop = None
+
+    def _run(self) -> None:
+        stop = self._stop
+        while not stop.wait(self.interval):
+            self.poll()
@@ -0,0 +1,271 @@
+"""Persistent result cache shared by every process on a host.
+
+Entries live in one SQLite file in WAL mode, so any number of app
+replicas, worker processes and threads can read and write it at once.
+Keys are content hashes of ``(engine version, namespace, arguments)``;
+values are pickled. The engine version is :func:`engine_version` — the
+package version plus a digest of the kfactor sources — so an entry written
+by other code, even one a still-running old replica writes after a new one
+opened the file, is never served. Opening the file from a new source tree
+also clears the old entries to reclaim the space.
+Callers whose results depend on code outside the package pass their own
+``version`` (e.g. a :func:`source_digest` of that code) to
+:func:`disk_cached`.
+Once the total size passes ``max_bytes``, the least recently used entries
+are deleted down to 90 %.
+
+    @disk_cached("charts.heatmap_grids")
+    def heatmap_grids(t, method): ...
+
+Configuration (read on first use):
+
+- ``KFACTOR_DISK_CACHE``: the database path, or ``0``/``off`` to
+  disable. Default ``~/.cache/kfactor/results.sqlite``.
+- ``KFACTOR_DISK_CACHE_MB``: size limit (default 512).
+
+``python -m kfactor.diskcache [--clear]`` prints the cache's statistics.
+Only load cache files this user wrote: values are unpickled.
+"""
+import functools
+import hashlib
+import logging
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Callable
+
+from .memo import DEFAULT_DIGITS, quantize
+
+CACHE_ENV = "KFACTOR_DISK_CACHE"
+SIZE_ENV = "KFACTOR_DISK_CACHE_MB"
+DEFAULT_PATH = Path.home() / ".cache" / "kfactor" / "results.sqlite"
+DEFAULT_MAX_BYTES = 512 << 20
+LOW_WATER = 0.9
+TOUCH_INTERVAL = 60.0       # seconds between access-time updates of one entry
+
+log = logging.getLogger("kfactor.diskcache")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key       TEXT PRIMARY KEY,
+    namespace TEXT NOT NULL,
+    value     BLOB NOT NULL,
+    size      INTEGER NOT NULL,
+    created   REAL NOT NULL,
+    accessed  REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed);
+CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT NOT NULL);
+"""
+
+
+def source_digest(*paths) -> str:
+    """Short content hash of the given files."""
+    h = hashlib.blake2b(digest_size=8)
+    for path in sorted(Path(p) for p in paths):
+        h.update(path.name.encode())
+        h.update(path.read_bytes())
+    return h.hexdigest()
+
+@functools.cache
+def engine_version() -> str:
+    """``kfactor.__version__`` plus a digest of the package's sources."""
+    from . import __version__
+    return f"{__version__}+{source_digest(*Path(__file__).parent.glob('*.py'))}"
+
+
+class DiskCache:
+    """Size-bounded SQLite key/value cache; one connection per thread."""
+
+    def __init__(self, path=None, max_bytes: int = DEFAULT_MAX_BYTES, version: str | None = None):
+        self.path = Path(path or DEFAULT_PATH)
+        self.max_bytes = max_bytes
+        self.version = version or engine_version()
+        self.hits = self.misses = self.errors = 0
+        self._local = threading.local()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as db:
+            db.execute("BEGIN IMMEDIATE")
+            row = db.execute("SELECT value FROM meta WHERE name = 'version'").fetchone()
+            if row is None or row[0] != self.version:
+                db.execute("DELETE FROM entries")
+                db.execute("INSERT OR REPLACE INTO meta VALUES ('version', ?)", (self.version,))
+            db.execute("COMMIT")
+
+    def _connect(self) -> sqlite3.Connection:
+        db = getattr(self._local, "db", None)
+        if db is None:
+            db = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.executescript(_SCHEMA)
+            self._local.db = db
+        return db
+
+    def key(self, namespace: str, args: tuple, kwargs: dict | None = None) -> str:
+        payload = pickle.dumps((self.version, namespace, args, sorted((kwargs or {}).items())),
+                               protocol=5)
+        return hashlib.blake2b(payload, digest_size=20).hexdigest()
+
+    def get(self, key: str, default=None):
+        try:
+            db = self._connect()
+            row = db.execute("SELECT value, accessed FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return default
+            now = time.time()
+            if now - row[1] > TOUCH_INTERVAL:
+                db.execute("UPDATE entries SET accessed = ? WHERE key = ?", (now, key))
+            value = pickle.loads(row[0])
+        except (sqlite3.Error, pickle.UnpicklingError, EOFError, AttributeError, ImportError) as exc:
+            self._error("read", exc)
+            return default
+        self.hits += 1
+        return value
+
+    def put(self, key: str, value, namespace: str = "") -> None:
+        try:
+            blob = pickle.dumps(value, protocol=5)
+        except (pickle.PicklingError, TypeError, AttributeError) as exc:
+            self._error("pickle", exc)
+            return
+        if len(blob) > self.max_bytes * (1 - LOW_WATER):
+            return      # one entry may not flush most of the cache
+        now = time.time()
+        try:
+            db = self._connect()
+            db.execute("BEGIN IMMEDIATE")
+            db.execute("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?)",
+                       (key, namespace, blob, len(blob), now, now))
+            total = db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+            if total > self.max_bytes:
+                self._evict(db, total)
+            db.execute("COMMIT")
+        except sqlite3.Error as exc:
+            self._rollback()
+            self._error("write", exc)
+
+    def _evict(self, db: sqlite3.Connection, total: int) -> None:
+        target = self.max_bytes * LOW_WATER
+        doomed = []
+        for key, size in db.execute("SELECT key, size FROM entries ORDER BY accessed"):
+            if total <= target:
+                break
+            doomed.append((key,))
+            total -= size
+        db.executemany("DELETE FROM entries WHERE key = ?", doomed)
+
+    def _rollback(self) -> None:
+        try:
+            self._connect().execute("ROLLBACK")
+        except sqlite3.Error:
+            pass
+
+    def _error(self, what: str, exc: Exception) -> None:
+        # The cache is an optimisation: failures are logged and treated as misses.
+        self.errors += 1
+        if self.errors == 1 or self.errors % 1000 == 0:
+            log.warning("disk cache %s failed (%s): %s", what, self.path, exc)
+
+    def clear(self) -> None:
+        self._connect().execute("DELETE FROM entries")
+
+    def stats(self) -> dict:
+        n, size = self._connect().execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+        return {"path": str(self.path), "version": self.version, "entries": n, "bytes": size,
+                "max_bytes": self.max_bytes, "hits": self.hits, "misses": self.misses,
+                "errors": self.errors}
+
+
+_MISSING = object()
+_default: DiskCache | None = None
+_default_lock = threading.Lock()
+_disabled = False
+
+def default_disk_cache() -> DiskCache | None:
+    """The process-wide cache configured from the environment, or None if disabled."""
+    global _default, _disabled
+    if _default is not None or _disabled:
+        return _default
+    with _default_lock:
+        if _default is None and not _disabled:
+            path = os.environ.get(CACHE_ENV, "")
+            if path.lower() in ("0", "off", "false", "no"):
+                _disabled = True
+                return None
+            try:
+                mb = float(os.environ.get(SIZE_ENV) or DEFAULT_MAX_BYTES / (1 << 20))
+            except ValueError:
+                log.warning("ignoring %s=%r; using the default size",
+                            SIZE_ENV, os.environ.get(SIZE_ENV))
+                mb = DEFAULT_MAX_BYTES / (1 << 20)
+            try:
+                _default = DiskCache(path or None, max_bytes=int(mb * (1 << 20)))
+            except (OSError, sqlite3.Error) as exc:
+                log.warning("disk cache disabled: %s", exc)
+                _disabled = True
+    return _default
+
+def disk_cached(namespace: str | None = None, digits: int = DEFAULT_DIGITS,
+                cache: DiskCache | None = None,
+                when: Callable[..., bool] | None = None, version: str = "",
+                encode: Callable | None = None, decode: Callable | None = None) -> Callable:
+    """Cache a function's results in :func:`default_disk_cache` (or ``cache``).
+
+    Float arguments are rounded to ``digits`` decimals as in
+    :func:`kfactor.memo.memoize`. Arguments must be picklable; the key is
+    their pickled content, so two processes calling with equal arguments
+    share one entry. Calls for which ``when(*args, **kwargs)`` is false
+    bypass the cache, e.g. arguments whose meaning is local to a process.
+    ``version`` is part of every key; ``encode``/``decode`` convert results
+    to and from a plain picklable form (e.g. dicts of arrays instead of
+    library objects whose pickles depend on the library version).
+    """
+    def decorator(fn):
+        ns = namespace or f"{fn.__module__}.{fn.__qualname__}"
+        if version:
+            ns = f"{ns}@{version}"
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            store = cache or default_disk_cache()
+            if store is None or (when is not None and not when(*args, **kwargs)):
+                return fn(*args, **kwargs)
+            args = tuple(quantize(a, digits) for a in args)
+            kwargs = {k: quantize(v, digits) for k, v in kwargs.items()}
+            key = store.key(ns, args, kwargs)
+            value = store.get(key, _MISSING)
+            if value is not _MISSING:
+                return decode(value) if decode is not None else value
+            value = fn(*args, **kwargs)
+            store.put(key, encode(value) if encode is not None else value, ns)
+            return value
+
+        wrapper.disk_cache = True
+        return wrapper
+    return decorator
+
+
+def main(argv=None) -> int:
+    import argparse
+    import json
+    parser = argparse.ArgumentParser(prog="python -m kfactor.diskcache",
+                                     description="Show or clear the shared result cache.")
+    parser.add_argument("--clear", action="store_true", help="delete every entry")
+    args = parser.parse_args(argv)
+    cache = default_disk_cache()
+    if cache is None:
+        print(f"disk cache disabled (${CACHE_ENV})")
+        return 0
+    if args.clear:
+        cache.clear()
+    print(json.dumps(cache.stats(), indent=1))
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
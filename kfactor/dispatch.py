@@ -0,0 +1,178 @@
+"""Micro-batching dispatcher for many small concurrent callers.
+
+Callers submit one item at a time; a background thread gathers whatever
+arrives within ``window`` seconds of the first waiting item (or until
+``max_batch`` are waiting), evaluates them with a single vectorised call
+and resolves each caller's future. Works from plain threads
+(:meth:`MicroBatcher.submit` returns a :class:`concurrent.futures.Future`)
+and from asyncio (``await batcher.asubmit(item)``)::
+
+    with BendBatcher(window=0.0005) as bends:
+        res = bends.bend(2.0, 1.5, 90).result()          # from a thread
+        res = await bends.abend(2.0, 1.5, 90)            # from a coroutine
+"""
+import asyncio
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Sequence
+
+import numpy as np
+
+from .batch import BATCH_OUTPUTS, compute_batch
+
+DEFAULT_WINDOW = 0.0005
+DEFAULT_MAX_BATCH = 1024
+
+_STOP = object()
+
+
+class MicroBatcher:
+    """Coalesce single-item calls into batched ``evaluate(items)`` calls.
+
+    ``evaluate`` receives a list of submitted items and must return a
+    sequence of results in the same order. If it raises, every future in
+    that batch gets the exception.
+    """
+
+    def __init__(self, evaluate: Callable[[list], Sequence], window: float = DEFAULT_WINDOW,
+                 max_batch: int = DEFAULT_MAX_BATCH, name: str = "micro-batcher"):
+        if window < 0 or max_batch < 1:
+            raise ValueError("window must be >= 0 and max_batch >= 1")
+        self.evaluate = evaluate
+        self.window = window
+        self.max_batch = max_batch
+        self.name = name
+        self.batches = 0
+        self.items = 0
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def submit(self, item: Any) -> Future:
+        """Queue ``item``; the returned future resolves to its result."""
+        fut = Future()
+        # Checked and queued under the lock close() takes, so an accepted
+        # item is always ahead of the stop marker.
+        with self._lock:
+            if self._closed:
+                raise RuntimeError(f"{self.name} is closed")
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+                self._thread.start()
+            self._queue.put((item, fut))
+        return fut
+
+    def asubmit(self, item: Any) -> asyncio.Future:
+        """Awaitable form of :meth:`submit` for use inside an event loop."""
+        return asyncio.wrap_future(self.submit(item))
+
+    def __call__(self, item: Any, timeout: float | None = None) -> Any:
+        """Submit and block for the result."""
+        return self.submit(item).result(timeout)
+
+    def close(self) -> None:
+        """Evaluate anything still queued, then stop the worker thread."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        if self._thread is not None:
+            self._queue.put(_STOP)
+            self._thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _run(self) -> None:
+        get = self._queue.get
+        stopping = False
+        while not stopping:
+            first = get()
+            if first is _STOP:
+                break
+            batch = [first]
+            deadline = time.perf_counter() + self.window
+            while len(batch) < self.max_batch:
+                try:
+                    nxt = self._queue.get_nowait()
+                except queue.Empty:
+                    remaining = deadline - time.perf_counter()
+                    if remaining <= 0:
+                        break
+                    try:
+                        nxt = get(timeout=remaining)
+                    except queue.Empty:
+                        break
+                if nxt is _STOP:
+                    stopping = True
+                    break
+                batch.append(nxt)
+            self._dispatch(batch)
+        # Items that raced close() still get an answer.
+        rest = []
+        while True:
+            try:
+                rest.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        rest = [entry for entry in rest if entry is not _STOP]
+        for i in range(0, len(rest), self.max_batch):
+            self._dispatch(rest[i:i + self.max_batch])
+
+    def _dispatch(self, batch: list) -> None:
+        batch = [(item, fut) for item, fut in batch if fut.set_running_or_notify_cancel()]
+        if not batch:
+            return
+        self.batches += 1
+        self.items += len(batch)
+        items, futures = zip(*batch)
+        try:
+            results = list(self.evaluate(list(items)))
+        except Exception as exc:
+            for fut in futures:
+                fut.set_exception(exc)
+            return
+        for fut, res in zip(futures, results):
+            fut.set_result(res)
+        if len(results) != len(futures):
+            exc = RuntimeError(f"{self.name}: evaluate returned {len(results)} results "
+                               f"for {len(futures)} items")
+            for fut in futures[len(results):]:
+                fut.set_exception(exc)
+
+
+# ─── Single-bend batching ────────────────────────────────────────────────
+def evaluate_bends(rows: list[tuple]) -> list[dict]:
+    """Evaluate ``(r, t, angle, method, material)`` rows with one compute_batch call."""
+    r, t, angle, method, material = zip(*rows)
+    out = compute_batch({"r": np.array(r, dtype=float), "t": np.array(t, dtype=float),
+                         "angle": np.array(angle, dtype=float),
+                         "method": np.array(method), "material": np.array(material)})
+    columns = [out[name].tolist() for name in BATCH_OUTPUTS]
+    return [dict(zip(BATCH_OUTPUTS, values)) for values in zip(*columns)]
+
+
+class BendBatcher(MicroBatcher):
+    """:class:`MicroBatcher` for single bends; results are dicts keyed by ``BATCH_OUTPUTS``.
+
+    Springback is NaN for an unknown or blank material. An invalid row
+    (e.g. an unknown method) fails every call batched with it, so validate
+    inputs before submitting.
+    """
+
+    def __init__(self, window: float = DEFAULT_WINDOW, max_batch: int = DEFAULT_MAX_BATCH):
+        super().__init__(evaluate_bends, window, max_batch, name="bend-batcher")
+
+    def bend(self, r: float, t: float, angle: float, method: str = "Logistic fit",
+             material: str = "") -> Future:
+        return self.submit((r, t, angle, method, material or ""))
+
+    def abend(self, r: float, t: float, angle: float, method: str = "Logistic fit",
+              material: str = "") -> asyncio.Future:
+        return self.asubmit((r, t, angle, method, material or ""))
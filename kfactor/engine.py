@@ -0,0 +1,128 @@
+import numpy as np
+
+from .instrument import instrumented
+from .memo import memoize
+from .methods import METHOD_REGISTRY, KMethod
+
+METHODS = ("Logistic fit", "Analytical (Wang-Wenner)", "DIN 6935 empirical")
+
+LOGISTIC_COEFFS = (0.277833218, 1.056058295, 0.608320238, 0.502506534)
+
+# ─── K-Factor Methods ────────────────────────────────────────────────────
+# Array-native kernels: accept scalars or ndarrays of r/t, return ndarrays.
+
+def logistic_vec(r_s, coeffs) -> np.ndarray:
+    """Four-parameter logistic K(r/t) = d + (a − d) / (1 + (r/t ÷ c)^b)."""
+    r_s = np.asarray(r_s, dtype=float)
+    a, b, c, d = coeffs
+    return d + (a - d) / (1 + (r_s / c) ** b)
+
+@instrumented
+def k_logistic_vec(r_s) -> np.ndarray:
+    return logistic_vec(r_s, LOGISTIC_COEFFS)
+
+@instrumented
+def k_analytical_vec(r_s) -> np.ndarray:
+    r_s = np.asarray(r_s, dtype=float)
+    pos = r_s > 0
+    safe = np.where(pos, r_s, 1.0)
+    return np.where(pos, np.log(1 + 1 / (2 * safe + 1)) / np.log(1 + 1 / safe), 0.33)
+
+@instrumented
+def k_din6935_vec(r_s) -> np.ndarray:
+    r_s = np.asarray(r_s, dtype=float)
+    return np.select(
+        [r_s < 0.65, r_s < 1.0, r_s < 3.0],
+        [0.33,
+         0.33 + 0.125 * (r_s - 0.65) / 0.35,
+         0.4575 + 0.0325 * (r_s - 1.0) / 2.0],
+        np.minimum(0.5, 0.49 + 0.01 * (r_s - 3.0) / 7.0),
+    )
+
+def k_for_method_vec(r_s, method) -> np.ndarray:
+    """K for an array of r/t; ``method`` is a registered name or a KMethod."""
+    return METHOD_REGISTRY.get(method).vec(r_s)
+
+# Scalar API — thin memoised wrappers over the array kernels. Instrumentation
+# sits inside the cache, so call counts are cache misses. An array argument
+# skips the cache and gets an array back.
+def _scalar(k):
+    return float(k) if np.ndim(k) == 0 else k
+
+@memoize()
+@instrumented
+def k_logistic(r_s: float) -> float:
+    return _scalar(k_logistic_vec(r_s))
+
+@memoize()
+@instrumented
+def k_analytical(r_s: float) -> float:
+    return _scalar(k_analytical_vec(r_s))
+
+@memoize()
+@instrumented
+def k_din6935(r_s: float) -> float:
+    return _scalar(k_din6935_vec(r_s))
+
+def k_for_method(r_s: float, method) -> float:
+    return METHOD_REGISTRY.get(method).scalar(r_s)
+
+METHOD_REGISTRY.register(KMethod(
+    name="Logistic fit", label="Logistic", vec=k_logistic_vec, scalar=k_logistic,
+    rs_range=(0.05, 25.0),
+    citation="Empirical four-parameter logistic (LOGISTIC_COEFFS)",
+    description="empirically calibrated curve, good all-purpose default.",
+))
+METHOD_REGISTRY.register(KMethod(
+    name="Analytical (Wang-Wenner)", label="Wang-Wenner", vec=k_analytical_vec, scalar=k_analytical,
+    citation="Wang-Wenner neutral-axis shift model",
+    description="derived from neutral-axis shift theory; underestimates K at very low r/t.",
+))
+METHOD_REGISTRY.register(KMethod(
+    name="DIN 6935 empirical", label="DIN 6935", vec=k_din6935_vec, scalar=k_din6935,
+    rs_range=(0.0, 10.0),
+    citation="DIN 6935, cold bending of flat rolled steel",
+    description="German standard piecewise table; use for Euronorm/DIN compliance work.",
+))
+
+# ─── Bend Geometry ───────────────────────────────────────────────────────
+# These are plain NumPy expressions and broadcast over array arguments.
+
+@instrumented
+def bend_allowance(k: float, angle_deg: float, r: float, t: float) -> float:
+    return np.radians(angle_deg) * (r + k * t)
+
+@instrumented
+def outside_setback(angle_deg: float, r: float, t: float) -> float:
+    return np.tan(np.radians(angle_deg / 2)) * (r + t)
+
+@instrumented
+def bend_deduction(ba: float, r: float, t: float, angle_deg: float) -> float:
+    return 2 * outside_setback(angle_deg, r, t) - ba
+
+@instrumented
+def springback_angle(angle_deg: float, r: float, t: float, yield_mpa: float, E_mpa: float = 200_000) -> float:
+    ratio = 3 * yield_mpa * r / (E_mpa * t)
+    return angle_deg * ratio
+
+@instrumented
+def min_bend_radius(t: float, elongation_pct: float) -> float:
+    if elongation_pct <= 0:
+        return float('inf')
+    return t * (50 / elongation_pct - 1)
+
+@instrumented
+def flat_length(leg1: float, leg2: float, ba: float) -> float:
+    return leg1 + leg2 + ba
+
+@instrumented
+def bend_grid(rs_vals, angle_vals, t: float, method: str):
+    """BA, BD and OSSB grids of shape (len(angle_vals), len(rs_vals)); K is evaluated once per r/t column."""
+    rs_vals = np.asarray(rs_vals, dtype=float)
+    alpha = np.radians(np.asarray(angle_vals, dtype=float))[:, None]
+    r_col = rs_vals * t
+    k_col = k_for_method_vec(rs_vals, method)
+    ba   = alpha * (r_col + k_col * t)
+    ossb = np.tan(alpha / 2) * (r_col + t)
+    bd   = 2 * ossb - ba
+    return ba, bd, ossb
@@ -0,0 +1,74 @@
+"""Flat-pattern development for parts with any number of bends.
+
+Parts are passed in a ragged, concatenated layout so thousands of them can
+be developed in one vectorised pass: ``n_bends[p]`` is the bend count of
+part ``p``, ``angles``/``radii``/``t``/``k`` hold every bend of every part
+in order, and ``flanges`` holds the ``n_bends[p] + 1`` flanges of each
+part in order.
+
+Flange lengths are interpreted according to ``dims``:
+
+- ``"flat"``    — straight (tangent-to-tangent) lengths, as in
+  :func:`kfactor.engine.flat_length`: L = Σ flanges + Σ BA.
+- ``"outside"`` — outside mould-line dimensions: L = Σ flanges − Σ BD.
+"""
+import numpy as np
+
+from .batch import k_by_method
+from .engine import bend_allowance, bend_deduction, outside_setback
+
+FLANGE_DIMS = ("flat", "outside")
+
+def _offsets(counts: np.ndarray) -> np.ndarray:
+    return np.concatenate(([0], np.cumsum(counts)[:-1])).astype(np.intp)
+
+def flat_patterns(n_bends, flanges, angles, radii, t, k=None,
+                  method="Logistic fit", dims: str = "flat") -> dict:
+    """Develop many parts at once.
+
+    ``t`` and ``method`` may be scalars or per-bend arrays. ``k`` is an
+    optional per-bend K override; NaN entries fall back to ``method``.
+    Returns per-part ``length`` plus per-flange ``segments`` (developed
+    straight length) and per-bend ``K``, ``BA``, ``BD`` and ``OSSB``.
+    """
+    if dims not in FLANGE_DIMS:
+        raise ValueError(f"dims must be one of {FLANGE_DIMS}, got {dims!r}")
+    n_bends = np.asarray(n_bends, dtype=np.intp)
+    n_parts = len(n_bends)
+    flanges = np.asarray(flanges, dtype=float)
+    angles  = np.asarray(angles, dtype=float)
+    radii   = np.asarray(radii, dtype=float)
+    n_total = int(n_bends.sum())
+    if angles.shape != (n_total,) or radii.shape != (n_total,):
+        raise ValueError(f"angles and radii need {n_total} entries (sum of n_bends)")
+    if flanges.shape != (n_total + n_parts,):
+        raise ValueError(f"flanges needs {n_total + n_parts} entries (n_bends + 1 per part)")
+    t = np.broadcast_to(np.asarray(t, dtype=float), angles.shape)
+
+    K = k_by_method(radii / t, method)
+    if k is not None:
+        k = np.broadcast_to(np.asarray(k, dtype=float), angles.shape)
+        K = np.where(np.isnan(k), K, k)
+    BA   = bend_allowance(K, angles, radii, t)
+    BD   = bend_deduction(BA, radii, t, angles)
+    OSSB = outside_setback(angles, radii, t)
+
+    bend_part   = np.repeat(np.arange(n_parts), n_bends)
+    flange_part = np.repeat(np.arange(n_parts), n_bends + 1)
+    segments = flanges.copy()
+    if dims == "outside" and n_total:
+        # Bend j of part p joins flanges j and j+1 of that part; each loses one setback.
+        left = _offsets(n_bends + 1)[bend_part] + np.arange(n_total) - _offsets(n_bends)[bend_part]
+        segments -= np.bincount(left, OSSB, len(flanges)) + np.bincount(left + 1, OSSB, len(flanges))
+
+    length = (np.bincount(flange_part, segments, n_parts)
+              + np.bincount(bend_part, BA, n_parts))
+    return {"length": length, "segments": segments, "K": K, "BA": BA, "BD": BD, "OSSB": OSSB}
+
+def flat_pattern(flanges, angles, radii, t, k=None, method="Logistic fit", dims: str = "flat") -> dict:
+    """Develop a single part; ``length`` is returned as a float."""
+    angles = np.atleast_1d(np.asarray(angles, dtype=float))
+    radii  = np.broadcast_to(np.asarray(radii, dtype=float), angles.shape)
+    out = flat_patterns([len(angles)], flanges, angles, radii, t, k, method, dims)
+    out["length"] = float(out["length"][0])
+    return out
@@ -0,0 +1,262 @@
+"""Opt-in wall-time / call-count / allocation instrumentation.
+
+Functions are wrapped with :func:`instrumented`, page sections with
+:func:`span` or :func:`section`. Nothing is recorded unless instrumentation
+is switched on, either with :func:`enable` or through the environment::
+
+    KFACTOR_PROFILE=1         wall time and call counts
+    KFACTOR_PROFILE=memory    additionally net bytes allocated (tracemalloc)
+    KFACTOR_PROFILE_LOG=path  append one JSON line per run to ``path``
+
+Function wrappers are only installed when instrumentation is already on at
+import time (i.e. via the environment); otherwise :func:`instrumented`
+returns the function unchanged, so the kernels pay nothing. With it off, a
+span is a shared no-op context manager.
+
+Measurements are grouped into *runs* (one per Streamlit rerun: the page
+calls :func:`begin_run`/:func:`end_run`; a span opened outside any run, as
+in a fragment-only rerun, is a run of its own). Runs are tracked per
+thread, so concurrent sessions don't mix. Every finished run is logged as a
+JSON object on the ``kfactor.instrument`` logger and added to process-wide
+totals, which :func:`prometheus_text` renders in the Prometheus text format.
+Times are inclusive: a span's time contains the calls made inside it.
+"""
+import contextlib
+import functools
+import json
+import logging
+import os
+import threading
+import time
+import tracemalloc
+
+log = logging.getLogger(__name__)
+
+_enabled = False
+_memory = False
+_lock = threading.Lock()
+_local = threading.local()
+_totals: dict[tuple[str, str], "Stat"] = {}
+_runs = 0
+
+
+class Stat:
+    __slots__ = ("calls", "seconds", "max_seconds", "alloc")
+
+    def __init__(self):
+        self.calls = 0
+        self.seconds = 0.0
+        self.max_seconds = 0.0
+        self.alloc = 0
+
+    def add(self, seconds: float, alloc: int) -> None:
+        self.calls += 1
+        self.seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        self.alloc += alloc
+
+    def merge(self, other: "Stat") -> None:
+        self.calls += other.calls
+        self.seconds += other.seconds
+        self.max_seconds = max(self.max_seconds, other.max_seconds)
+        self.alloc += other.alloc
+
+    def as_dict(self) -> dict:
+        return {"calls": self.calls, "seconds": self.seconds,
+                "max_seconds": self.max_seconds, "alloc_bytes": self.alloc}
+
+
+class Run:
+    """Measurements of one rerun, keyed by (kind, name)."""
+
+    def __init__(self, label: str):
+        self.label = label
+        self.started = time.time()
+        self.t0 = time.perf_counter()
+        self.seconds = None
+        self.stats: dict[tuple[str, str], Stat] = {}
+        self.path: list[str] = []
+
+    def add(self, kind: str, name: str, seconds: float, alloc: int) -> None:
+        stat = self.stats.get((kind, name))
+        if stat is None:
+            stat = self.stats[(kind, name)] = Stat()
+        stat.add(seconds, alloc)
+
+    def rows(self) -> list[dict]:
+        """One dict per section/function, slowest first."""
+        rows = [{"kind": kind, "name": name, **stat.as_dict()}
+                for (kind, name), stat in self.stats.items()]
+        return sorted(rows, key=lambda row: -row["seconds"])
+
+    def as_dict(self) -> dict:
+        return {"run": self.label, "started": self.started, "seconds": self.seconds,
+                "memory": _memory, "stats": self.rows()}
+
+
+# ─── Switches ────────────────────────────────────────────────────────────
+def enabled() -> bool:
+    return _enabled
+
+def enable(memory: bool = False) -> None:
+    global _enabled, _memory
+    _memory = memory
+    if memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    _enabled = True
+
+def disable() -> None:
+    global _enabled, _memory
+    _enabled = False
+    if _memory and tracemalloc.is_tracing():
+        tracemalloc.stop()
+    _memory = False
+
+def configure_from_env(environ=os.environ) -> None:
+    mode = environ.get("KFACTOR_PROFILE", "").strip().lower()
+    if mode and mode not in ("0", "off", "false", "no"):
+        enable(memory=mode == "memory")
+    path = environ.get("KFACTOR_PROFILE_LOG")
+    if path:
+        handler = logging.FileHandler(path)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        log.addHandler(handler)
+        log.setLevel(logging.INFO)
+
+
+# ─── Recording ───────────────────────────────────────────────────────────
+def _current() -> Run | None:
+    return getattr(_local, "run", None)
+
+def _measure(kind: str, name: str, fn, args, kwargs):
+    mem0 = tracemalloc.get_traced_memory()[0] if _memory else 0
+    t0 = time.perf_counter()
+    try:
+        return fn(*args, **kwargs)
+    finally:
+        seconds = time.perf_counter() - t0
+        alloc = tracemalloc.get_traced_memory()[0] - mem0 if _memory else 0
+        run = _current()
+        if run is not None:
+            run.add(kind, name, seconds, alloc)
+
+def instrumented(fn=None, *, name: str | None = None):
+    """Record every call of ``fn`` under ``name`` (default: its ``__name__``).
+
+    A no-op unless instrumentation is enabled when the decorator runs.
+    """
+    def decorator(fn):
+        if not _enabled:
+            return fn
+        key = name or fn.__name__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return fn(*args, **kwargs)
+            return _measure("function", key, fn, args, kwargs)
+        return wrapper
+    return decorator(fn) if fn is not None else decorator
+
+@contextlib.contextmanager
+def _span(name: str):
+    run = _current()
+    own = run is None
+    if own:
+        run = begin_run(name)
+    run.path.append(name)
+    key = "/".join(run.path)
+    mem0 = tracemalloc.get_traced_memory()[0] if _memory else 0
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        seconds = time.perf_counter() - t0
+        alloc = tracemalloc.get_traced_memory()[0] - mem0 if _memory else 0
+        run.path.pop()
+        run.add("section", key, seconds, alloc)
+        if own:
+            end_run()
+
+_NULL = contextlib.nullcontext()
+
+def span(name: str):
+    """Context manager timing a block as section ``name``.
+
+    Nested spans are recorded under slash-joined paths, e.g. ``curves/chart``.
+    """
+    return _span(name) if _enabled else _NULL
+
+def section(name: str):
+    """Decorator form of :func:`span`."""
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+# ─── Runs ────────────────────────────────────────────────────────────────
+def begin_run(label: str = "run") -> Run | None:
+    """Start collecting a new run on this thread, discarding any open one."""
+    if not _enabled:
+        return None
+    _local.run = Run(label)
+    return _local.run
+
+def current_run() -> Run | None:
+    """The run in progress on this thread, if any."""
+    return _current()
+
+def end_run() -> Run | None:
+    """Close this thread's run, fold it into the totals and log it."""
+    global _runs
+    run = _current()
+    if run is None:
+        return None
+    _local.run = None
+    run.seconds = time.perf_counter() - run.t0
+    with _lock:
+        _runs += 1
+        for key, stat in run.stats.items():
+            total = _totals.get(key)
+            if total is None:
+                total = _totals[key] = Stat()
+            total.merge(stat)
+    if log.isEnabledFor(logging.INFO):
+        log.info(json.dumps(run.as_dict()))
+    return run
+
+def totals() -> list[dict]:
+    """Process-wide totals over all finished runs, slowest first."""
+    with _lock:
+        rows = [{"kind": kind, "name": name, **stat.as_dict()}
+                for (kind, name), stat in _totals.items()]
+    return sorted(rows, key=lambda row: -row["seconds"])
+
+def reset() -> None:
+    global _runs
+    with _lock:
+        _totals.clear()
+        _runs = 0
+
+def prometheus_text() -> str:
+    """Process-wide totals in the Prometheus text exposition format."""
+    rows = totals()
+    lines = ["# HELP kfactor_runs_total Finished instrumented runs.",
+             "# TYPE kfactor_runs_total counter",
+             f"kfactor_runs_total {_runs}"]
+    for metric, field, kind, help_ in (
+        ("kfactor_calls_total", "calls", "counter", "Calls per section or function."),
+        ("kfactor_seconds_total", "seconds", "counter", "Inclusive wall time in seconds."),
+        ("kfactor_max_seconds", "max_seconds", "gauge", "Slowest single call in seconds."),
+        ("kfactor_alloc_bytes_total", "alloc_bytes", "counter", "Net bytes allocated (memory mode only)."),
+    ):
+        lines += [f"# HELP {metric} {help_}", f"# TYPE {metric} {kind}"]
+        lines += [f'{metric}{{kind="{row["kind"]}",name="{row["name"]}"}} {row[field]}' for row in rows]
+    return "\n".join(lines) + "\n"
+
+
+configure_from_env()
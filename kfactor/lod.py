@@ -0,0 +1,103 @@
+"""Level-of-detail resampling of chart data.
+
+A plotted curve only needs the points that change what is drawn.
+:func:`simplify_indices` keeps a subset chosen by Ramer–Douglas–Peucker on
+axis-normalised coordinates: points stay where the curve bends (the DIN
+6935 breakpoints, the knee of the logistic fit) and are dropped along
+straight or flat stretches, so no kept-out point is further than ``tol`` ×
+the axis span from the drawn polyline. ``min_points`` evenly spaced points
+are always kept so hover still finds a point every so often. NaN gaps are
+preserved as gaps.
+
+:func:`decimate_grid` does the same job for heatmaps by striding rows and
+columns down to a cell budget.
+
+Only the figures sent to a browser are resampled; exports use the full
+arrays.
+"""
+import numpy as np
+
+DEFAULT_TOLERANCE = 5e-4     # ≈ half a pixel on a 1000 px axis
+DEFAULT_MAX_CELLS = 40_000
+
+
+def _normalised(a: np.ndarray, finite: np.ndarray) -> np.ndarray:
+    lo, hi = np.min(a[finite]), np.max(a[finite])
+    return (a - lo) / (hi - lo) if hi > lo else np.zeros_like(a)
+
+def _rdp(x: np.ndarray, ys: list[np.ndarray], tol: float, keep: np.ndarray, lo: int, hi: int) -> None:
+    keep[lo] = keep[hi] = True
+    stack = [(lo, hi)]
+    while stack:
+        i, j = stack.pop()
+        if j - i < 2:
+            continue
+        xs = x[i + 1:j] - x[i]
+        dx = x[j] - x[i]
+        worst = np.zeros(j - i - 1)
+        for y in ys:
+            dy = y[j] - y[i]
+            norm = np.hypot(dx, dy)
+            if norm:
+                d = np.abs(dy * xs - dx * (y[i + 1:j] - y[i])) / norm
+            else:
+                d = np.hypot(xs, y[i + 1:j] - y[i])
+            np.maximum(worst, d, out=worst)
+        k = int(np.argmax(worst))
+        if worst[k] > tol:
+            m = i + 1 + k
+            keep[m] = True
+            stack += [(i, m), (m, j)]
+
+def simplify_indices(x, *ys, tol: float = DEFAULT_TOLERANCE, min_points: int = 0) -> np.ndarray:
+    """Sorted indices of the points to draw for the curves ``ys`` sharing ``x``.
+
+    A point is kept if any of the curves needs it, so the returned indices
+    can be applied to all of them (e.g. both edges of a band).
+    """
+    x = np.asarray(x, dtype=float)
+    ys = [np.asarray(y, dtype=float) for y in ys]
+    n = len(x)
+    if n <= max(2, min_points):
+        return np.arange(n)
+    finite = np.isfinite(x)
+    for y in ys:
+        finite &= np.isfinite(y)
+    if not finite.any():
+        return np.arange(n)
+    xn = _normalised(x, finite)
+    yn = [_normalised(y, finite) for y in ys]
+
+    keep = ~finite
+    # Runs of finite points; one NaN per gap is enough to break the line.
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], finite.view(np.int8), [0]))))
+    for lo, hi in zip(edges[::2], edges[1::2] - 1):
+        _rdp(xn, yn, tol, keep, int(lo), int(hi))
+    gaps = ~finite
+    keep[1:] &= ~(gaps[1:] & gaps[:-1])
+    if min_points:
+        keep[np.linspace(0, n - 1, min_points).round().astype(int)] = True
+    return np.flatnonzero(keep)
+
+def simplify(x, *ys, tol: float = DEFAULT_TOLERANCE, min_points: int = 0) -> tuple[np.ndarray, ...]:
+    """``(x, *ys)`` reduced to :func:`simplify_indices`."""
+    idx = simplify_indices(x, *ys, tol=tol, min_points=min_points)
+    return tuple(np.asarray(a)[idx] for a in (x, *ys))
+
+def decimate_grid(z, x, y, max_cells: int = DEFAULT_MAX_CELLS):
+    """Every k-th row and column of ``z`` (shape ``(len(y), len(x))``) so at most
+    ``max_cells`` remain; the last row and column are always kept."""
+    z = np.asarray(z)
+    ny, nx = z.shape
+    if nx * ny <= max_cells:
+        return z, x, y
+
+    def take(n, step):
+        idx = np.arange(0, n, step)
+        return idx if idx[-1] == n - 1 else np.append(idx, n - 1)
+
+    step = int(np.ceil(np.sqrt(nx * ny / max_cells)))
+    while len(take(nx, step)) * len(take(ny, step)) > max_cells and step < max(nx, ny):
+        step += 1
+    ix, iy = take(nx, step), take(ny, step)
+    return z[np.ix_(iy, ix)], np.asarray(x)[ix], np.asarray(y)[iy]
@@ -0,0 +1,234 @@
+import os
+
+import numpy as np
+
+# ─── Material Database ────────────────────────────────────────────────────
+MATERIALS = {
+    "Aluminum 1100-O":      {"typical_k": 0.33, "uts_mpa": 90,   "yield_mpa": 35,   "elongation": 35, "min_rb_factor": 0.0, "E_mpa": 69_000},
+    "Aluminum 5052-H32":    {"typical_k": 0.34, "uts_mpa": 228,  "yield_mpa": 193,  "elongation": 12, "min_rb_factor": 1.0, "E_mpa": 70_000},
+    "Aluminum 6061-T6":     {"typical_k": 0.35, "uts_mpa": 310,  "yield_mpa": 276,  "elongation": 8,  "min_rb_factor": 1.5, "E_mpa": 68_900},
+    "Steel – Mild (1020)":  {"typical_k": 0.42, "uts_mpa": 380,  "yield_mpa": 210,  "elongation": 25, "min_rb_factor": 0.5, "E_mpa": 200_000},
+    "Steel – HSLA 350":     {"typical_k": 0.44, "uts_mpa": 450,  "yield_mpa": 350,  "elongation": 20, "min_rb_factor": 1.5, "E_mpa": 200_000},
+    "Steel – SS 304":       {"typical_k": 0.45, "uts_mpa": 515,  "yield_mpa": 205,  "elongation": 40, "min_rb_factor": 1.0, "E_mpa": 193_000},
+    "Steel – SS 316":       {"typical_k": 0.46, "uts_mpa": 485,  "yield_mpa": 170,  "elongation": 40, "min_rb_factor": 1.0, "E_mpa": 193_000},
+    "Steel – Spring":       {"typical_k": 0.48, "uts_mpa": 1200, "yield_mpa": 1000, "elongation": 5,  "min_rb_factor": 3.0, "E_mpa": 207_000},
+    "Copper (C110)":        {"typical_k": 0.35, "uts_mpa": 220,  "yield_mpa": 70,   "elongation": 40, "min_rb_factor": 0.0, "E_mpa": 117_000},
+    "Brass C260":           {"typical_k": 0.38, "uts_mpa": 340,  "yield_mpa": 103,  "elongation": 43, "min_rb_factor": 0.5, "E_mpa": 110_000},
+    "Titanium Gr2":         {"typical_k": 0.45, "uts_mpa": 345,  "yield_mpa": 276,  "elongation": 20, "min_rb_factor": 2.5, "E_mpa": 105_000},
+}
+
+
+# ─── Columnar Store ──────────────────────────────────────────────────────
+# The same data as one NumPy array per property, addressed by integer
+# material ID (the row number). Every column carries one extra sentinel row
+# at the end — NaN for numbers, "" for text — so ID -1 (unknown material)
+# gathers NaN with a plain fancy index and no masking.
+MATERIAL_FIELDS = ("typical_k", "uts_mpa", "yield_mpa", "elongation", "min_rb_factor", "E_mpa")
+TEXT_FIELDS = ("name", "family")
+
+def material_family(name: str) -> str:
+    """``"Steel – SS 304"`` → ``"Steel"``; the first word of the name."""
+    return name.split()[0] if name.strip() else ""
+
+class MaterialStore:
+    """Read-only columnar material table with a name index.
+
+    ``store["Steel – SS 304"]`` returns a property dict like
+    :data:`MATERIALS`; the array API is :meth:`ids`, :meth:`gather` and
+    :meth:`filter`::
+
+        ids = store.ids(material_names)          # one dict lookup per distinct name
+        yield_mpa = store.gather("yield_mpa", ids)
+        steels = store.filter(family="Steel", yield_mpa=(250, None))
+    """
+
+    def __init__(self, columns: dict):
+        """``columns`` maps ``name`` (required), ``family`` and ``MATERIAL_FIELDS`` to sequences.
+
+        A missing ``family`` is taken from the first word of the name;
+        missing properties are NaN.
+        """
+        names = np.asarray(columns["name"], dtype=str)
+        n = len(names)
+        family = columns.get("family")
+        if family is None:
+            family = [material_family(s) for s in names.tolist()]
+        padded = {"name": np.append(names, ""), "family": np.append(np.asarray(family, dtype=str), "")}
+        for f in MATERIAL_FIELDS:
+            col = columns.get(f)
+            padded[f] = np.append(np.full(n, np.nan) if col is None else np.asarray(col, dtype=float),
+                                  np.nan)
+        self._set(padded)
+
+    def _set(self, padded: dict) -> None:
+        n = len(padded["name"]) - 1
+        if any(len(c) != n + 1 for c in padded.values()):
+            raise ValueError("material columns must all have the same length")
+        self._cols: dict[str, np.ndarray] = padded
+        names = padded["name"][:-1].tolist()
+        # Rows with an empty name are IDs retired by a catalog reload (see merged()).
+        self.index: dict[str, int] = {name: i for i, name in enumerate(names) if name}
+        if len(self.index) != sum(map(bool, names)):
+            raise ValueError("material names must be unique")
+
+    @classmethod
+    def _from_padded(cls, padded: dict) -> "MaterialStore":
+        store = cls.__new__(cls)
+        store._set(padded)
+        return store
+
+    @classmethod
+    def from_dict(cls, materials: dict) -> "MaterialStore":
+        """Build from a ``{name: {field: value}}`` mapping such as :data:`MATERIALS`."""
+        names = list(materials)
+        columns = {"name": names}
+        for f in MATERIAL_FIELDS:
+            columns[f] = [materials[m].get(f, np.nan) for m in names]
+        if any("family" in materials[m] for m in names):
+            columns["family"] = [materials[m].get("family") or material_family(m) for m in names]
+        return cls(columns)
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    @property
+    def n_ids(self) -> int:
+        """Number of IDs in use, including retired ones."""
+        return len(self._cols["name"]) - 1
+
+    def __contains__(self, name) -> bool:
+        return name in self.index
+
+    def __iter__(self):
+        return iter(self.index)
+
+    @property
+    def names(self) -> np.ndarray:
+        return self._cols["name"][:-1]
+
+    def column(self, field: str) -> np.ndarray:
+        """One property for every material, in ID order (a read-only view)."""
+        col = self._cols[field][:-1]
+        col.flags.writeable = False
+        return col
+
+    def columns(self, fields=None) -> dict[str, np.ndarray]:
+        return {f: self.column(f) for f in (fields or (*TEXT_FIELDS, *MATERIAL_FIELDS))}
+
+    def families(self) -> list[str]:
+        return sorted(set(self.column("family").tolist()) - {""})
+
+    def id(self, name: str) -> int:
+        """Material ID of ``name``, or -1 if unknown."""
+        return self.index.get(name, -1)
+
+    def ids(self, names) -> np.ndarray:
+        """Material ID per name (-1 for unknown or blank)."""
+        names = np.asarray(names)
+        if names.ndim == 0:
+            return np.asarray(self.id(str(names)), dtype=np.intp)
+        # One dict probe per row; sorting the names (np.unique) costs far more.
+        index = self.index
+        ids = np.fromiter((index.get(n, -1) for n in names.ravel().tolist()),
+                          dtype=np.intp, count=names.size)
+        return ids.reshape(names.shape)
+
+    def gather(self, field: str, ids) -> np.ndarray:
+        """``field`` per ID; ID -1 gives NaN (or "" for text fields)."""
+        return self._cols[field][ids]
+
+    def table(self, field: str) -> np.ndarray:
+        """``field`` per ID with the trailing sentinel, for indexing with encoded IDs."""
+        return self._cols[field]
+
+    def filter(self, family: str | None = None, name_contains: str | None = None,
+               **ranges: tuple[float | None, float | None]) -> np.ndarray:
+        """IDs matching every condition, in ID order.
+
+        Each keyword range is ``field=(lo, hi)`` (inclusive; ``None`` for an
+        open end), e.g. ``filter(family="Aluminum", yield_mpa=(150, None))``.
+        """
+        mask = self.column("name") != ""
+        if family is not None:
+            mask &= self.column("family") == family
+        if name_contains:
+            mask &= np.char.find(np.char.lower(self.names), name_contains.lower()) >= 0
+        for field, (lo, hi) in ranges.items():
+            if field not in MATERIAL_FIELDS:
+                raise ValueError(f"unknown material field {field!r}; expected one of {MATERIAL_FIELDS}")
+            col = self.column(field)
+            if lo is not None:
+                mask &= col >= lo
+            if hi is not None:
+                mask &= col <= hi
+        return np.flatnonzero(mask)
+
+    def subset(self, ids) -> "MaterialStore":
+        ids = np.append(np.asarray(ids, dtype=np.intp), -1)
+        return MaterialStore._from_padded({f: col[ids] for f, col in self._cols.items()})
+
+    def merged(self, new: "MaterialStore") -> "MaterialStore":
+        """``new``'s data laid out on this store's IDs.
+
+        Names in both keep their ID, names only in ``new`` get appended IDs
+        and names only in this store become empty rows (NaN properties).
+        """
+        pos = self.ids(new.names)
+        added = np.flatnonzero(pos < 0)
+        pos[added] = self.n_ids + np.arange(len(added))
+        n = self.n_ids + len(added)
+        padded = {}
+        for f, col in self._cols.items():
+            src = new._cols[f]
+            out = np.full(n + 1, "" if f in TEXT_FIELDS else np.nan,
+                          dtype=np.result_type(col.dtype, src.dtype))
+            out[pos] = src[:-1]
+            padded[f] = out
+        return MaterialStore._from_padded(padded)
+
+    def row(self, id: int) -> dict:
+        out = {f: self._cols[f][id].item() for f in MATERIAL_FIELDS}
+        out["family"] = str(self._cols["family"][id])
+        return out
+
+    def __getitem__(self, name: str) -> dict:
+        i = self.index.get(name)
+        if i is None:
+            raise KeyError(name)
+        return self.row(i)
+
+    def get(self, name: str, default=None):
+        i = self.index.get(name)
+        return default if i is None else self.row(i)
+
+    def to_dict(self) -> dict[str, dict]:
+        return {name: self.row(i) for name, i in self.index.items()}
+
+
+MATERIAL_STORE = MaterialStore.from_dict(MATERIALS)
+
+# ─── Default Store ───────────────────────────────────────────────────────
+# Batch evaluation and the app read materials from default_store(): the
+# built-in table, a store installed with set_default_store(), or the
+# catalog file named by $KFACTOR_MATERIALS (watched for changes, see
+# kfactor.catalog).
+CATALOG_ENV = "KFACTOR_MATERIALS"
+_default_store: MaterialStore | None = None
+_env_watcher = None
+
+def set_default_store(store: MaterialStore | None) -> None:
+    """Install ``store`` as the default; ``None`` restores the built-in table."""
+    global _default_store
+    _default_store = store
+
+def default_store() -> MaterialStore:
+    global _env_watcher
+    if _default_store is not None:
+        return _default_store
+    path = os.environ.get(CATALOG_ENV)
+    if not path:
+        return MATERIAL_STORE
+    if _env_watcher is None or str(_env_watcher.path) != path:
+        from .catalog import CatalogWatcher
+        _env_watcher = CatalogWatcher(path)
+    return _env_watcher.store
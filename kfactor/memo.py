@@ -0,0 +1,114 @@
+"""Bounded memoisation for the scalar engine functions.
+
+Works the same with or without a Streamlit runtime: entries live in a
+per-process, thread-safe LRU with an optional TTL, float arguments are
+quantised before keying so near-identical inputs share an entry, and
+each cached function exposes ``cache_info()`` / ``cache_clear()`` like
+:func:`functools.lru_cache`.
+"""
+import functools
+import numbers
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, NamedTuple
+
+DEFAULT_MAXSIZE = 4096
+DEFAULT_DIGITS = 9
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+class LRUCache:
+    """Thread-safe LRU mapping with optional per-entry time-to-live (seconds)."""
+
+    _MISSING = object()
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE, ttl: float | None = None):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = 0
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key, self._MISSING)
+            if entry is not self._MISSING:
+                value, expires = entry
+                if expires is None or expires > time.monotonic():
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._data[key]
+                self.evictions += 1
+            self.misses += 1
+            return default
+
+    def put(self, key, value) -> None:
+        expires = None if self.ttl is None else time.monotonic() + self.ttl
+        with self._lock:
+            self._data[key] = (value, expires)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.evictions, self.maxsize, len(self._data))
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+def quantize(x, digits: int = DEFAULT_DIGITS):
+    if isinstance(x, numbers.Integral):
+        return x
+    if isinstance(x, numbers.Real):
+        return round(float(x), digits)
+    return x
+
+def memoize(maxsize: int = DEFAULT_MAXSIZE, ttl: float | None = None,
+            digits: int = DEFAULT_DIGITS) -> Callable:
+    """LRU-memoise a function of scalar arguments.
+
+    Numeric positional and keyword arguments are rounded to ``digits``
+    decimals; the function is called with the rounded values so a cached
+    result never depends on which near-duplicate input arrived first.
+    Calls with an unhashable argument (e.g. a NumPy array) bypass the cache.
+    """
+    def decorator(fn):
+        cache = LRUCache(maxsize, ttl)
+        missing = LRUCache._MISSING
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            args = tuple(quantize(a, digits) for a in args)
+            kwargs = {k: quantize(v, digits) for k, v in kwargs.items()}
+            key = (args, tuple(sorted(kwargs.items()))) if kwargs else args
+            try:
+                hash(key)
+            except TypeError:
+                return fn(*args, **kwargs)
+            value = cache.get(key, missing)
+            if value is missing:
+                value = fn(*args, **kwargs)
+                cache.put(key, value)
+            return value
+
+        wrapper.cache = cache
+        wrapper.cache_info = cache.info
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
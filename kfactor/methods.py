@@ -0,0 +1,125 @@
+"""Registry of K-factor methods.
+
+Every method is a :class:`KMethod`: an array kernel, a scalar form and
+descriptive metadata. Callers look a method up once, by name, and then call
+its kernel directly, so per-element work never re-dispatches on a string::
+
+    m = get_method("DIN 6935 empirical")
+    K = m.vec(r_s)                  # whole array in one call
+
+The built-in methods are registered by :mod:`kfactor.engine`. Custom ones
+can be added with :func:`register_method`. Fitted curves from
+:mod:`kfactor.curves` resolve on demand as ``"curve:<name>[@<version>]"``
+and don't need to be registered.
+"""
+import math
+import threading
+from dataclasses import dataclass, field
+from typing import Callable, Iterator
+
+import numpy as np
+
+CURVE_PREFIX = "curve:"
+
+
+@dataclass(frozen=True)
+class KMethod:
+    """A K-factor method: ``vec`` maps an r/t array to K, ``scalar`` one float to one float."""
+    name: str
+    vec: Callable[[np.ndarray], np.ndarray]
+    scalar: Callable[[float], float] | None = None
+    label: str = ""                 # short display name, e.g. "Wang-Wenner"
+    rs_range: tuple[float, float] = (0.0, math.inf)   # r/t range the method is meant for
+    citation: str = ""
+    description: str = ""
+    meta: dict = field(default_factory=dict)
+
+    def __post_init__(self):
+        if self.scalar is None:
+            object.__setattr__(self, "scalar", lambda r_s: float(self.vec(r_s)))
+        if not self.label:
+            object.__setattr__(self, "label", self.name)
+
+    def in_range(self, r_s) -> np.ndarray:
+        lo, hi = self.rs_range
+        r_s = np.asarray(r_s, dtype=float)
+        return (r_s >= lo) & (r_s <= hi)
+
+    def info(self) -> dict:
+        """JSON-friendly metadata (no callables)."""
+        lo, hi = self.rs_range
+        return {"name": self.name, "label": self.label,
+                "rs_range": [lo, None if math.isinf(hi) else hi],
+                "citation": self.citation, "description": self.description, **self.meta}
+
+
+class MethodRegistry:
+    """Name → :class:`KMethod`, in registration order."""
+
+    def __init__(self):
+        self._methods: dict[str, KMethod] = {}
+        self._lock = threading.Lock()
+        self.version = 0        # bumped on every change, for cache keys
+
+    def register(self, method: KMethod, replace: bool = False) -> KMethod:
+        if method.name.startswith(CURVE_PREFIX):
+            raise ValueError(f"{CURVE_PREFIX!r} names are reserved for fitted curves")
+        with self._lock:
+            if method.name in self._methods and not replace:
+                raise ValueError(f"K method {method.name!r} is already registered")
+            self._methods[method.name] = method
+            self.version += 1
+        return method
+
+    def unregister(self, name: str) -> None:
+        with self._lock:
+            del self._methods[name]
+            self.version += 1
+
+    def get(self, name: str) -> KMethod:
+        """Look up ``name`` (a KMethod passes through); raises ValueError if unknown."""
+        if isinstance(name, KMethod):
+            return name
+        method = self._methods.get(name)
+        if method is not None:
+            return method
+        if isinstance(name, str) and name.startswith(CURVE_PREFIX):
+            from .curves import curve_for_method
+            curve = curve_for_method(name)
+            return KMethod(name=name, vec=curve, label=curve.name,
+                           rs_range=curve.r_s_range,
+                           description=f"Fitted logistic curve, version {curve.version} "
+                                       f"(n={curve.n}, rmse={curve.rmse:.2g})",
+                           meta={"version": curve.version, "coeffs": list(curve.coeffs)})
+        raise ValueError(f"Unknown K method: {name!r}; expected one of {self.names()} "
+                         f"or '{CURVE_PREFIX}<name>'")
+
+    def __contains__(self, name) -> bool:
+        try:
+            self.get(name)
+        except ValueError:
+            return False
+        return True
+
+    def names(self) -> list[str]:
+        return list(self._methods)
+
+    def __iter__(self) -> Iterator[KMethod]:
+        return iter(list(self._methods.values()))
+
+    def __len__(self) -> int:
+        return len(self._methods)
+
+
+METHOD_REGISTRY = MethodRegistry()
+
+def get_method(name: str) -> KMethod:
+    return METHOD_REGISTRY.get(name)
+
+def register_method(name: str, vec, scalar=None, replace: bool = False, **metadata) -> KMethod:
+    """Register a custom K method; ``vec`` must accept and return arrays."""
+    return METHOD_REGISTRY.register(KMethod(name=name, vec=vec, scalar=scalar, **metadata),
+                                    replace=replace)
+
+def method_names() -> list[str]:
+    return METHOD_REGISTRY.names()
@@ -0,0 +1,132 @@
+"""Multi-core batch evaluation.
+
+Rows are encoded once in the parent (see :mod:`kfactor.batch`), copied into
+shared-memory blocks and evaluated in shards by a process pool. Workers
+attach to the blocks by name and write their slice of the output in place,
+so only shard bounds and the small method/material lookup tables are
+pickled, and results come back already in input order.
+
+Methods are resolved in the parent and their kernels shipped with each
+shard, so a long-lived pool also evaluates methods registered after it
+started. Kernels that can't be pickled (lambdas, closures) are looked up by
+name in the worker's own registry instead, which fails with a clear error if
+the worker never saw the method.
+"""
+import os
+import pickle
+from concurrent.futures import Executor, ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from .batch import BATCH_OUTPUTS, _column, compute_batch, encode_materials, encode_methods, evaluate_rows
+from .methods import METHOD_REGISTRY
+
+DEFAULT_CHUNKSIZE = 250_000
+
+def default_workers() -> int:
+    return os.cpu_count() or 1
+
+def _shard_kernels(method_names, k_tables: dict | None) -> dict:
+    # Name → kernel for every method whose kernel survives pickling.
+    k_tables = k_tables or {}
+    kernels = {}
+    for m in method_names:
+        kernel = k_tables.get(m) or METHOD_REGISTRY.get(m).vec
+        try:
+            pickle.dumps(kernel)
+        except (pickle.PicklingError, AttributeError, TypeError):
+            continue
+        kernels[m] = kernel
+    return kernels
+
+def _evaluate_shard(names: tuple[str, str, str], n: int, lo: int, hi: int,
+                    method_names, kernels: dict, has_codes: bool, yield_u, E_u) -> int:
+    for m in method_names:
+        if m not in kernels and m not in METHOD_REGISTRY:
+            raise ValueError(f"K method {m!r} is not registered in the worker processes and its "
+                             "kernel can't be pickled; register it in a module the workers import "
+                             "(before the pool starts) or make its kernel a module-level function")
+    shm_f, shm_i, shm_o = (shared_memory.SharedMemory(name=nm) for nm in names)
+    try:
+        f_in  = np.ndarray((3, n), dtype=np.float64, buffer=shm_f.buf)
+        i_in  = np.ndarray((2, n), dtype=np.int32,   buffer=shm_i.buf)
+        out   = np.ndarray((len(BATCH_OUTPUTS), n), dtype=np.float64, buffer=shm_o.buf)
+        r, t, angle = f_in[:, lo:hi]
+        method_codes = i_in[0, lo:hi] if len(method_names) > 1 else None
+        mat_codes    = i_in[1, lo:hi] if has_codes else None
+        evaluate_rows(r, t, angle, method_codes, method_names, mat_codes, yield_u, E_u,
+                      out=out[:, lo:hi], k_tables=kernels)
+        del f_in, i_in, out, r, t, angle, method_codes, mat_codes
+    finally:
+        for shm in (shm_f, shm_i, shm_o):
+            shm.close()
+    return hi - lo
+
+def _shared(shape, dtype, blocks: list) -> tuple[shared_memory.SharedMemory, np.ndarray]:
+    nbytes = max(1, int(np.prod(shape)) * np.dtype(dtype).itemsize)
+    shm = shared_memory.SharedMemory(create=True, size=nbytes)
+    blocks.append(shm)
+    return shm, np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+def compute_batch_parallel(table, method: str = "Logistic fit", workers: int | None = None,
+                           chunksize: int = DEFAULT_CHUNKSIZE, executor: Executor | None = None,
+                           k_tables: dict | None = None) -> dict:
+    """Same contract as :func:`kfactor.batch.compute_batch`, sharded across processes.
+
+    ``workers`` defaults to the CPU count; ``chunksize`` is the number of rows
+    per shard. Pass a long-lived ``executor`` to amortise pool start-up over
+    many calls (``workers`` is then ignored). ``k_tables`` is shipped to the
+    workers with each shard. Tables that fit in one shard are evaluated
+    in-process.
+    """
+    workers = workers or default_workers()
+    r = _column(table, "r")
+    n = len(r)
+    if n <= chunksize or (workers <= 1 and executor is None):
+        return compute_batch(table, method, k_tables=k_tables)
+
+    method_codes, method_names = encode_methods(_column(table, "method", method))
+    kernels = _shard_kernels(method_names, k_tables)
+    materials = _column(table, "material", np.array([]))
+    has_codes = bool(materials.size)
+    if has_codes:
+        mat_codes, yield_u, E_u = encode_materials(materials)
+    else:
+        mat_codes = yield_u = E_u = None
+
+    blocks = []
+    try:
+        shm_f, f_in = _shared((3, n), np.float64, blocks)
+        shm_i, i_in = _shared((2, n), np.int32, blocks)
+        shm_o, out  = _shared((len(BATCH_OUTPUTS), n), np.float64, blocks)
+
+        f_in[0] = r
+        f_in[1] = _column(table, "t")
+        f_in[2] = _column(table, "angle")
+        i_in[0] = 0 if method_codes is None else method_codes
+        i_in[1] = 0 if mat_codes is None else mat_codes
+
+        names = (shm_f.name, shm_i.name, shm_o.name)
+        bounds = [(lo, min(lo + chunksize, n)) for lo in range(0, n, chunksize)]
+        pool = executor or ProcessPoolExecutor(max_workers=workers)
+        try:
+            futures = [pool.submit(_evaluate_shard, names, n, lo, hi,
+                                   method_names, kernels, has_codes, yield_u, E_u)
+                       for lo, hi in bounds]
+            for fut in futures:
+                fut.result()
+        finally:
+            if executor is None:
+                pool.shutdown()
+
+        result = dict(zip(BATCH_OUTPUTS, out.copy()))
+        del f_in, i_in, out
+        return result
+    finally:
+        for shm in blocks:
+            try:
+                shm.close()
+            except BufferError:
+                pass  # a view is still referenced by an in-flight exception
+            shm.unlink()
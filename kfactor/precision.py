@@ -0,0 +1,64 @@
+"""Canonical engineering precision for user-entered lengths.
+
+Widget values arrive as arbitrary floats (2.0 vs 2.0000001), and each one
+would otherwise be a separate entry in every cache keyed on it. Snapping
+lengths to the nearest step before anything is computed makes inputs that
+agree to workshop precision share their results::
+
+    r = snap_length(r, "mm")       # 2.0000001 → 2.0 with the default 0.001 mm step
+
+Steps per unit are :data:`LENGTH_STEPS`; ``$KFACTOR_PRECISION`` overrides
+them at import (``"mm=0.01,in=0.0005"``), and a step of 0 turns snapping
+off for that unit.
+"""
+import os
+from decimal import Decimal
+
+import numpy as np
+
+PRECISION_ENV = "KFACTOR_PRECISION"
+DEFAULT_LENGTH_STEPS = {"mm": 0.001, "in": 0.0001}
+
+def _parse_steps(spec: str) -> dict[str, float]:
+    steps = {}
+    for part in filter(None, (p.strip() for p in spec.split(","))):
+        unit, sep, value = part.partition("=")
+        if not sep or unit.strip() not in DEFAULT_LENGTH_STEPS:
+            raise ValueError(f"bad {PRECISION_ENV} entry {part!r}; expected e.g. 'mm=0.001,in=0.0001'")
+        steps[unit.strip()] = float(value)
+    return steps
+
+LENGTH_STEPS = {**DEFAULT_LENGTH_STEPS, **_parse_steps(os.environ.get(PRECISION_ENV, ""))}
+
+
+def step_decimals(step: float) -> int:
+    """Decimal places needed to write multiples of ``step`` exactly (0.25 → 2)."""
+    return max(0, -Decimal(repr(float(step))).normalize().as_tuple().exponent)
+
+def snap(x, step: float):
+    """``x`` rounded to the nearest multiple of ``step``; scalars stay Python floats."""
+    if not step:
+        return x
+    out = np.round(np.round(np.asarray(x, dtype=float) / step) * step, step_decimals(step))
+    return float(out) if out.ndim == 0 else out
+
+def length_step(unit: str) -> float:
+    if unit not in LENGTH_STEPS:
+        raise ValueError(f"unknown length unit {unit!r}; expected one of {sorted(LENGTH_STEPS)}")
+    return LENGTH_STEPS[unit]
+
+def snap_length(x, unit: str = "mm"):
+    return snap(x, length_step(unit))
+
+def describe_precision(unit: str) -> str:
+    """Human-readable effective precision, e.g. ``"0.001 mm"``."""
+    step = length_step(unit)
+    if not step:
+        return "full float precision"
+    return f"{step:.{step_decimals(step)}f} {unit}"
+
+def length_format(unit: str) -> str:
+    """Format spec showing every significant digit of a snapped length."""
+    step = length_step(unit)
+    return f".{step_decimals(step)}f" if step else "g"
+
@@ -0,0 +1,135 @@
+"""Input-independent reference data, computed once and shared.
+
+The built-in methods' K curves over :data:`RS_RANGE`, their divergence from
+DIN 6935 and the K values at the reference-table rows (:data:`RS_TABLE`)
+depend on nothing a user enters. :func:`reference_assets` computes them on
+first use in a process — or loads them from a compiled ``.npz`` asset — and
+every session reuses the same read-only arrays::
+
+    python -m kfactor.reference --out assets/reference.npz     # at build time
+    export KFACTOR_REFERENCE_ASSETS=assets/reference.npz
+
+An asset written by other kfactor sources (see
+:func:`kfactor.diskcache.engine_version`), or for other grids, is ignored
+and the data recomputed.
+"""
+import json
+import os
+import tempfile
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from .diskcache import engine_version
+from .engine import METHODS
+from .methods import METHOD_REGISTRY
+
+ASSETS_ENV = "KFACTOR_REFERENCE_ASSETS"
+RS_RANGE = np.linspace(0.05, 25, 500)
+RS_TABLE = (0.2, 0.4, 0.6, 0.8, 1.0, 1.5, 2.0, 2.5, 3.0, 4.0, 5.0, 7.0, 10.0, 15.0, 25.0)
+DIVERGENCE_REFERENCE = "DIN 6935 empirical"
+
+
+# The built-in method objects; a method replaced in the registry later is
+# no longer "static" and is computed live by the callers.
+_BUILTINS = {m: METHOD_REGISTRY.get(m) for m in METHODS}
+
+def is_static(method: str) -> bool:
+    return method in _BUILTINS and METHOD_REGISTRY.get(method) is _BUILTINS[method]
+
+
+@dataclass(frozen=True)
+class ReferenceAssets:
+    version: str
+    rs_range: np.ndarray
+    curves: dict[str, np.ndarray]       # K over rs_range per method
+    divergence: dict[str, np.ndarray]   # |K − K_DIN| × 1000 over rs_range
+    rs_table: np.ndarray
+    table: dict[str, np.ndarray]        # K at rs_table, rounded to 4 places
+
+    @property
+    def methods(self) -> tuple[str, ...]:
+        return tuple(self.curves)
+
+
+def _readonly(a: np.ndarray) -> np.ndarray:
+    a = np.ascontiguousarray(a, dtype=float)
+    a.setflags(write=False)
+    return a
+
+def build_reference_assets(methods: tuple[str, ...] = METHODS) -> ReferenceAssets:
+    rs_table = np.asarray(RS_TABLE, dtype=float)
+    curves = {m: METHOD_REGISTRY.get(m).vec(RS_RANGE) for m in methods}
+    ref = METHOD_REGISTRY.get(DIVERGENCE_REFERENCE).vec(RS_RANGE)
+    return ReferenceAssets(
+        version=engine_version(),
+        rs_range=_readonly(RS_RANGE),
+        curves={m: _readonly(k) for m, k in curves.items()},
+        divergence={m: _readonly(np.abs(k - ref) * 1000) for m, k in curves.items()},
+        rs_table=_readonly(rs_table),
+        table={m: _readonly(np.round(METHOD_REGISTRY.get(m).vec(rs_table), 4)) for m in methods},
+    )
+
+def save_reference_assets(assets: ReferenceAssets, path) -> Path:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    meta = {"version": assets.version, "methods": list(assets.methods)}
+    arrays = {"rs_range": assets.rs_range, "rs_table": assets.rs_table,
+              "meta": np.frombuffer(json.dumps(meta).encode(), dtype=np.uint8)}
+    for i, m in enumerate(assets.methods):
+        arrays[f"curve_{i}"] = assets.curves[m]
+        arrays[f"divergence_{i}"] = assets.divergence[m]
+        arrays[f"table_{i}"] = assets.table[m]
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".npz.tmp")
+    with os.fdopen(fd, "wb") as out:
+        np.savez(out, **arrays)
+    os.replace(tmp, path)
+    return path
+
+def load_reference_assets(path) -> ReferenceAssets | None:
+    """Assets from ``path``, or None if missing, unreadable or stale."""
+    try:
+        with np.load(path) as z:
+            meta = json.loads(z["meta"].tobytes())
+            rs_range, rs_table = z["rs_range"], z["rs_table"]
+            methods = meta["methods"]
+            parts = {k: {m: _readonly(z[f"{k}_{i}"]) for i, m in enumerate(methods)}
+                     for k in ("curve", "divergence", "table")}
+    except (OSError, ValueError, KeyError):
+        return None
+    if (meta["version"] != engine_version() or not np.array_equal(rs_range, RS_RANGE)
+            or not np.array_equal(rs_table, RS_TABLE)):
+        return None
+    return ReferenceAssets(version=meta["version"], rs_range=_readonly(rs_range),
+                           curves=parts["curve"], divergence=parts["divergence"],
+                           rs_table=_readonly(rs_table), table=parts["table"])
+
+
+_assets: ReferenceAssets | None = None
+_lock = threading.Lock()
+
+def reference_assets() -> ReferenceAssets:
+    """The process-wide reference data (from ``$KFACTOR_REFERENCE_ASSETS`` if valid)."""
+    global _assets
+    if _assets is None:
+        with _lock:
+            if _assets is None:
+                path = os.environ.get(ASSETS_ENV)
+                _assets = (path and load_reference_assets(path)) or build_reference_assets()
+    return _assets
+
+
+def main(argv=None) -> int:
+    import argparse
+    parser = argparse.ArgumentParser(prog="python -m kfactor.reference",
+                                     description="Compile the static reference-curve assets.")
+    parser.add_argument("--out", required=True, help="destination .npz file")
+    args = parser.parse_args(argv)
+    path = save_reference_assets(build_reference_assets(), args.out)
+    print(f"wrote {path} ({path.stat().st_size} bytes)")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,48 @@
+"""Command-line refit of calibrated K curves (see :mod:`kfactor.curves`).
+
+    python -m kfactor.refit fit shop.csv --by material press
+    python -m kfactor.refit fit shop.parquet --dry-run
+    python -m kfactor.refit list
+"""
+import argparse
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+from .curves import DEFAULT_REGISTRY, REGISTRY_ENV, CurveRegistry, fit_curves
+
+def build_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(prog="python -m kfactor.refit",
+                                description="Fit and list calibrated logistic K curves.")
+    p.add_argument("--registry", default=None, help=f"registry directory (default ${REGISTRY_ENV} or {DEFAULT_REGISTRY})")
+    sub = p.add_subparsers(dest="command", required=True)
+    fit = sub.add_parser("fit", help="fit curves from a CSV/Parquet table and store new versions")
+    fit.add_argument("src", help="table with k and r_s (or r and t) columns")
+    fit.add_argument("--by", nargs="*", default=["material"], help="grouping columns (default: material)")
+    fit.add_argument("--dry-run", action="store_true", help="fit and report without saving")
+    sub.add_parser("list", help="list stored curves and their latest version")
+    return p
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    registry = CurveRegistry(args.registry)
+    if args.command == "list":
+        for name in registry.names():
+            v = registry.latest(name)
+            print(f"{v.method:<40s} n={v.n:<9d} rmse={v.rmse:.2e}  {v.created}")
+        return 0
+
+    src = Path(args.src)
+    table = pd.read_parquet(src) if src.suffix.lower() in {".parquet", ".pq"} else pd.read_csv(src)
+    fits = fit_curves(table, by=args.by, registry=registry, save=not args.dry_run,
+                      meta={"source": src.name})
+    for name, fit in fits.items():
+        a, b, c, d = fit.coeffs
+        flag = "" if fit.converged else "  (not converged)"
+        print(f"{name:<32s} a={a:.6f} b={b:.6f} c={c:.6f} d={d:.6f} "
+              f"rmse={fit.rmse:.2e} n={fit.n} it={fit.iterations}{flag}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
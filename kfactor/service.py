@@ -0,0 +1,354 @@
+"""HTTP/JSON calculation service on top of the engine.
+
+Standard library only (asyncio streams + json); no web framework needed::
+
+    python -m kfactor.service --port 8000
+
+Endpoints (all JSON, floats in the request units; ``null`` where a value
+is undefined, e.g. springback without a known material):
+
+``GET  /health``             liveness and engine version
+``GET  /v1/methods``         K methods and material names
+``POST /v1/bend``            one bend: ``{"r", "t", "angle", "method"?, "material"?}``
+``POST /v1/bends``           many bends, columnar (``{"r": [...], "t": [...], ...}``)
+                             or row-wise (``{"bends": [{...}, ...]}``)
+``POST /v1/flat-pattern``    one part ``{"flanges", "angles", "radii", "t", "k"?,
+                             "method"?, "dims"?}`` or ``{"parts": [...], "dims"?}``
+
+Single-bend requests that arrive close together are coalesced by a
+:class:`kfactor.dispatch.BendBatcher`: they are queued for at most
+``window`` seconds (or until ``max_batch`` are waiting) and then evaluated
+with one :func:`kfactor.batch.compute_batch` call.
+"""
+import argparse
+import asyncio
+import json
+import logging
+import math
+import sys
+from http import HTTPStatus
+
+import numpy as np
+
+from . import __version__
+from .batch import BATCH_OUTPUTS, compute_batch
+from .dispatch import DEFAULT_MAX_BATCH, DEFAULT_WINDOW, BendBatcher
+from .flat import FLANGE_DIMS, flat_patterns
+from .materials import default_store
+from .methods import METHOD_REGISTRY
+
+MAX_BODY = 16 * 1024 * 1024
+
+log = logging.getLogger("kfactor.service")
+
+
+class RequestError(ValueError):
+    """A client error, reported as ``status`` with a JSON ``error`` message."""
+
+    def __init__(self, message: str, status: HTTPStatus = HTTPStatus.BAD_REQUEST):
+        super().__init__(message)
+        self.status = status
+
+
+def _nan_to_none(values) -> list:
+    return [v if math.isfinite(v) else None for v in np.asarray(values, dtype=float).tolist()]
+
+def _finite_or_none(value: float) -> float | None:
+    return value if math.isfinite(value) else None
+
+def _text(obj: dict, key: str, default: str = "") -> str:
+    value = obj.get(key)
+    if value is None or value == "":
+        return default
+    if not isinstance(value, str):
+        raise RequestError(f"field {key!r} must be a string")
+    return value
+
+def _is_number(value) -> bool:
+    # Exact types: float() would also take "2", "nan" and true, and bool is an int.
+    return type(value) in (int, float)
+
+def _check_numbers(value, allow_null: bool = False) -> None:
+    """Raise TypeError unless ``value`` is a number or a (nested) list of numbers."""
+    if isinstance(value, list):
+        for v in value:
+            _check_numbers(v, allow_null)
+    elif not (_is_number(value) or (allow_null and value is None)):
+        raise TypeError(value)
+
+def _number(obj: dict, key: str, default=None) -> float:
+    value = obj.get(key, default)
+    if value is None:
+        raise RequestError(f"missing field {key!r}")
+    if not _is_number(value):
+        raise RequestError(f"field {key!r} must be a number")
+    try:
+        value = float(value)
+    except OverflowError:
+        value = math.inf
+    if not math.isfinite(value):
+        raise RequestError(f"field {key!r} must be finite")
+    return value
+
+def _method(obj: dict, default: str = "Logistic fit") -> str:
+    method = _text(obj, "method", default)
+    if method not in METHOD_REGISTRY:
+        raise RequestError(f"unknown method {method!r}; expected one of "
+                           f"{METHOD_REGISTRY.names()} or 'curve:<name>'")
+    return method
+
+def _bend_row(obj) -> tuple:
+    if not isinstance(obj, dict):
+        raise RequestError("a bend must be a JSON object")
+    r, t, angle = _number(obj, "r"), _number(obj, "t"), _number(obj, "angle")
+    if t <= 0:
+        raise RequestError("t must be positive")
+    return r, t, angle, _method(obj), _text(obj, "material")
+
+
+# ─── Handlers ────────────────────────────────────────────────────────────
+def bends_table(body: dict) -> dict:
+    """Validate a /v1/bends body into a compute_batch table."""
+    if "bends" in body:
+        if not isinstance(body["bends"], list):
+            raise RequestError("'bends' must be a list")
+        rows = [_bend_row(b) for b in body["bends"]]
+        r, t, angle, method, material = zip(*rows) if rows else ((),) * 5
+        return {"r": np.array(r, dtype=float), "t": np.array(t, dtype=float),
+                "angle": np.array(angle, dtype=float), "method": np.array(method, dtype=str),
+                "material": np.array(material, dtype=str)}
+
+    table = {}
+    try:
+        for name in ("r", "t", "angle"):
+            if name not in body:
+                raise RequestError(f"missing column {name!r}")
+            _check_numbers(body[name])
+            table[name] = np.asarray(body[name], dtype=float).reshape(-1)
+    except (TypeError, ValueError, OverflowError) as exc:
+        if isinstance(exc, RequestError):
+            raise
+        raise RequestError("columns r, t and angle must be lists of numbers") from None
+    n = len(table["r"])
+    if any(len(col) != n for col in table.values()):
+        raise RequestError("columns r, t and angle must have the same length")
+    if not np.isfinite(np.concatenate(list(table.values()))).all() or (table["t"] <= 0).any():
+        raise RequestError("r, t and angle must be finite and t positive")
+    for name in ("method", "material"):
+        value = body.get(name)
+        if isinstance(value, list):
+            if len(value) != n:
+                raise RequestError(f"column {name!r} must have {n} entries")
+            if not all(v is None or isinstance(v, str) for v in value):
+                raise RequestError(f"column {name!r} must hold strings")
+            table[name] = np.array([v or "" for v in value], dtype=str)
+        elif value is not None:
+            table[name] = np.full(n, _text(body, name))
+    if "method" in table:
+        table["method"] = np.where(table["method"] == "", "Logistic fit", table["method"])
+        unknown = [m for m in np.unique(table["method"]).tolist() if m not in METHOD_REGISTRY]
+        if unknown:
+            raise RequestError(f"unknown method(s) {sorted(unknown)}")
+    return table
+
+def _part(obj) -> dict:
+    if not isinstance(obj, dict):
+        raise RequestError("a part must be a JSON object")
+    try:
+        for key in ("angles", "flanges", "radii", "t"):
+            _check_numbers(obj[key])
+        _check_numbers(obj.get("k"), allow_null=True)
+        angles  = np.atleast_1d(np.asarray(obj["angles"], dtype=float))
+        flanges = np.asarray(obj["flanges"], dtype=float).reshape(-1)
+        radii   = np.broadcast_to(np.asarray(obj["radii"], dtype=float), angles.shape)
+        t       = np.broadcast_to(np.asarray(obj["t"], dtype=float), angles.shape)
+        k       = obj.get("k")
+        k = (np.full(angles.shape, np.nan) if k is None else
+             np.broadcast_to(np.array(k, dtype=float), angles.shape))
+    except KeyError as exc:
+        raise RequestError(f"missing field {exc.args[0]!r}") from None
+    except (TypeError, ValueError, OverflowError):
+        raise RequestError("angles, flanges, radii, t and k must be numbers or lists of numbers") from None
+    if len(flanges) != len(angles) + 1:
+        raise RequestError(f"a part with {len(angles)} bends needs {len(angles) + 1} flanges")
+    if (t <= 0).any():
+        raise RequestError("t must be positive")
+    return {"flanges": flanges, "angles": angles, "radii": radii, "t": t, "k": k,
+            "method": _method(obj)}
+
+def bends_response(body: dict) -> dict:
+    out = compute_batch(bends_table(body))
+    return {name: _nan_to_none(out[name]) for name in BATCH_OUTPUTS}
+
+def flat_pattern_response(body: dict) -> dict:
+    dims = body.get("dims", "flat")
+    if not isinstance(dims, str) or dims not in FLANGE_DIMS:
+        raise RequestError(f"dims must be one of {list(FLANGE_DIMS)}")
+    single = "parts" not in body
+    if not single and not isinstance(body["parts"], list):
+        raise RequestError("'parts' must be a list")
+    parts = [_part(body)] if single else [_part(p) for p in body["parts"]]
+    if not parts:
+        return {"parts": []}
+    n_bends = np.array([len(p["angles"]) for p in parts])
+    cat = {key: np.concatenate([p[key] for p in parts])
+           for key in ("flanges", "angles", "radii", "t", "k")}
+    methods = np.repeat([p["method"] for p in parts], n_bends)
+    out = flat_patterns(n_bends, cat["flanges"], cat["angles"], cat["radii"], cat["t"],
+                        k=cat["k"], method=methods if len(methods) else "Logistic fit", dims=dims)
+
+    bend_splits   = np.cumsum(n_bends)[:-1]
+    flange_splits = np.cumsum(n_bends + 1)[:-1]
+    per_bend = {key: np.split(out[key], bend_splits) for key in ("K", "BA", "BD", "OSSB")}
+    segments = np.split(out["segments"], flange_splits)
+    # Degenerate geometry (e.g. negative radii) yields NaN; JSON gets null.
+    results = [{"length": _finite_or_none(float(out["length"][i])),
+                "segments": _nan_to_none(segments[i]),
+                **{key: _nan_to_none(per_bend[key][i]) for key in per_bend}}
+               for i in range(len(parts))]
+    return results[0] if single else {"parts": results}
+
+
+class Service:
+    """Routes requests to handlers; one instance per server."""
+
+    def __init__(self, window: float = DEFAULT_WINDOW, max_batch: int = DEFAULT_MAX_BATCH):
+        self.batcher = BendBatcher(window, max_batch)
+        self.routes = {
+            ("GET",  "/health"):          self.health,
+            ("GET",  "/v1/methods"):      self.methods,
+            ("POST", "/v1/bend"):         self.bend,
+            ("POST", "/v1/bends"):        self.bends,
+            ("POST", "/v1/flat-pattern"): self.flat_pattern,
+        }
+
+    async def health(self, body):
+        return {"status": "ok", "version": __version__}
+
+    async def methods(self, body):
+        return {"methods": [m.info() for m in METHOD_REGISTRY], "materials": list(default_store())}
+
+    async def bend(self, body):
+        result = await self.batcher.asubmit(_bend_row(body))
+        return {name: _finite_or_none(v) for name, v in result.items()}
+
+    # Batch bodies run on the loop's default thread pool so a large one
+    # doesn't hold up the other connections.
+    async def bends(self, body):
+        return await asyncio.get_running_loop().run_in_executor(None, bends_response, body)
+
+    async def flat_pattern(self, body):
+        return await asyncio.get_running_loop().run_in_executor(None, flat_pattern_response, body)
+
+    async def dispatch(self, method: str, path: str, raw: bytes) -> tuple[HTTPStatus, dict]:
+        handler = self.routes.get((method, path))
+        if handler is None:
+            if any(p == path for _, p in self.routes):
+                return HTTPStatus.METHOD_NOT_ALLOWED, {"error": f"{method} not allowed on {path}"}
+            return HTTPStatus.NOT_FOUND, {"error": f"no route {path}"}
+        try:
+            body = json.loads(raw) if raw else {}
+            if not isinstance(body, dict):
+                raise RequestError("request body must be a JSON object")
+            return HTTPStatus.OK, await handler(body)
+        except json.JSONDecodeError as exc:
+            return HTTPStatus.BAD_REQUEST, {"error": f"invalid JSON: {exc.msg}"}
+        except RequestError as exc:
+            return exc.status, {"error": str(exc)}
+        except ValueError as exc:
+            return HTTPStatus.BAD_REQUEST, {"error": str(exc)}
+        except Exception:
+            log.exception("%s %s failed", method, path)
+            return HTTPStatus.INTERNAL_SERVER_ERROR, {"error": "internal server error"}
+
+    # ─── HTTP/1.1 ────────────────────────────────────────────────────────
+    async def handle_connection(self, reader: asyncio.StreamReader,
+                                writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    break
+                lines = head.decode("latin-1").split("\r\n")
+                try:
+                    method, target, version = lines[0].split(" ", 2)
+                except ValueError:
+                    await self._respond(writer, HTTPStatus.BAD_REQUEST, {"error": "bad request line"}, False)
+                    break
+                headers = {}
+                for line in lines[1:]:
+                    if ":" in line:
+                        key, value = line.split(":", 1)
+                        headers[key.strip().lower()] = value.strip()
+                keep_alive = (headers.get("connection", "").lower() != "close"
+                              if version == "HTTP/1.1" else
+                              headers.get("connection", "").lower() == "keep-alive")
+
+                try:
+                    length = int(headers.get("content-length") or 0)
+                    if length < 0:
+                        raise ValueError(length)
+                except ValueError:
+                    await self._respond(writer, HTTPStatus.BAD_REQUEST, {"error": "bad Content-Length"}, False)
+                    break
+                if length > MAX_BODY:
+                    await self._respond(writer, HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                                        {"error": f"body exceeds {MAX_BODY} bytes"}, False)
+                    break
+                raw = await reader.readexactly(length) if length else b""
+                status, payload = await self.dispatch(method, target.split("?", 1)[0], raw)
+                await self._respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _respond(writer: asyncio.StreamWriter, status: HTTPStatus, payload: dict,
+                       keep_alive: bool) -> None:
+        body = json.dumps(payload, separators=(",", ":")).encode()
+        writer.write(
+            f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode() + body
+        )
+        await writer.drain()
+
+
+async def serve(host: str = "127.0.0.1", port: int = 8000, window: float = DEFAULT_WINDOW,
+                max_batch: int = DEFAULT_MAX_BATCH) -> None:
+    service = Service(window, max_batch)
+    server = await asyncio.start_server(service.handle_connection, host, port)
+    addrs = ", ".join(str(s.getsockname()) for s in server.sockets)
+    print(f"kfactor service {__version__} listening on {addrs}", file=sys.stderr)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.batcher.close()
+
+def build_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(prog="python -m kfactor.service",
+                                description="HTTP/JSON K-factor, BA/BD and flat-pattern service.")
+    p.add_argument("--host", default="127.0.0.1", help="bind address (default 127.0.0.1)")
+    p.add_argument("--port", type=int, default=8000, help="port (default 8000)")
+    p.add_argument("--window-ms", type=float, default=DEFAULT_WINDOW * 1e3,
+                   help="coalescing window for /v1/bend in ms (default %(default)s)")
+    p.add_argument("--max-batch", type=int, default=DEFAULT_MAX_BATCH,
+                   help="flush a coalesced batch at this many requests (default %(default)s)")
+    return p
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port, args.window_ms / 1e3, args.max_batch))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
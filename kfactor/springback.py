@@ -0,0 +1,71 @@
+"""Springback over whole sweeps and overbend compensation per bend.
+
+:func:`kfactor.engine.springback_angle` broadcasts, so a sweep over angles,
+radii or materials is one call. :func:`overbend_angle` inverts it: the
+commanded (press-brake) angle θc whose sprung-back result hits a target
+final angle θf,
+
+    θc − Δθ(θc) = θf
+
+solved by Newton iteration on every bend at once. Bends that have
+converged drop out of the active set, so a few hard rows don't keep the
+whole batch iterating. ``springback`` may be any vectorised model
+``f(angle, r, t, yield_mpa, E_mpa) -> Δθ``; for the default
+Gardiner-style estimate (Δθ proportional to θ) the first step is exact.
+"""
+from typing import Callable
+
+import numpy as np
+
+from .batch import _column, encode_materials
+from .engine import springback_angle
+
+SpringbackModel = Callable[..., np.ndarray]
+
+def overbend_angle(target_deg, r, t, yield_mpa, E_mpa=200_000,
+                   springback: SpringbackModel = springback_angle,
+                   tol: float = 1e-9, max_iter: int = 50) -> np.ndarray:
+    """Commanded angle per bend so that the angle after springback is ``target_deg``.
+
+    All arguments broadcast. Returns NaN where the iteration does not
+    converge — e.g. a material/geometry with Δθ ≥ θ, or a missing yield
+    strength.
+    """
+    target, r, t, sy, E = np.broadcast_arrays(*(np.asarray(x, dtype=float)
+                                                for x in (target_deg, r, t, yield_mpa, E_mpa)))
+    shape = target.shape
+    target, r, t, sy, E = (x.ravel() for x in (target, r, t, sy, E))
+    cmd = target + springback(target, r, t, sy, E)
+    out = np.full(target.shape, np.nan)
+    active = np.flatnonzero(np.isfinite(cmd))
+    for _ in range(max_iter):
+        if not active.size:
+            break
+        c, args = cmd[active], (r[active], t[active], sy[active], E[active])
+        g = c - springback(c, *args) - target[active]
+        h = 1e-6 * np.maximum(1.0, np.abs(c))
+        dg = 1 - (springback(c + h, *args) - springback(c - h, *args)) / (2 * h)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            step = g / dg
+        bad = ~np.isfinite(step) | (dg <= 0)
+        cmd[active] = c - np.where(bad, 0.0, step)
+        done = ~bad & (np.abs(step) <= tol * np.maximum(1.0, np.abs(c)))
+        out[active[done]] = cmd[active[done]]
+        active = active[~done & ~bad]
+    return out.reshape(shape)
+
+def compensate_bends(table, springback: SpringbackModel = springback_angle, **kwargs) -> dict:
+    """Overbend compensation for a columnar table of bends.
+
+    ``table`` holds ``angle`` (the target final angle), ``r``, ``t`` and
+    ``material`` (names or material IDs). Returns ``commanded`` angles and
+    the ``springback`` each commanded bend will show; both are NaN for
+    unknown materials.
+    """
+    angle = _column(table, "angle").astype(float, copy=False)
+    r     = _column(table, "r").astype(float, copy=False)
+    t     = _column(table, "t").astype(float, copy=False)
+    codes, yield_u, E_u = encode_materials(_column(table, "material"))
+    sy, E = yield_u[codes], E_u[codes]
+    commanded = overbend_angle(angle, r, t, sy, E, springback=springback, **kwargs)
+    return {"commanded": commanded, "springback": commanded - angle}
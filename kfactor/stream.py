@@ -0,0 +1,140 @@
+"""Streaming bend-table processor.
+
+Reads CSV or Parquet in fixed-size chunks, evaluates each chunk with
+:func:`kfactor.batch.compute_batch` and appends the result to the output
+file, so peak memory is bounded by the chunk size rather than the input.
+
+    python -m kfactor.stream bends.parquet priced.parquet --chunksize 500000
+    python -m kfactor.stream bends.csv priced.csv --workers 0   # all cores
+"""
+import argparse
+import sys
+from concurrent.futures import Executor, ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterator
+
+import pandas as pd
+
+from .batch import BATCH_OUTPUTS, compute_batch
+from .methods import METHOD_REGISTRY
+from .parallel import compute_batch_parallel, default_workers
+
+PARQUET_SUFFIXES = {".parquet", ".pq"}
+TEXT_COLUMNS = {"material": str, "method": str}
+# Pinned so every chunk (and so the Parquet schema) agrees, even when the
+# first chunk happens to hold only whole numbers.
+NUMERIC_COLUMNS = {"r": "float64", "t": "float64", "angle": "float64"}
+
+def _is_parquet(path) -> bool:
+    return Path(path).suffix.lower() in PARQUET_SUFFIXES
+
+def _pyarrow():
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as exc:
+        raise ImportError("Parquet input/output needs pyarrow: pip install pyarrow") from exc
+    return pa, pq
+
+def iter_chunks(path, chunksize: int) -> Iterator[pd.DataFrame]:
+    if _is_parquet(path):
+        _, pq = _pyarrow()
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize):
+            df = batch.to_pandas()
+            yield df.astype({c: d for c, d in NUMERIC_COLUMNS.items() if c in df}, copy=False)
+    else:
+        yield from pd.read_csv(path, chunksize=chunksize, dtype={**NUMERIC_COLUMNS, **TEXT_COLUMNS})
+
+def process_chunk(df: pd.DataFrame, method: str = "Logistic fit",
+                  executor: Executor | None = None, shard_size: int | None = None) -> pd.DataFrame:
+    if "method" in df:
+        df = df.assign(method=df["method"].fillna(method))
+    if executor is None:
+        return df.assign(**compute_batch(df, method))
+    # Same split as stream_file, with one shard per CPU.
+    shard_size = shard_size or max(1, -(-len(df) // default_workers()))
+    return df.assign(**compute_batch_parallel(df, method, chunksize=shard_size, executor=executor))
+
+class ChunkWriter:
+    """Appends DataFrame chunks to a CSV or Parquet file."""
+
+    def __init__(self, path):
+        self.path = path
+        self._parquet = _is_parquet(path)
+        self._writer = None
+        self._started = False
+
+    def write(self, df: pd.DataFrame) -> None:
+        if self._parquet:
+            pa, pq = _pyarrow()
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            if self._writer is None:
+                self._writer = pq.ParquetWriter(self.path, table.schema)
+            self._writer.write_table(table.cast(self._writer.schema))
+        else:
+            df.to_csv(self.path, mode="a" if self._started else "w",
+                      header=not self._started, index=False)
+        self._started = True
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def stream_file(src, dst, chunksize: int = 250_000, method: str = "Logistic fit",
+                workers: int = 1, shard_size: int | None = None) -> int:
+    """Process ``src`` into ``dst`` chunk by chunk; returns the number of rows written.
+
+    With ``workers > 1`` each chunk is split into ``shard_size`` row shards
+    (default: an even split across workers) and evaluated on a process pool
+    that lives for the whole run.
+    """
+    shard_size = shard_size or max(1, -(-chunksize // max(workers, 1)))
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    rows = 0
+    try:
+        with ChunkWriter(dst) as writer:
+            for chunk in iter_chunks(src, chunksize):
+                writer.write(process_chunk(chunk, method, executor, shard_size))
+                rows += len(chunk)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    return rows
+
+def build_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(
+        prog="python -m kfactor.stream",
+        description="Append " + "/".join(BATCH_OUTPUTS) + " columns to a CSV or Parquet bend table "
+                    "(columns r, t, angle and optional material, method).",
+    )
+    p.add_argument("src", help="input .csv or .parquet")
+    p.add_argument("dst", help="output .csv or .parquet")
+    p.add_argument("--chunksize", type=int, default=250_000, help="rows per chunk (default 250000)")
+    p.add_argument("--method", default="Logistic fit",
+                   help="K method for rows without a method column/value: one of "
+                        + ", ".join(METHOD_REGISTRY.names()) + " or curve:<name>[@<version>]")
+    p.add_argument("--workers", type=int, default=1,
+                   help="worker processes; 0 = one per CPU (default 1)")
+    p.add_argument("--shard-size", type=int, default=None,
+                   help="rows per worker task (default: chunksize / workers)")
+    return p
+
+def main(argv=None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.method not in METHOD_REGISTRY:
+        parser.error(f"unknown --method {args.method!r}")
+    workers = args.workers or default_workers()
+    rows = stream_file(args.src, args.dst, args.chunksize, args.method, workers, args.shard_size)
+    print(f"{rows} rows -> {args.dst}", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
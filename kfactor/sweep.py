@@ -0,0 +1,304 @@
+"""Design-space sweeps: every output over a Cartesian product of inputs.
+
+:func:`sweep` evaluates K, BA, BD, OSSB and springback over every
+combination of ``method × material × t × r × angle`` and returns a
+:class:`ResultCube`, a labelled N-D array with one axis per input::
+
+    from kfactor.sweep import sweep
+    cube = sweep(r=np.linspace(0.5, 12, 400), t=[0.8, 1, 1.5, 2, 3],
+                 angle=np.arange(1, 181), material=["Steel – SS 304", "Aluminum 5052-H32"],
+                 method=["Logistic fit", "DIN 6935 empirical"])
+    cube.sel(material="Steel – SS 304", t=1.5)["BA"]      # (method, r, angle)
+    cube.sel(r=slice(1, 4), angle=90).to_frame()
+
+The work is split along the axes. K is evaluated once per (method, t, r),
+not once per point. Each output block is then a broadcast over
+``r × angle``, computed ``chunk_points`` at a time. Cubes larger than
+``max_memory`` bytes (or any cube given ``path``) are written to ``.npy``
+files and memory-mapped, so a 10⁸-point sweep needs only one chunk of RAM.
+A cube spilled to a temporary directory owns it: the directory is removed
+by :meth:`ResultCube.close` (or leaving a ``with`` block), or when the cube
+is garbage-collected. :func:`open_cube` reopens a saved cube, also
+memory-mapped.
+
+    python -m kfactor.sweep --r 0.5:12:400 --t 1,1.5,2 --angle 1:180:180 \\
+        --material "Steel – SS 304" --method "Logistic fit" --out cube/
+"""
+import argparse
+import itertools
+import json
+import shutil
+import sys
+import tempfile
+import weakref
+from pathlib import Path
+
+import numpy as np
+
+from .batch import BATCH_OUTPUTS, encode_materials
+from .engine import springback_angle
+from .methods import METHOD_REGISTRY
+
+SWEEP_DIMS = ("method", "material", "t", "r", "angle")
+NUMERIC_DIMS = ("t", "r", "angle")
+DEFAULT_CHUNK_POINTS = 1 << 22
+DEFAULT_MAX_MEMORY = 1 << 30
+
+
+class ResultCube:
+    """Outputs on a labelled grid: ``dims`` names the axes, ``coords[dim]`` labels each one.
+
+    ``cube[output]`` is the N-D array (a memory map for on-disk cubes).
+    :meth:`sel` and :meth:`isel` return cubes that are views; nothing is
+    read from disk until the values are used. ``temporary=True`` makes the
+    cube own ``path`` and delete it on :meth:`close` or garbage collection.
+    """
+
+    def __init__(self, dims: tuple[str, ...], coords: dict[str, np.ndarray],
+                 data: dict[str, np.ndarray], path: Path | None = None, temporary: bool = False):
+        self.dims = tuple(dims)
+        self.coords = {d: np.asarray(coords[d]) for d in self.dims}
+        self.data = data
+        self.path = path
+        for name, arr in data.items():
+            if arr.shape != self.shape:
+                raise ValueError(f"output {name!r} has shape {arr.shape}, expected {self.shape}")
+        self._cleanup = (weakref.finalize(self, shutil.rmtree, path, ignore_errors=True)
+                         if temporary and path is not None else None)
+
+    def close(self) -> None:
+        """Delete the temporary directory of a spilled cube; its outputs can't be read afterwards.
+
+        Cubes that live in memory or under a caller-given path are left as they are.
+        """
+        if self._cleanup is not None:
+            self.data = {}
+            self._cleanup()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return tuple(len(self.coords[d]) for d in self.dims)
+
+    @property
+    def size(self) -> int:
+        return int(np.prod(self.shape))
+
+    @property
+    def outputs(self) -> tuple[str, ...]:
+        return tuple(self.data)
+
+    def __getitem__(self, output: str) -> np.ndarray:
+        return self.data[output]
+
+    def __repr__(self) -> str:
+        axes = ", ".join(f"{d}: {n}" for d, n in zip(self.dims, self.shape))
+        where = f" at {self.path}" if self.path else ""
+        return f"<ResultCube ({axes}) outputs={list(self.data)}{where}>"
+
+    # ── indexing ──
+    def isel(self, **indexers) -> "ResultCube":
+        """Select by position: an int drops the axis, a slice or int array keeps it."""
+        unknown = set(indexers) - set(self.dims)
+        if unknown:
+            raise KeyError(f"unknown dimension(s) {sorted(unknown)}; cube has {self.dims}")
+        key, dims, coords = [], [], {}
+        for d in self.dims:
+            ix = indexers.get(d, slice(None))
+            if isinstance(ix, (int, np.integer)):
+                key.append(int(ix))
+                continue
+            if not isinstance(ix, slice):
+                ix = np.asarray(ix, dtype=np.intp)
+            key.append(ix)
+            dims.append(d)
+            coords[d] = self.coords[d][ix]
+        # Apply one axis at a time: NumPy would otherwise pair up several
+        # integer-array indexers element-wise instead of taking their product.
+        data = {}
+        for name, arr in self.data.items():
+            axis = 0
+            for ix in key:
+                arr = arr[(slice(None),) * axis + (ix,)]
+                axis += not isinstance(ix, int)
+            data[name] = arr
+        return ResultCube(tuple(dims), coords, data)
+
+    def _positions(self, dim: str, label):
+        coord = self.coords[dim]
+        if dim not in NUMERIC_DIMS:
+            labels = coord.tolist()
+            if isinstance(label, (list, tuple, np.ndarray)):
+                return np.array([labels.index(v) for v in label], dtype=np.intp)
+            if label not in labels:
+                raise KeyError(f"{label!r} is not on the {dim!r} axis")
+            return labels.index(label)
+        if isinstance(label, slice):
+            lo = -np.inf if label.start is None else label.start
+            hi = np.inf if label.stop is None else label.stop
+            return np.flatnonzero((coord >= lo) & (coord <= hi))
+        nearest = lambda v: int(np.argmin(np.abs(coord - v)))
+        if np.ndim(label):
+            return np.array([nearest(v) for v in label], dtype=np.intp)
+        return nearest(label)
+
+    def sel(self, **indexers) -> "ResultCube":
+        """Select by label.
+
+        Text axes (method, material) match exactly. Numeric axes take the
+        nearest coordinate for a scalar or list, and an inclusive value range
+        for a slice (``r=slice(1, 4)``). A scalar drops the axis.
+        """
+        unknown = set(indexers) - set(self.dims)
+        if unknown:
+            raise KeyError(f"unknown dimension(s) {sorted(unknown)}; cube has {self.dims}")
+        return self.isel(**{d: self._positions(d, v) for d, v in indexers.items()})
+
+    # ── export ──
+    def to_frame(self, max_rows: int = 10_000_000):
+        """Long-form DataFrame with one column per axis and per output (needs pandas)."""
+        import pandas as pd
+        if self.size > max_rows:
+            raise ValueError(f"{self.size} rows exceeds max_rows={max_rows}; select a smaller slice first")
+        grids = np.meshgrid(*(self.coords[d] for d in self.dims), indexing="ij")
+        cols = {d: g.ravel() for d, g in zip(self.dims, grids)}
+        cols.update({name: np.asarray(arr).ravel() for name, arr in self.data.items()})
+        return pd.DataFrame(cols)
+
+    def save(self, path) -> Path:
+        """Write the cube as ``.npy`` files plus ``cube.json``; returns the directory."""
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        for name, arr in self.data.items():
+            target = path / f"{name}.npy"
+            if not (isinstance(arr, np.memmap) and Path(arr.filename) == target.resolve()):
+                np.save(target, arr)
+        _write_meta(path, self.dims, self.coords, tuple(self.data))
+        return path
+
+
+def _write_meta(path: Path, dims, coords, outputs) -> None:
+    meta = {"dims": list(dims), "outputs": list(outputs),
+            "coords": {d: np.asarray(coords[d]).tolist() for d in dims}}
+    (path / "cube.json").write_text(json.dumps(meta))
+
+def open_cube(path, mmap: bool = True) -> ResultCube:
+    """Reopen a cube written by :func:`sweep` or :meth:`ResultCube.save`."""
+    path = Path(path)
+    meta = json.loads((path / "cube.json").read_text())
+    data = {name: np.load(path / f"{name}.npy", mmap_mode="r" if mmap else None)
+            for name in meta["outputs"]}
+    return ResultCube(tuple(meta["dims"]), meta["coords"], data, path)
+
+
+# ─── Evaluation ──────────────────────────────────────────────────────────
+def sweep(r, t, angle, material=None, method=("Logistic fit",), outputs=BATCH_OUTPUTS,
+          path=None, dtype=np.float64, chunk_points: int = DEFAULT_CHUNK_POINTS,
+          max_memory: int = DEFAULT_MAX_MEMORY) -> ResultCube:
+    """Evaluate ``outputs`` over the product of the given axis values.
+
+    ``material=None`` leaves out the material axis and the springback
+    output. Each output array is ``dtype``. The cube lives in memory unless
+    it would exceed ``max_memory`` bytes or ``path`` is given. In that case
+    it is written under ``path`` and memory-mapped; without a ``path`` it
+    goes to a temporary directory that the returned cube owns (see
+    :meth:`ResultCube.close`).
+    """
+    axes = {"method": np.array([str(m) for m in np.atleast_1d(method)]),
+            "material": None if material is None else np.array([str(m) for m in np.atleast_1d(material)]),
+            "t": np.atleast_1d(np.asarray(t, dtype=float)),
+            "r": np.atleast_1d(np.asarray(r, dtype=float)),
+            "angle": np.atleast_1d(np.asarray(angle, dtype=float))}
+    dims = tuple(d for d in SWEEP_DIMS if axes[d] is not None)
+    coords = {d: axes[d] for d in dims}
+    outputs = tuple(o for o in outputs if o != "springback" or material is not None)
+    unknown = set(outputs) - set(BATCH_OUTPUTS)
+    if unknown:
+        raise ValueError(f"unknown output(s) {sorted(unknown)}; expected some of {BATCH_OUTPUTS}")
+    kernels = [METHOD_REGISTRY.get(m).vec for m in coords["method"]]
+    shape = tuple(len(coords[d]) for d in dims)
+
+    itemsize = np.dtype(dtype).itemsize
+    temporary = path is None and np.prod(shape, dtype=float) * itemsize * len(outputs) > max_memory
+    if temporary:
+        path = tempfile.mkdtemp(prefix="kfactor-sweep-")
+    if path is None:
+        data = {o: np.empty(shape, dtype=dtype) for o in outputs}
+    else:
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        data = {o: np.lib.format.open_memmap(path / f"{o}.npy", mode="w+", dtype=dtype, shape=shape)
+                for o in outputs}
+
+    r_ax, t_ax, alpha = coords["r"], coords["t"], np.radians(coords["angle"])
+    angle_ax = coords["angle"]
+    if material is not None:
+        codes, yield_u, E_u = encode_materials(coords["material"])
+        sy, E = yield_u[codes], E_u[codes]
+    rows = max(1, chunk_points // len(angle_ax))        # r values per chunk
+
+    lead = [range(len(coords[d])) for d in dims[:-2]]   # method, [material,] t
+    for ix in itertools.product(*lead):
+        i_m, i_t = ix[0], ix[-1]
+        i_mat = ix[1] if material is not None else None
+        t_k = t_ax[i_t]
+        for r0 in range(0, len(r_ax), rows):
+            r_blk = r_ax[r0:r0 + rows, None]
+            K = kernels[i_m](r_blk / t_k)
+            block = {}
+            if "K" in outputs:
+                block["K"] = np.broadcast_to(K, (len(r_blk), len(angle_ax)))
+            if {"BA", "BD"} & set(outputs):
+                block["BA"] = alpha * (r_blk + K * t_k)
+            if {"OSSB", "BD"} & set(outputs):
+                block["OSSB"] = np.tan(alpha / 2) * (r_blk + t_k)
+            if "BD" in outputs:
+                block["BD"] = 2 * block["OSSB"] - block["BA"]
+            if "springback" in outputs:
+                block["springback"] = springback_angle(angle_ax, r_blk, t_k, sy[i_mat], E[i_mat])
+            for o in outputs:
+                data[o][ix + (slice(r0, r0 + rows), slice(None))] = block[o]
+
+    if path is not None:
+        for arr in data.values():
+            arr.flush()
+        _write_meta(path, dims, coords, outputs)
+    return ResultCube(dims, coords, data, path, temporary=temporary)
+
+
+# ─── CLI ─────────────────────────────────────────────────────────────────
+def _axis(spec: str) -> np.ndarray:
+    """``"0.5:12:400"`` → linspace(0.5, 12, 400); ``"1,1.5,2"`` → that list."""
+    if ":" in spec:
+        start, stop, num = spec.split(":")
+        return np.linspace(float(start), float(stop), int(num))
+    return np.array([float(v) for v in spec.split(",")])
+
+def build_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(prog="python -m kfactor.sweep",
+                                description="Evaluate a design-space sweep into an on-disk result cube.")
+    p.add_argument("--r", type=_axis, required=True, help="inner radii: start:stop:num or a,b,c")
+    p.add_argument("--t", type=_axis, required=True, help="thicknesses: start:stop:num or a,b,c")
+    p.add_argument("--angle", type=_axis, required=True, help="bend angles (°): start:stop:num or a,b,c")
+    p.add_argument("--material", action="append", default=None, help="material name (repeatable)")
+    p.add_argument("--method", action="append", default=None, help="K method (repeatable; default Logistic fit)")
+    p.add_argument("--out", required=True, help="output directory")
+    p.add_argument("--float32", action="store_true", help="store outputs as float32")
+    p.add_argument("--chunk-points", type=int, default=DEFAULT_CHUNK_POINTS)
+    return p
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    cube = sweep(args.r, args.t, args.angle, args.material, args.method or ("Logistic fit",),
+                 path=args.out, dtype=np.float32 if args.float32 else np.float64,
+                 chunk_points=args.chunk_points)
+    print(f"{cube.size} points -> {cube.path}  {cube!r}", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
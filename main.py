@@ -1,9 +1,24 @@
+from types import SimpleNamespace
+
 import streamlit as st
 import numpy as np
 import pandas as pd
-import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
+
+from charts import (
+    C_GREEN, C_RED, REFERENCE, SWEEP_AXIS_TITLES,
+    build_fig1, build_fig_div, build_fig_hm_ba, build_fig_hm_bd, build_fig_mat,
+    build_fig_sb, build_fig_sweep, build_fig_xs, charts_html, reference_table, sweep_cube,
+)
+from kfactor import (
+    METHOD_REGISTRY, default_store, instrument,
+    bend_allowance, bend_deduction, describe_precision, fit_k, flat_length, k_din6935, k_for_method,
+    length_format, method_names, min_bend_radius, outside_setback, overbend_angle, snap_length,
+    springback_angle,
+)
+from kfactor.sweep import NUMERIC_DIMS
+
+# Off unless KFACTOR_PROFILE is set; see kfactor/instrument.py.
+instrument.begin_run("page")
 
 # ─── Page Config ────────────────────────────────────────────────────────────
 st.set_page_config(
@@ -14,7 +29,8 @@ st.set_page_config(
 )
 
 # ─── Design System ──────────────────────────────────────────────────────────
-st.markdown("""
+with instrument.span("style"):
+    st.markdown("""
 <style>
 @import url('https://fonts.googleapis.com/css2?family=IBM+Plex+Mono:wght@400;500&family=Plus+Jakarta+Sans:wght@400;500;600;700&display=swap');
 
@@ -159,93 +175,17 @@ p, li { color: #2d4a2d; }
 </style>
 """, unsafe_allow_html=True)
 
-# ─── Material Database ────────────────────────────────────────────────────
-MATERIALS = {
-    "Aluminum 1100-O":      {"typical_k": 0.33, "uts_mpa": 90,   "yield_mpa": 35,   "elongation": 35, "min_rb_factor": 0.0, "E_mpa": 69_000},
-    "Aluminum 5052-H32":    {"typical_k": 0.34, "uts_mpa": 228,  "yield_mpa": 193,  "elongation": 12, "min_rb_factor": 1.0, "E_mpa": 70_000},
-    "Aluminum 6061-T6":     {"typical_k": 0.35, "uts_mpa": 310,  "yield_mpa": 276,  "elongation": 8,  "min_rb_factor": 1.5, "E_mpa": 68_900},
-    "Steel – Mild (1020)":  {"typical_k": 0.42, "uts_mpa": 380,  "yield_mpa": 210,  "elongation": 25, "min_rb_factor": 0.5, "E_mpa": 200_000},
-    "Steel – HSLA 350":     {"typical_k": 0.44, "uts_mpa": 450,  "yield_mpa": 350,  "elongation": 20, "min_rb_factor": 1.5, "E_mpa": 200_000},
-    "Steel – SS 304":       {"typical_k": 0.45, "uts_mpa": 515,  "yield_mpa": 205,  "elongation": 40, "min_rb_factor": 1.0, "E_mpa": 193_000},
-    "Steel – SS 316":       {"typical_k": 0.46, "uts_mpa": 485,  "yield_mpa": 170,  "elongation": 40, "min_rb_factor": 1.0, "E_mpa": 193_000},
-    "Steel – Spring":       {"typical_k": 0.48, "uts_mpa": 1200, "yield_mpa": 1000, "elongation": 5,  "min_rb_factor": 3.0, "E_mpa": 207_000},
-    "Copper (C110)":        {"typical_k": 0.35, "uts_mpa": 220,  "yield_mpa": 70,   "elongation": 40, "min_rb_factor": 0.0, "E_mpa": 117_000},
-    "Brass C260":           {"typical_k": 0.38, "uts_mpa": 340,  "yield_mpa": 103,  "elongation": 43, "min_rb_factor": 0.5, "E_mpa": 110_000},
-    "Titanium Gr2":         {"typical_k": 0.45, "uts_mpa": 345,  "yield_mpa": 276,  "elongation": 20, "min_rb_factor": 2.5, "E_mpa": 105_000},
-}
-
 CHART_CONFIG = {
     "displayModeBar": True,
     "modeBarButtonsToRemove": ["select2d", "lasso2d", "autoScale2d", "toImage"],
     "displaylogo": False,
 }
 
-PLOT_LAYOUT = dict(
-    paper_bgcolor="#f8faf8",
-    plot_bgcolor="#ffffff",
-    font=dict(family="Plus Jakarta Sans", color="#4a6e4a", size=12),
-    legend=dict(bgcolor="rgba(255,255,255,0.9)", bordercolor="#d4ead4", borderwidth=1,
-                font=dict(size=11)),
-    margin=dict(l=10, r=10, t=48, b=10),
-)
-GRID_STYLE = dict(gridcolor="#e8f5e8", zerolinecolor="#d4ead4", linecolor="#d4ead4")
-C_GREEN   = "#16a34a"
-C_PURPLE  = "#7c3aed"
-C_BLUE    = "#0891b2"
-C_AMBER   = "#d97706"
-C_RED     = "#dc2626"
-
-# ─── Math Engine ─────────────────────────────────────────────────────────
-
-@st.cache_data
-def k_logistic(r_s: float) -> float:
-    a, b, c, d = 0.277833218, 1.056058295, 0.608320238, 0.502506534
-    return d + (a - d) / (1 + (r_s / c) ** b)
-
-@st.cache_data
-def k_analytical(r_s: float) -> float:
-    if r_s <= 0:
-        return 0.33
-    return np.log(1 + 1 / (2 * r_s + 1)) / np.log(1 + 1 / r_s)
-
-@st.cache_data
-def k_din6935(r_s: float) -> float:
-    if r_s < 0.65:
-        return 0.33
-    elif r_s < 1.0:
-        return 0.33 + 0.125 * (r_s - 0.65) / 0.35
-    elif r_s < 3.0:
-        return 0.4575 + 0.0325 * (r_s - 1.0) / 2.0
-    else:
-        return min(0.5, 0.49 + 0.01 * (r_s - 3.0) / 7.0)
-
-def k_for_method(r_s: float, method: str) -> float:
-    if method == "Logistic fit":
-        return k_logistic(r_s)
-    elif method == "Analytical (Wang-Wenner)":
-        return k_analytical(r_s)
-    return k_din6935(r_s)
-
-def bend_allowance(k: float, angle_deg: float, r: float, t: float) -> float:
-    return np.radians(angle_deg) * (r + k * t)
-
-def outside_setback(angle_deg: float, r: float, t: float) -> float:
-    return np.tan(np.radians(angle_deg / 2)) * (r + t)
-
-def bend_deduction(ba: float, r: float, t: float, angle_deg: float) -> float:
-    return 2 * outside_setback(angle_deg, r, t) - ba
-
-def springback_angle(angle_deg: float, r: float, t: float, yield_mpa: float, E_mpa: float = 200_000) -> float:
-    ratio = 3 * yield_mpa * r / (E_mpa * t)
-    return angle_deg * ratio
-
-def min_bend_radius(t: float, elongation_pct: float) -> float:
-    if elongation_pct <= 0:
-        return float('inf')
-    return t * (50 / elongation_pct - 1)
-
-def flat_length(leg1: float, leg2: float, ba: float) -> float:
-    return leg1 + leg2 + ba
+def show_chart(fig) -> None:
+    # Timed separately from the figure build: this is where the figure is
+    # serialised and handed to the frontend.
+    with instrument.span("chart"):
+        st.plotly_chart(fig, width='stretch', config=CHART_CONFIG)
 
 # ─── App Header ──────────────────────────────────────────────────────────
 st.markdown("""
@@ -258,60 +198,131 @@ st.markdown("""
 </div>
 """, unsafe_allow_html=True)
 
+# ─── Section Dependency Graph ────────────────────────────────────────────
+# Every page section below is an independently rerunnable fragment. This
+# table lists the inputs each one reads; changing an input reruns only the
+# sections that depend on it. Inputs that also reshape the input panel
+# (unit labels, material callout, flange fields) take a normal full rerun.
+SECTION_DEPS = {
+    "results":       {"unit", "r", "t", "bend_angle", "method", "mat_choice",
+                      "show_flat", "leg1", "leg2", "show_springback"},
+    "curves":        {"unit", "r", "t", "bend_angle", "method"},
+    "divergence":    {"r", "t"},
+    "cross_section": {"unit", "r", "t", "bend_angle", "method", "show_flat", "leg1", "leg2"},
+    "heatmaps":      {"unit", "r", "t", "bend_angle", "method"},
+    "springback":    {"r", "t", "bend_angle", "mat_choice"},
+    "materials":     {"r", "t", "method", "mat_choice"},
+    "reference":     {"r", "t", "method"},
+    "export":        {"unit", "r", "t", "bend_angle", "method", "mat_choice",
+                      "show_flat", "leg1", "leg2", "show_springback"},
+    "calibration":   set(),
+    "sweep":         {"unit", "method", "mat_choice"},
+}
+
+def dependents(name: str) -> list[str]:
+    return sorted(sec for sec, deps in SECTION_DEPS.items() if name in deps)
+
+def rerun_dependents(name: str) -> None:
+    st.rerun(dependents(name))
+
+# overbend_angle() is NaN when no commanded angle reaches the target,
+# i.e. the estimated springback is at least the bend angle itself.
+NO_OVERBEND = "no achievable overbend (springback ≥ bend angle)"
+
+def read_inputs() -> SimpleNamespace:
+    """Current inputs plus the derived single-bend results.
+
+    Panel inputs come from the snapshot taken on the last full run; the
+    fragment-scoped inputs are read live from their widget keys.
+    """
+    ss  = st.session_state
+    inp = {**ss["panel"], **{k: ss[k] for k in ("r", "t", "bend_angle", "method") if k in ss}}
+    if inp["show_flat"]:
+        inp.update({k: ss[k] for k in ("leg1", "leg2") if k in ss})
+    c = SimpleNamespace(**inp)
+    c.unit_lbl = "mm" if c.unit == "mm" else "in"
+    # Snap lengths before anything is computed or cached, so inputs that
+    # agree to workshop precision share cache entries.
+    c.r, c.t = snap_length(c.r, c.unit_lbl), snap_length(c.t, c.unit_lbl)
+    if c.show_flat:
+        c.leg1, c.leg2 = snap_length(c.leg1, c.unit_lbl), snap_length(c.leg2, c.unit_lbl)
+    c.precision = describe_precision(c.unit_lbl)
+    c.store = default_store()
+    c.mat = c.store.get(c.mat_choice)
+    if c.mat:
+        c.sb       = springback_angle(c.bend_angle, c.r, c.t, c.mat["yield_mpa"], c.mat["E_mpa"])
+        c.overbend = float(overbend_angle(c.bend_angle, c.r, c.t, c.mat["yield_mpa"], c.mat["E_mpa"]))
+        c.overbend_text = NO_OVERBEND if np.isnan(c.overbend) else f"{c.overbend:.1f}°"
+    c.r_s = c.r / c.t
+    c.K   = k_for_method(c.r_s, c.method)
+    c.BA  = bend_allowance(c.K, c.bend_angle, c.r, c.t)
+    c.BD  = bend_deduction(c.BA, c.r, c.t, c.bend_angle)
+    c.OSB = outside_setback(c.bend_angle, c.r, c.t)
+    c.methods = tuple(method_names())
+    c.k_all = {m: k_for_method(c.r_s, m) for m in c.methods}
+    return c
+
 # ─── Input Panel ─────────────────────────────────────────────────────────
 col_inp, col_res = st.columns([1, 2], gap="large")
 
-with col_inp:
+with col_inp, instrument.span("inputs"):
     st.markdown('<div class="section-label">Parameters</div>', unsafe_allow_html=True)
 
-    unit = st.selectbox("Unit system", ["mm", "inches"])
+    unit = st.selectbox("Unit system", ["mm", "inches"], key="unit")
     unit_lbl = "mm" if unit == "mm" else "in"
 
-    r = st.number_input(f"Inner bend radius r ({unit_lbl})", min_value=0.01, value=2.0, step=0.5, format="%.2f")
-    t = st.number_input(f"Sheet thickness t ({unit_lbl})", min_value=0.01, value=2.0, step=0.1, format="%.2f")
+    r = st.number_input(f"Inner bend radius r ({unit_lbl})", min_value=0.01, value=2.0, step=0.5, format="%.2f",
+                        key="r", on_change=rerun_dependents, args=("r",))
+    t = st.number_input(f"Sheet thickness t ({unit_lbl})", min_value=0.01, value=2.0, step=0.1, format="%.2f",
+                        key="t", on_change=rerun_dependents, args=("t",))
 
     st.markdown('<div class="section-label" style="margin-top:20px">Material</div>', unsafe_allow_html=True)
-    mat_choice = st.selectbox("Select material", ["— Custom —"] + list(MATERIALS.keys()))
+    materials = default_store()
+    mat_choice = st.selectbox("Select material", ["— Custom —"] + list(materials), key="mat_choice")
 
-    mat = MATERIALS.get(mat_choice) if mat_choice != "— Custom —" else None
+    mat = materials.get(mat_choice) if mat_choice != "— Custom —" else None
     if mat:
         st.markdown(f"""
         <div class="callout">
-        UTS <b>{mat['uts_mpa']} MPa</b> · Yield <b>{mat['yield_mpa']} MPa</b> ·
-        Elongation <b>{mat['elongation']}%</b> · Reference K <b>{mat['typical_k']}</b>
+        UTS <b>{mat['uts_mpa']:g} MPa</b> · Yield <b>{mat['yield_mpa']:g} MPa</b> ·
+        Elongation <b>{mat['elongation']:g}%</b> · Reference K <b>{mat['typical_k']:g}</b>
         </div>
         """, unsafe_allow_html=True)
 
     st.markdown('<div class="section-label" style="margin-top:20px">Bend Geometry</div>', unsafe_allow_html=True)
-    bend_angle = st.slider("Bend angle (°)", min_value=1, max_value=180, value=90, step=1)
+    bend_angle = st.slider("Bend angle (°)", min_value=1, max_value=180, value=90, step=1,
+                           key="bend_angle", on_change=rerun_dependents, args=("bend_angle",))
 
     st.markdown('<div class="section-label" style="margin-top:20px">K-Factor Method</div>', unsafe_allow_html=True)
-    method = st.radio("Calculation method",
-                      ["Logistic fit", "Analytical (Wang-Wenner)", "DIN 6935 empirical"], index=0)
+    method = st.radio("Calculation method", method_names(), index=0,
+                      key="method", on_change=rerun_dependents, args=("method",))
 
     st.markdown('<div class="section-label" style="margin-top:20px">Flat Pattern</div>', unsafe_allow_html=True)
-    show_flat = st.checkbox("Flat pattern development", value=True)
+    show_flat = st.checkbox("Flat pattern development", value=True, key="show_flat")
     if show_flat:
-        leg1 = st.number_input(f"Flange A ({unit_lbl})", min_value=0.0, value=50.0, step=1.0, format="%.1f")
-        leg2 = st.number_input(f"Flange B ({unit_lbl})", min_value=0.0, value=30.0, step=1.0, format="%.1f")
+        leg1 = st.number_input(f"Flange A ({unit_lbl})", min_value=0.0, value=50.0, step=1.0, format="%.1f",
+                               key="leg1", on_change=rerun_dependents, args=("leg1",))
+        leg2 = st.number_input(f"Flange B ({unit_lbl})", min_value=0.0, value=30.0, step=1.0, format="%.1f",
+                               key="leg2", on_change=rerun_dependents, args=("leg2",))
     else:
         leg1 = leg2 = 0.0
 
     show_springback = st.checkbox("Springback estimation", value=bool(mat))
 
-# ─── Calculations ────────────────────────────────────────────────────────
-r_s = r / t
-K   = k_for_method(r_s, method)
-BA  = bend_allowance(K, bend_angle, r, t)
-BD  = bend_deduction(BA, r, t, bend_angle)
-OSB = outside_setback(bend_angle, r, t)
-
-k_log = k_logistic(r_s)
-k_ana = k_analytical(r_s)
-k_din = k_din6935(r_s)
+st.session_state["panel"] = dict(
+    unit=unit, r=r, t=t, bend_angle=bend_angle, method=method, mat_choice=mat_choice,
+    show_flat=show_flat, leg1=leg1, leg2=leg2, show_springback=show_springback,
+)
 
 # ─── Results Panel ───────────────────────────────────────────────────────
-with col_res:
+@st.fragment(key="results")
+@instrument.section("results")
+def results_section():
+    c = read_inputs()
+    r, t, r_s, bend_angle, method, unit_lbl = c.r, c.t, c.r_s, c.bend_angle, c.method, c.unit_lbl
+    K, BA, BD, OSB = c.K, c.BA, c.BD, c.OSB
+    show_flat, leg1, leg2, show_springback, mat = c.show_flat, c.leg1, c.leg2, c.show_springback, c.mat
+
     st.markdown('<div class="section-label">Results</div>', unsafe_allow_html=True)
 
     if r_s < 1.0:
@@ -351,11 +362,13 @@ with col_res:
     """, unsafe_allow_html=True)
 
     with st.expander("📐 Formula trace", expanded=False):
+        lf = length_format(unit_lbl)
         st.markdown(f"""
         <div class="formula">
-        Neutral axis offset:  y = K × t = {K:.4f} × {t} = {K*t:.4f} {unit_lbl}<br>
+        Input precision:      r, t snapped to {c.precision} → r = {r:{lf}}, t = {t:{lf}} {unit_lbl}<br>
+        Neutral axis offset:  y = K × t = {K:.4f} × {t:{lf}} = {K*t:.4f} {unit_lbl}<br>
         Bend angle (rad):     α = {bend_angle}° × π/180 = {np.radians(bend_angle):.5f} rad<br>
-        Bend Allowance:       BA = α × (r + K·t) = {np.radians(bend_angle):.5f} × ({r} + {K*t:.4f}) = <b>{BA:.4f} {unit_lbl}</b><br>
+        Bend Allowance:       BA = α × (r + K·t) = {np.radians(bend_angle):.5f} × ({r:{lf}} + {K*t:.4f}) = <b>{BA:.4f} {unit_lbl}</b><br>
         Outside Setback:      OSSB = tan(α/2) × (r + t) = {OSB:.4f} {unit_lbl}<br>
         Bend Deduction:       BD = 2×OSSB − BA = {2*OSB:.4f} − {BA:.4f} = <b>{BD:.4f} {unit_lbl}</b>
         </div>
@@ -374,10 +387,8 @@ with col_res:
         """, unsafe_allow_html=True)
 
     if show_springback and mat:
-        E_mpa = mat["E_mpa"]
-        sb    = springback_angle(bend_angle, r, t, mat["yield_mpa"], E_mpa)
+        sb = c.sb
         rb_min = min_bend_radius(t, mat["elongation"])
-        overbend = bend_angle + sb
 
         col_sb1, col_sb2 = st.columns(2)
         with col_sb1:
@@ -385,7 +396,7 @@ with col_res:
             <div class="card">
               <div class="section-label">Springback</div>
               <div style="font-family:'Plus Jakarta Sans',sans-serif;font-size:1.6rem;font-weight:700;color:#d97706;">+{sb:.2f}°</div>
-              <div style="font-size:0.78rem;color:#6b9e6b;margin-top:4px;font-family:'IBM Plex Mono',monospace;">Overbend to: {overbend:.1f}°</div>
+              <div style="font-size:0.78rem;color:#6b9e6b;margin-top:4px;font-family:'IBM Plex Mono',monospace;">Overbend to: {c.overbend_text}</div>
             </div>
             """, unsafe_allow_html=True)
         with col_sb2:
@@ -399,9 +410,10 @@ with col_res:
               <div style="font-size:0.78rem;color:#6b9e6b;margin-top:4px;font-family:'IBM Plex Mono',monospace;">Your r={r:.2f} — {'OK' if rb_ok else 'RISK OF CRACKING'}</div>
             </div>
             """, unsafe_allow_html=True)
+        if np.isnan(c.overbend):
+            st.warning(f"Springback: {NO_OVERBEND}. Check the material and the r/t ratio.")
 
     st.markdown("""<div class="section-label" style="margin-top:20px">Method Comparison</div>""", unsafe_allow_html=True)
-    c1, c2, c3 = st.columns(3)
     def method_tile(col, label, val, active):
         border = "border-color:#16a34a;box-shadow:0 2px 10px rgba(22,163,74,0.15)" if active else ""
         col.markdown(f"""
@@ -410,9 +422,11 @@ with col_res:
           <div style="font-family:'Plus Jakarta Sans',sans-serif;font-size:1.4rem;font-weight:700;color:{'#16a34a' if active else '#6b9e6b'}">{val:.4f}</div>
         </div>
         """, unsafe_allow_html=True)
-    method_tile(c1, "Logistic fit",  k_log, method == "Logistic fit")
-    method_tile(c2, "Wang-Wenner",   k_ana, method == "Analytical (Wang-Wenner)")
-    method_tile(c3, "DIN 6935",      k_din, method == "DIN 6935 empirical")
+    for col, (m, k_m) in zip(st.columns(len(c.k_all)), c.k_all.items()):
+        method_tile(col, METHOD_REGISTRY.get(m).label, k_m, method == m)
+
+with col_res:
+    results_section()
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -421,100 +435,14 @@ with col_res:
 st.markdown("---")
 st.markdown('<div class="section-label">K-Factor Curve Analysis</div>', unsafe_allow_html=True)
 
-rs_range = np.linspace(0.05, 25, 500)
-k_log_arr = np.array([k_logistic(x)   for x in rs_range])
-k_ana_arr = np.array([k_analytical(x) for x in rs_range])
-k_din_arr = np.array([k_din6935(x)    for x in rs_range])
-
-# ── Uncertainty band ──
-k_upper = np.maximum.reduce([k_log_arr, k_ana_arr, k_din_arr])
-k_lower = np.minimum.reduce([k_log_arr, k_ana_arr, k_din_arr])
-
-# ── BA family of curves (r = 1t, 2t, 4t, 8t) ──
-angles_deg = np.linspace(1, 180, 360)
-r_multiples = [(1, 1.0), (2, 0.72), (4, 0.45), (8, 0.25)]
-
-fig1 = make_subplots(
-    rows=1, cols=2,
-    subplot_titles=["K-Factor vs r/t  —  All Methods + Uncertainty Band",
-                    "Bend Allowance vs Angle  —  r = 1t, 2t, 4t, 8t"],
-    horizontal_spacing=0.10,
-)
 
-# Uncertainty band
-fig1.add_trace(go.Scatter(
-    x=np.concatenate([rs_range, rs_range[::-1]]),
-    y=np.concatenate([k_upper, k_lower[::-1]]),
-    fill="toself",
-    fillcolor="rgba(22,163,74,0.09)",
-    line=dict(color="rgba(0,0,0,0)"),
-    name="Method spread",
-    hoverinfo="skip",
-), row=1, col=1)
-
-# K curves
-for arr, name, color, dash in [
-    (k_log_arr, "Logistic",    C_GREEN,  "solid"),
-    (k_ana_arr, "Wang-Wenner", C_PURPLE, "dash"),
-    (k_din_arr, "DIN 6935",    C_BLUE,   "dot"),
-]:
-    fig1.add_trace(go.Scatter(
-        x=rs_range, y=arr, name=name,
-        line=dict(color=color, width=2, dash=dash),
-        hovertemplate="r/t=%{x:.2f}<br>K=%{y:.4f}<extra></extra>",
-    ), row=1, col=1)
-
-# User point (star)
-fig1.add_trace(go.Scatter(
-    x=[r_s], y=[K], name="Your calc",
-    mode="markers",
-    marker=dict(color=C_GREEN, size=14, symbol="star",
-                line=dict(color="white", width=2)),
-    hovertemplate=f"r/t={r_s:.3f}<br>K={K:.4f}<extra>Your calc</extra>",
-), row=1, col=1)
-
-# Ref line K=0.5 with annotation
-fig1.add_hline(y=0.5, line=dict(color="#9ab89a", dash="dot", width=1.2), row=1, col=1)
-fig1.add_annotation(
-    x=22, y=0.503,
-    text="K = 0.5  (mid-plane)",
-    font=dict(size=10, color="#9ab89a", family="IBM Plex Mono"),
-    showarrow=False, xref="x", yref="y",
-)
+@st.fragment(key="curves")
+@instrument.section("curves")
+def curves_section():
+    c = read_inputs()
+    show_chart(build_fig1(c.r_s, c.K, c.t, c.method, c.bend_angle, c.BA, c.unit_lbl, c.methods))
 
-# BA family of curves
-ba_colors = [C_GREEN, "#0891b2", "#7c3aed", "#d97706"]
-for (mult, _), color in zip(r_multiples, ba_colors):
-    r_i  = mult * t
-    K_i  = k_for_method(r_i / t, method)
-    ba_i = np.array([bend_allowance(K_i, a, r_i, t) for a in angles_deg])
-    fig1.add_trace(go.Scatter(
-        x=angles_deg, y=ba_i,
-        name=f"r = {mult}t",
-        line=dict(color=color, width=2),
-        hovertemplate=f"r={mult}t, α=%{{x:.0f}}°<br>BA=%{{y:.3f}} {unit_lbl}<extra></extra>",
-    ), row=1, col=2)
-
-# Current point on BA chart
-fig1.add_vline(x=bend_angle, line=dict(color=C_GREEN, dash="dot", width=1.5), row=1, col=2)
-fig1.add_trace(go.Scatter(
-    x=[bend_angle], y=[BA],
-    mode="markers",
-    marker=dict(color=C_GREEN, size=11, symbol="circle", line=dict(color="white", width=2)),
-    showlegend=False,
-    hovertemplate=f"α={bend_angle}°<br>BA={BA:.3f} {unit_lbl}<extra>Your calc</extra>",
-), row=1, col=2)
-
-fig1.update_layout(height=420, **PLOT_LAYOUT)
-for ax in ["xaxis", "xaxis2", "yaxis", "yaxis2"]:
-    fig1.update_layout(**{ax: {**GRID_STYLE}})
-fig1.update_xaxes(title_text="r/t ratio",       row=1, col=1)
-fig1.update_yaxes(title_text="K-Factor",         row=1, col=1, range=[0.28, 0.52])
-fig1.update_xaxes(title_text="Bend angle (°)",   row=1, col=2)
-fig1.update_yaxes(title_text=f"Bend Allowance ({unit_lbl})", row=1, col=2)
-fig1.update_annotations(font=dict(color="#4a6e4a", size=12))
-
-st.plotly_chart(fig1, width='stretch', config=CHART_CONFIG)
+curves_section()
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -526,35 +454,14 @@ st.markdown('<div class="section-label">Method Divergence  ·  Cross-Section Dia
 col_div, col_xsec = st.columns([1, 1], gap="large")
 
 # ── Method divergence strip ──
+@st.fragment(key="divergence")
+@instrument.section("divergence")
+def divergence_section():
+    c = read_inputs()
+    show_chart(build_fig_div(c.r_s, c.methods))
+
 with col_div:
-    diff_log_din = np.abs(k_log_arr - k_din_arr)
-    diff_ana_din = np.abs(k_ana_arr - k_din_arr)
-
-    fig_div = go.Figure()
-    fig_div.add_trace(go.Scatter(
-        x=rs_range, y=diff_log_din * 1000,
-        name="|Logistic − DIN 6935|",
-        line=dict(color=C_GREEN, width=2),
-        fill="tozeroy", fillcolor="rgba(22,163,74,0.10)",
-        hovertemplate="r/t=%{x:.2f}<br>ΔK=%{y:.2f}×10⁻³<extra></extra>",
-    ))
-    fig_div.add_trace(go.Scatter(
-        x=rs_range, y=diff_ana_din * 1000,
-        name="|Wang-Wenner − DIN 6935|",
-        line=dict(color=C_PURPLE, width=2, dash="dash"),
-        fill="tozeroy", fillcolor="rgba(124,58,237,0.06)",
-        hovertemplate="r/t=%{x:.2f}<br>ΔK=%{y:.2f}×10⁻³<extra></extra>",
-    ))
-    fig_div.add_vline(x=r_s, line=dict(color=C_GREEN, dash="dot", width=1.5))
-    fig_div.update_layout(
-        title=dict(text="Method Divergence vs DIN 6935  (×10⁻³)", font=dict(size=13), x=0),
-        xaxis_title="r/t ratio",
-        yaxis_title="ΔK  (×10⁻³)",
-        height=340, **PLOT_LAYOUT,
-    )
-    fig_div.update_xaxes(**GRID_STYLE)
-    fig_div.update_yaxes(**GRID_STYLE)
-    st.plotly_chart(fig_div, width='stretch', config=CHART_CONFIG)
+    divergence_section()
     st.markdown("""
     <div class="callout" style="font-size:0.79rem;">
     <b>Reading guide:</b> Peak divergence typically occurs at r/t 0.5–2.0.
@@ -564,136 +471,14 @@ with col_div:
     """, unsafe_allow_html=True)
 
 # ── Flat pattern cross-section diagram ──
-with col_xsec:
-    angle_rad = np.radians(bend_angle)
-    half_a    = np.radians(bend_angle / 2)
-    R_neutral = r + K * t
-    R_outer   = r + t
-
-    # Arc points — neutral axis
-    arc_angles = np.linspace(np.pi / 2, np.pi / 2 + angle_rad, 80)
-    na_x = R_neutral * np.cos(arc_angles)
-    na_y = R_neutral * np.sin(arc_angles)
-
-    # Outer arc
-    arc_out_x = R_outer * np.cos(arc_angles)
-    arc_out_y = R_outer * np.sin(arc_angles)
-
-    # Inner arc
-    arc_in_x = r * np.cos(arc_angles)
-    arc_in_y = r * np.sin(arc_angles)
-
-    # Flanges from arc endpoints
-    start_dir = np.array([np.cos(arc_angles[0]),  np.sin(arc_angles[0])])
-    end_dir   = np.array([np.cos(arc_angles[-1]), np.sin(arc_angles[-1])])
-
-    # Flange A (right side, perpendicular to start tangent going right/down)
-    tang_start = np.array([-start_dir[1], start_dir[0]])
-    flange_len = min(leg1 if leg1 > 0 else 40, 80)
-    fa_out_start = np.array([arc_out_x[0], arc_out_y[0]])
-    fa_in_start  = np.array([arc_in_x[0],  arc_in_y[0]])
-    fa_out_end   = fa_out_start - tang_start * flange_len
-    fa_in_end    = fa_in_start  - tang_start * flange_len
-
-    # Flange B (left side)
-    tang_end = np.array([-end_dir[1], end_dir[0]])
-    flange_len_b = min(leg2 if leg2 > 0 else 25, 80)
-    fb_out_start = np.array([arc_out_x[-1], arc_out_y[-1]])
-    fb_in_start  = np.array([arc_in_x[-1],  arc_in_y[-1]])
-    fb_out_end   = fb_out_start + tang_end * flange_len_b
-    fb_in_end    = fb_in_start  + tang_end * flange_len_b
-
-    fig_xs = go.Figure()
-
-    # Sheet outline (outer boundary)
-    outline_x = (
-        list(fa_out_end) + [None] +
-        [fa_out_start[0]] + list(arc_out_x) + [fb_out_start[0]] + [None] +
-        list(fb_out_end) + [None]
-    )
-    # Full sheet polygon for fill
-    poly_x = (
-        [fa_out_end[0], fa_in_end[0], fa_in_start[0]] +
-        list(arc_in_x[::-1]) +
-        [arc_in_x[0], fa_in_start[0], fa_out_start[0]] +
-        list(arc_out_x) +
-        [fb_out_start[0], fb_out_end[0], fb_in_end[0], fb_in_start[0]] +
-        list(arc_in_x) +
-        [arc_in_x[-1], fb_in_start[0]]
-    )
-    poly_y = (
-        [fa_out_end[1], fa_in_end[1], fa_in_start[1]] +
-        list(arc_in_y[::-1]) +
-        [arc_in_y[0], fa_in_start[1], fa_out_start[1]] +
-        list(arc_out_y) +
-        [fb_out_start[1], fb_out_end[1], fb_in_end[1], fb_in_start[1]] +
-        list(arc_in_y) +
-        [arc_in_y[-1], fb_in_start[1]]
-    )
-
-    # Sheet fill
-    fig_xs.add_trace(go.Scatter(
-        x=poly_x, y=poly_y,
-        fill="toself", fillcolor="rgba(22,163,74,0.12)",
-        line=dict(color=C_GREEN, width=1.8),
-        name="Sheet cross-section",
-        hoverinfo="skip",
-    ))
-
-    # Neutral axis arc (dashed)
-    fig_xs.add_trace(go.Scatter(
-        x=list(na_x), y=list(na_y),
-        line=dict(color=C_AMBER, width=2, dash="dash"),
-        name=f"Neutral axis  K={K:.4f}",
-        hovertemplate="Neutral axis<extra></extra>",
-    ))
-
-    # Flange A lines
-    for xpts, ypts in [
-        ([fa_out_start[0], fa_out_end[0]], [fa_out_start[1], fa_out_end[1]]),
-        ([fa_in_start[0],  fa_in_end[0]],  [fa_in_start[1],  fa_in_end[1]]),
-    ]:
-        fig_xs.add_trace(go.Scatter(x=xpts, y=ypts, line=dict(color=C_GREEN, width=1.8),
-                                    showlegend=False, hoverinfo="skip"))
-    fig_xs.add_trace(go.Scatter(
-        x=[fa_out_end[0], fa_in_end[0]], y=[fa_out_end[1], fa_in_end[1]],
-        line=dict(color=C_GREEN, width=1.8), showlegend=False, hoverinfo="skip",
-    ))
-
-    # Flange B lines
-    for xpts, ypts in [
-        ([fb_out_start[0], fb_out_end[0]], [fb_out_start[1], fb_out_end[1]]),
-        ([fb_in_start[0],  fb_in_end[0]],  [fb_in_start[1],  fb_in_end[1]]),
-    ]:
-        fig_xs.add_trace(go.Scatter(x=xpts, y=ypts, line=dict(color=C_GREEN, width=1.8),
-                                    showlegend=False, hoverinfo="skip"))
-    fig_xs.add_trace(go.Scatter(
-        x=[fb_out_end[0], fb_in_end[0]], y=[fb_out_end[1], fb_in_end[1]],
-        line=dict(color=C_GREEN, width=1.8), showlegend=False, hoverinfo="skip",
-    ))
-
-    # Neutral axis position annotation (Kt from inner radius)
-    mid_idx = len(arc_angles) // 2
-    fig_xs.add_annotation(
-        x=na_x[mid_idx], y=na_y[mid_idx],
-        text=f"  K·t = {K*t:.3f} {unit_lbl}",
-        font=dict(size=10, color=C_AMBER, family="IBM Plex Mono"),
-        showarrow=True, arrowhead=2, arrowcolor=C_AMBER, arrowsize=0.8,
-        ax=30, ay=-30,
-    )
+@st.fragment(key="cross_section")
+@instrument.section("cross_section")
+def cross_section_section():
+    c = read_inputs()
+    show_chart(build_fig_xs(c.r, c.t, c.K, c.bend_angle, c.leg1, c.leg2, c.unit_lbl))
 
-    fig_xs.update_layout(
-        title=dict(text=f"Bend Cross-Section  —  {bend_angle}°  r={r} t={t} {unit_lbl}", font=dict(size=13), x=0),
-        height=340,
-        showlegend=True,
-        yaxis=dict(scaleanchor="x", scaleratio=1, **GRID_STYLE),
-        xaxis=dict(**GRID_STYLE),
-        **PLOT_LAYOUT,
-    )
-    fig_xs.update_xaxes(title_text=unit_lbl)
-    fig_xs.update_yaxes(title_text=unit_lbl)
-
-    st.plotly_chart(fig_xs, width='stretch', config=CHART_CONFIG)
+with col_xsec:
+    cross_section_section()
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -704,104 +489,23 @@ st.markdown('<div class="section-label">Bend Allowance / Deduction Heatmap</div>
 
 hm_col1, hm_col2 = st.columns(2, gap="large")
 
-rs_vals_hm  = np.linspace(0.1, 8.0, 40)
-angle_vals  = np.linspace(10, 170, 35)
+
+# Both columns are call sites of one fragment, so they rerun together.
+@st.fragment(key="heatmaps")
+@instrument.section("heatmaps")
+def heatmap_section(kind: str):
+    c = read_inputs()
+    if kind == "BA":
+        fig = build_fig_hm_ba(c.r_s, c.t, c.method, c.bend_angle, c.BA, c.unit_lbl)
+    else:
+        fig = build_fig_hm_bd(c.r_s, c.t, c.method, c.bend_angle, c.BD, c.unit_lbl)
+    show_chart(fig)
 
 with hm_col1:
-    # Precompute BA grid
-    BA_grid = np.zeros((len(angle_vals), len(rs_vals_hm)))
-    for i, ang in enumerate(angle_vals):
-        for j, rs_v in enumerate(rs_vals_hm):
-            k_v = k_for_method(rs_v, method)
-            BA_grid[i, j] = bend_allowance(k_v, ang, rs_v * t, t)
-
-    # User crosshair
-    user_rs_idx  = int(np.argmin(np.abs(rs_vals_hm - r_s)))
-    user_ang_idx = int(np.argmin(np.abs(angle_vals - bend_angle)))
-
-    fig_hm_ba = go.Figure()
-    fig_hm_ba.add_trace(go.Heatmap(
-        z=BA_grid,
-        x=rs_vals_hm,
-        y=angle_vals,
-        colorscale=[
-            [0.0,  "#f0faf0"],
-            [0.25, "#86efac"],
-            [0.55, "#16a34a"],
-            [0.80, "#166534"],
-            [1.0,  "#052e16"],
-        ],
-        colorbar=dict(title=dict(text=f"BA ({unit_lbl})", font=dict(size=11)),
-                      tickfont=dict(size=10), len=0.85),
-        hovertemplate="r/t=%{x:.2f}<br>Angle=%{y:.0f}°<br>BA=%{z:.3f}<extra></extra>",
-    ))
-    # Crosshair lines
-    fig_hm_ba.add_hline(y=bend_angle, line=dict(color="white", width=1.5, dash="dot"))
-    fig_hm_ba.add_vline(x=r_s,        line=dict(color="white", width=1.5, dash="dot"))
-    fig_hm_ba.add_trace(go.Scatter(
-        x=[r_s], y=[bend_angle],
-        mode="markers",
-        marker=dict(color="white", size=11, symbol="star",
-                    line=dict(color=C_AMBER, width=2)),
-        name="Your calc",
-        hovertemplate=f"r/t={r_s:.3f}<br>Angle={bend_angle}°<br>BA={BA:.3f}<extra>Your calc</extra>",
-    ))
-    fig_hm_ba.update_layout(
-        title=dict(text=f"Bend Allowance Heatmap  (t = {t} {unit_lbl}, method: {method})",
-                   font=dict(size=13), x=0),
-        xaxis_title="r/t ratio",
-        yaxis_title="Bend angle (°)",
-        height=370, **PLOT_LAYOUT,
-    )
-    fig_hm_ba.update_xaxes(**GRID_STYLE)
-    fig_hm_ba.update_yaxes(**GRID_STYLE)
-    st.plotly_chart(fig_hm_ba, width='stretch', config=CHART_CONFIG)
+    heatmap_section("BA")
 
 with hm_col2:
-    # Precompute BD grid
-    BD_grid = np.zeros((len(angle_vals), len(rs_vals_hm)))
-    for i, ang in enumerate(angle_vals):
-        for j, rs_v in enumerate(rs_vals_hm):
-            k_v  = k_for_method(rs_v, method)
-            ba_v = bend_allowance(k_v, ang, rs_v * t, t)
-            BD_grid[i, j] = bend_deduction(ba_v, rs_v * t, t, ang)
-
-    fig_hm_bd = go.Figure()
-    fig_hm_bd.add_trace(go.Heatmap(
-        z=BD_grid,
-        x=rs_vals_hm,
-        y=angle_vals,
-        colorscale=[
-            [0.0,  "#f0faf0"],
-            [0.35, "#fde68a"],
-            [0.65, "#d97706"],
-            [0.85, "#92400e"],
-            [1.0,  "#451a03"],
-        ],
-        colorbar=dict(title=dict(text=f"BD ({unit_lbl})", font=dict(size=11)),
-                      tickfont=dict(size=10), len=0.85),
-        hovertemplate="r/t=%{x:.2f}<br>Angle=%{y:.0f}°<br>BD=%{z:.3f}<extra></extra>",
-    ))
-    fig_hm_bd.add_hline(y=bend_angle, line=dict(color="white", width=1.5, dash="dot"))
-    fig_hm_bd.add_vline(x=r_s,        line=dict(color="white", width=1.5, dash="dot"))
-    fig_hm_bd.add_trace(go.Scatter(
-        x=[r_s], y=[bend_angle],
-        mode="markers",
-        marker=dict(color="white", size=11, symbol="star",
-                    line=dict(color=C_GREEN, width=2)),
-        name="Your calc",
-        hovertemplate=f"r/t={r_s:.3f}<br>Angle={bend_angle}°<br>BD={BD:.3f}<extra>Your calc</extra>",
-    ))
-    fig_hm_bd.update_layout(
-        title=dict(text=f"Bend Deduction Heatmap  (t = {t} {unit_lbl}, method: {method})",
-                   font=dict(size=13), x=0),
-        xaxis_title="r/t ratio",
-        yaxis_title="Bend angle (°)",
-        height=370, **PLOT_LAYOUT,
-    )
-    fig_hm_bd.update_xaxes(**GRID_STYLE)
-    fig_hm_bd.update_yaxes(**GRID_STYLE)
-    st.plotly_chart(fig_hm_bd, width='stretch', config=CHART_CONFIG)
+    heatmap_section("BD")
 
 st.markdown("""
 <div class="callout" style="font-size:0.79rem;">
@@ -821,52 +525,12 @@ st.markdown('<div class="section-label">Springback Curve  ·  Material Reference
 col_sb_chart, col_mat_bar = st.columns([1, 1], gap="large")
 
 # ── Springback curve ──
-with col_sb_chart:
-    if mat:
-        E_mpa  = mat["E_mpa"]
-        sb_arr = np.array([springback_angle(a, r, t, mat["yield_mpa"], E_mpa) for a in angles_deg])
-        overbend_arr = angles_deg + sb_arr
-
-        fig_sb = go.Figure()
-        fig_sb.add_trace(go.Scatter(
-            x=angles_deg, y=sb_arr,
-            name="Springback Δθ",
-            line=dict(color=C_AMBER, width=2.5),
-            fill="tozeroy", fillcolor="rgba(217,119,6,0.08)",
-            hovertemplate="α=%{x:.0f}°<br>Δθ=%{y:.2f}°<extra></extra>",
-        ))
-        fig_sb.add_trace(go.Scatter(
-            x=angles_deg, y=overbend_arr,
-            name="Required overbend",
-            line=dict(color=C_RED, width=1.8, dash="dash"),
-            hovertemplate="α=%{x:.0f}°<br>Overbend=%{y:.1f}°<extra></extra>",
-        ))
-        # User point
-        sb_user = springback_angle(bend_angle, r, t, mat["yield_mpa"], E_mpa)
-        fig_sb.add_vline(x=bend_angle, line=dict(color=C_AMBER, dash="dot", width=1.5))
-        fig_sb.add_trace(go.Scatter(
-            x=[bend_angle], y=[sb_user],
-            mode="markers",
-            marker=dict(color=C_AMBER, size=11, symbol="circle",
-                        line=dict(color="white", width=2)),
-            showlegend=False,
-            hovertemplate=f"α={bend_angle}°<br>Δθ={sb_user:.2f}°<extra>Your calc</extra>",
-        ))
-        fig_sb.add_annotation(
-            x=bend_angle, y=sb_user,
-            text=f" +{sb_user:.1f}°",
-            font=dict(size=11, color=C_AMBER, family="IBM Plex Mono"),
-            showarrow=False, xanchor="left",
-        )
-        fig_sb.update_layout(
-            title=dict(text=f"Springback vs Bend Angle  —  {mat_choice}", font=dict(size=13), x=0),
-            xaxis_title="Nominal bend angle (°)",
-            yaxis_title="Springback Δθ (°)",
-            height=360, **PLOT_LAYOUT,
-        )
-        fig_sb.update_xaxes(**GRID_STYLE)
-        fig_sb.update_yaxes(**GRID_STYLE)
-        st.plotly_chart(fig_sb, width='stretch', config=CHART_CONFIG)
+@st.fragment(key="springback")
+@instrument.section("springback")
+def springback_section():
+    c = read_inputs()
+    if c.mat:
+        show_chart(build_fig_sb(c.r, c.t, c.mat_choice, c.bend_angle, c.store))
     else:
         st.markdown("""
         <div class="callout warn" style="margin-top:30px">
@@ -874,55 +538,18 @@ with col_sb_chart:
         </div>
         """, unsafe_allow_html=True)
 
+with col_sb_chart:
+    springback_section()
+
 # ── Material K bar chart ──
+@st.fragment(key="materials")
+@instrument.section("materials")
+def materials_section():
+    c = read_inputs()
+    show_chart(build_fig_mat(c.K, c.mat_choice, c.store))
+
 with col_mat_bar:
-    mat_names  = list(MATERIALS.keys())
-    k_vals     = [MATERIALS[m]["typical_k"] for m in mat_names]
-    uts_vals   = [MATERIALS[m]["uts_mpa"]   for m in mat_names]
-    selected_i = mat_names.index(mat_choice) if mat_choice in mat_names else -1
-
-    bar_colors = [C_GREEN if i == selected_i else "#b6d4b6" for i in range(len(mat_names))]
-    short_names = [n.replace("Steel – ", "").replace("Aluminum ", "Al ") for n in mat_names]
-
-    fig_mat = go.Figure()
-    fig_mat.add_trace(go.Bar(
-        y=short_names,
-        x=k_vals,
-        orientation="h",
-        marker=dict(color=bar_colors, line=dict(color="#d4ead4", width=0.5)),
-        text=[f"{v:.2f}" for v in k_vals],
-        textposition="outside",
-        textfont=dict(size=10, family="IBM Plex Mono", color="#4a6e4a"),
-        hovertemplate="%{y}<br>K = %{x:.3f}<extra></extra>",
-        name="Reference K",
-    ))
-    # UTS as a secondary scatter
-    fig_mat.add_trace(go.Scatter(
-        y=short_names,
-        x=[v / max(uts_vals) * (max(k_vals) - min(k_vals)) * 0.8 + min(k_vals) for v in uts_vals],
-        mode="markers",
-        marker=dict(color=C_PURPLE, size=7, symbol="diamond",
-                    line=dict(color="white", width=1)),
-        name="UTS (scaled)",
-        hovertemplate="%{y}<br>UTS=%{customdata} MPa<extra></extra>",
-        customdata=uts_vals,
-    ))
-    fig_mat.add_vline(x=K, line=dict(color=C_GREEN, dash="dot", width=1.5))
-    fig_mat.add_annotation(
-        x=K, y=-0.8,
-        text=f"  Your K={K:.4f}",
-        font=dict(size=10, color=C_GREEN, family="IBM Plex Mono"),
-        showarrow=False, xanchor="left",
-    )
-    fig_mat.update_layout(
-        title=dict(text="Reference K  ·  Material Comparison  (◆ = UTS scaled)",
-                   font=dict(size=13), x=0),
-        xaxis=dict(title="K-Factor", range=[0.28, 0.54], **GRID_STYLE),
-        yaxis=dict(**GRID_STYLE),
-        height=360, **PLOT_LAYOUT,
-        bargap=0.28,
-    )
-    st.plotly_chart(fig_mat, width='stretch', config=CHART_CONFIG)
+    materials_section()
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -931,49 +558,46 @@ with col_mat_bar:
 st.markdown("---")
 col_t1, col_t2 = st.columns([1, 1], gap="large")
 
-with col_t1:
+@st.fragment(key="reference")
+@instrument.section("reference")
+def reference_section():
+    c = read_inputs()
+    r_s, K = c.r_s, c.K
+
     st.markdown('<div class="section-label">K-Factor Reference Table</div>', unsafe_allow_html=True)
-    rs_table = [0.2, 0.4, 0.6, 0.8, 1.0, 1.5, 2.0, 2.5, 3.0, 4.0, 5.0, 7.0, 10.0, 15.0, 25.0]
-    df_ref   = pd.DataFrame({
-        "r/t":          rs_table,
-        "Logistic K":   [round(k_logistic(x),   4) for x in rs_table],
-        "Analytical K": [round(k_analytical(x), 4) for x in rs_table],
-        "DIN 6935 K":   [round(k_din6935(x),    4) for x in rs_table],
-        "Zone":         ["Sharp" if x < 1 else "Standard" if x < 5 else "Gentle" for x in rs_table],
-    })
-    closest_idx = int(np.argmin([abs(x - r_s) for x in rs_table]))
+    df_ref, k_cols = reference_table(METHOD_REGISTRY.version)
+    rs_table = REFERENCE.rs_table
+    closest_idx = int(np.argmin(np.abs(rs_table - r_s)))
     st.dataframe(
         df_ref.style
-            .highlight_between(subset=["Logistic K", "Analytical K", "DIN 6935 K"],
+            .highlight_between(subset=k_cols,
                                 left=0.33, right=0.42, color="#dcfce7")
-            .highlight_between(subset=["Logistic K", "Analytical K", "DIN 6935 K"],
+            .highlight_between(subset=k_cols,
                                 left=0.42, right=0.48, color="#fef9c3")
-            .highlight_between(subset=["Logistic K", "Analytical K", "DIN 6935 K"],
+            .highlight_between(subset=k_cols,
                                 left=0.48, right=0.5,  color="#dbeafe"),
         width='stretch', hide_index=True,
     )
+    k_din = k_din6935(rs_table[closest_idx])
     st.markdown(
-        f'<div class="callout">Closest table row: r/t = {rs_table[closest_idx]} · '
-        f'DIN 6935 K = {k_din6935(rs_table[closest_idx]):.4f} · '
-        f'Your K = {K:.4f} · Δ = {abs(K - k_din6935(rs_table[closest_idx])):.4f}</div>',
+        f'<div class="callout">Closest table row: r/t = {rs_table[closest_idx]:g} · '
+        f'DIN 6935 K = {k_din:.4f} · '
+        f'Your K = {K:.4f} · Δ = {abs(K - k_din):.4f}</div>',
         unsafe_allow_html=True,
     )
 
-with col_t2:
-    st.markdown('<div class="section-label">Material Properties & Reference K</div>', unsafe_allow_html=True)
-    df_mat = pd.DataFrame([
-        {"Material": m,
-         "Ref K":         p["typical_k"],
-         "UTS (MPa)":     p["uts_mpa"],
-         "Yield (MPa)":   p["yield_mpa"],
-         "Elong. (%)":    p["elongation"],
-         "E (GPa)":       round(p["E_mpa"] / 1000, 1),
-         "Min r factor":  p["min_rb_factor"]}
-        for m, p in MATERIALS.items()
-    ])
-    st.dataframe(df_mat, width='stretch', hide_index=True)
+@st.fragment(key="export")
+@instrument.section("export")
+def export_section():
+    c = read_inputs()
+    r, t, r_s, bend_angle, method, unit_lbl = c.r, c.t, c.r_s, c.bend_angle, c.method, c.unit_lbl
+    K, BA, BD, OSB = c.K, c.BA, c.BD, c.OSB
+    show_flat, leg1, leg2, show_springback = c.show_flat, c.leg1, c.leg2, c.show_springback
+    mat, mat_choice = c.mat, c.mat_choice
 
     st.markdown('<div class="section-label" style="margin-top:20px">Export</div>', unsafe_allow_html=True)
+    k_ref = c.k_all["DIN 6935 empirical"]
+    comparison = "".join(f"{METHOD_REGISTRY.get(m).label:<18}: {k_m:.4f}\n" for m, k_m in c.k_all.items())
     report = f"""K-Factor Calculation Report
 ============================
 Date       : {pd.Timestamp.now().strftime('%Y-%m-%d %H:%M')}
@@ -997,10 +621,7 @@ Bend Deduction    : {BD:.4f} {unit_lbl}
 
 Method Comparison
 -----------------
-Logistic fit      : {k_log:.4f}
-Wang-Wenner       : {k_ana:.4f}
-DIN 6935          : {k_din:.4f}
-Max divergence    : {max(abs(k_log-k_din), abs(k_ana-k_din)):.4f}
+{comparison}Max divergence    : {max(abs(k_m - k_ref) for k_m in c.k_all.values()):.4f}
 """
     if show_flat and (leg1 > 0 or leg2 > 0):
         report += f"""
@@ -1011,14 +632,12 @@ Flange B          : {leg2:.3f} {unit_lbl}
 Flat Length       : {flat_length(leg1, leg2, BA):.4f} {unit_lbl}
 """
     if show_springback and mat:
-        E_mpa_r = mat["E_mpa"]
-        sb_r    = springback_angle(bend_angle, r, t, mat["yield_mpa"], E_mpa_r)
         rb_min  = min_bend_radius(t, mat["elongation"])
         report += f"""
 Springback (Gardiner)
 ---------------------
-Springback angle  : {sb_r:.2f}°
-Required overbend : {bend_angle + sb_r:.1f}°
+Springback angle  : {c.sb:.2f}°
+Required overbend : {c.overbend_text}
 Min bend radius   : {rb_min:.3f} {unit_lbl}
 """
     st.download_button(
@@ -1026,16 +645,150 @@ Min bend radius   : {rb_min:.3f} {unit_lbl}
         file_name=f"k_factor_r{r}_t{t}.txt", mime="text/plain",
     )
 
+    def export_charts() -> str:
+        # Built only when clicked, at full resolution (the page shows
+        # level-of-detail curves).
+        figs = [build_fig1(r_s, K, t, method, bend_angle, BA, unit_lbl, c.methods, full_resolution=True),
+                build_fig_div(r_s, c.methods, full_resolution=True)]
+        if show_springback and mat:
+            figs.append(build_fig_sb(r, t, mat_choice, bend_angle, c.store, full_resolution=True))
+        return charts_html(figs)
+
+    st.download_button(
+        "📈 Download Charts (.html, full resolution)", data=export_charts,
+        file_name=f"k_factor_r{r}_t{t}_charts.html", mime="text/html", on_click="ignore",
+    )
+
+
+with col_t1:
+    reference_section()
+
+with col_t2:
+    st.markdown('<div class="section-label">Material Properties & Reference K</div>', unsafe_allow_html=True)
+    mat_ids = materials.filter()
+    df_mat = pd.DataFrame({
+        "Material":     materials.gather("name", mat_ids),
+        "Ref K":        materials.gather("typical_k", mat_ids),
+        "UTS (MPa)":    materials.gather("uts_mpa", mat_ids),
+        "Yield (MPa)":  materials.gather("yield_mpa", mat_ids),
+        "Elong. (%)":   materials.gather("elongation", mat_ids),
+        "E (GPa)":      np.round(materials.gather("E_mpa", mat_ids) / 1000, 1),
+        "Min r factor": materials.gather("min_rb_factor", mat_ids),
+    })
+    whole = st.column_config.NumberColumn(format="%d")
+    st.dataframe(df_mat, width='stretch', hide_index=True,
+                 column_config={"UTS (MPa)": whole, "Yield (MPa)": whole, "Elong. (%)": whole})
+    export_section()
+
+
+# ─── Calibration: K from Test Coupons ────────────────────────────────────
+st.markdown("---")
+
+@st.fragment(key="calibration")
+@instrument.section("calibration")
+def calibration_section():
+    with st.expander("🎯 Calibrate K from test coupons"):
+        st.markdown("""
+        Upload bent-coupon measurements as CSV with columns `flange_a`, `flange_b`,
+        `flat` (measured developed length), `r`, `t`, `angle` and optionally `material`.
+        K is solved per coupon in closed form and fitted per material by least squares
+        on the flat length.
+        """)
+        dims = st.radio("Flange dimensions", ["flat", "outside"], horizontal=True, key="calib_dims",
+                        format_func={"flat": "Tangent (straight) lengths",
+                                     "outside": "Outside mould-line"}.get)
+        upload = st.file_uploader("Coupon measurements (.csv)", type="csv", key="calib_csv")
+        if upload is None:
+            return
+        samples = pd.read_csv(upload)
+        try:
+            fit = fit_k(samples, by="material" if "material" in samples else None, dims=dims)
+        except (KeyError, ValueError) as exc:
+            st.error(str(exc))
+            return
+        table = pd.DataFrame(fit).rename(columns={
+            "n": "Coupons", "K": "Fitted K", "se": "Std. error",
+            "ci_low": "95% CI low", "ci_high": "95% CI high",
+            "k_std": "Per-coupon K σ", "rms": "Flat-length RMS",
+        })
+        st.dataframe(table.round(4), width='stretch', hide_index=True)
+
+calibration_section()
+
+
+# ─── Design-Space Sweep ──────────────────────────────────────────────────
+SWEEP_MAX_POINTS = 2_000_000
+
+@st.fragment(key="sweep")
+@instrument.section("sweep")
+def sweep_section():
+    c = read_inputs()
+    u = c.unit_lbl
+    with st.expander("🧊 Design-space sweep"):
+        st.markdown(f"""
+        Evaluate K, BA, BD, OSSB and springback over every combination of the values below, then
+        slice the result cube along any two axes. The app is limited to {SWEEP_MAX_POINTS:,} points;
+        larger sweeps run from the command line with `python -m kfactor.sweep` and are written to disk.
+        """)
+        col_a, col_b, col_c = st.columns(3)
+        r_lo, r_hi = col_a.slider(f"r range ({u})", 0.1, 25.0, (0.5, 10.0), key="sw_r")
+        r_n  = col_a.number_input("r steps", min_value=2, max_value=500, value=60, key="sw_rn")
+        t_in = col_a.text_input(f"Thicknesses ({u}, comma-separated)", "1, 1.5, 2, 3", key="sw_t")
+        a_lo, a_hi = col_b.slider("Angle range (°)", 1, 180, (10, 170), key="sw_a")
+        a_n  = col_b.number_input("Angle steps", min_value=2, max_value=360, value=81, key="sw_an")
+        materials = col_c.multiselect("Materials", list(c.store), key="sw_mat",
+                                      default=[c.mat_choice] if c.mat else [])
+        methods = col_c.multiselect("Methods", method_names(), default=[c.method], key="sw_meth")
+        try:
+            t_vals = tuple(sorted({float(v) for v in t_in.split(",") if v.strip()}))
+        except ValueError:
+            st.error("Thicknesses must be numbers separated by commas.")
+            return
+        n_points = r_n * a_n * len(t_vals) * len(methods) * max(1, len(materials))
+        if not methods or not t_vals or min(t_vals) <= 0:
+            st.info("Pick at least one method and one positive thickness.")
+            return
+        if n_points > SWEEP_MAX_POINTS:
+            st.warning(f"{n_points:,} points is above the in-app limit of {SWEEP_MAX_POINTS:,}.")
+            return
+        cube = sweep_cube(r_lo, r_hi, int(r_n), t_vals, a_lo, a_hi, int(a_n),
+                          tuple(materials), tuple(methods), METHOD_REGISTRY.version, c.store)
+
+        col_o, col_x, col_y = st.columns(3)
+        output = col_o.selectbox("Output", cube.outputs, index=cube.outputs.index("BA"), key="sw_out")
+        x_dim  = col_x.selectbox("X axis", cube.dims, index=cube.dims.index("r"), key="sw_x")
+        y_opts = [d for d in cube.dims if d != x_dim]
+        y_dim  = col_y.selectbox("Y axis", y_opts, key="sw_y",
+                                 index=y_opts.index("angle") if "angle" in y_opts else 0)
+        fixed = {}
+        for d in (d for d in cube.dims if d not in (x_dim, y_dim)):
+            options = cube.coords[d].tolist()
+            if len(options) == 1:
+                fixed[d] = options[0]
+            elif d in NUMERIC_DIMS:
+                fixed[d] = st.select_slider(SWEEP_AXIS_TITLES[d], options, key=f"sw_fix_{d}",
+                                            format_func=lambda v: f"{v:.4g}")
+            else:
+                fixed[d] = st.selectbox(SWEEP_AXIS_TITLES[d], options, key=f"sw_fix_{d}")
+        part = cube.sel(**fixed)
+        z = part[output] if part.dims == (y_dim, x_dim) else part[output].T
+        title = f"{output} over {x_dim} × {y_dim}  ·  " + ", ".join(f"{d} = {v:.4g}" if d in NUMERIC_DIMS
+                                                               else f"{d} = {v}" for d, v in fixed.items())
+        show_chart(build_fig_sweep(z, part.coords[x_dim], part.coords[y_dim], x_dim, y_dim,
+                                   output, title, u))
+        st.download_button("📥 Download slice (.csv)", data=part.to_frame().to_csv(index=False),
+                           file_name=f"sweep_{output}_{x_dim}_{y_dim}.csv", mime="text/csv",
+                           key="sw_dl")
+
+sweep_section()
+
 
 # ─── Engineering Notes ───────────────────────────────────────────────────
 st.markdown("---")
 with st.expander("💡 Engineering Notes"):
+    st.markdown("**K-Factor Methods**\n" + "\n".join(
+        f"- *{m.name}* — {m.description}" for m in METHOD_REGISTRY))
     st.markdown("""
-    **K-Factor Methods**
-    - *Logistic fit* — empirically calibrated curve, good all-purpose default.
-    - *Wang-Wenner analytical* — derived from neutral-axis shift theory; underestimates K at very low r/t.
-    - *DIN 6935 empirical* — German standard piecewise table; use for Euronorm/DIN compliance work.
-
     **Reading the Method Divergence Strip**
     Peak divergence occurs around r/t 0.5–1.5 (sharp bends). In the standard production zone (r/t 1–4)
     all three methods agree to within ±0.010. The divergence chart helps you decide when it matters
@@ -1050,7 +803,8 @@ with st.expander("💡 Engineering Notes"):
     For K = 0.33 it sits at 1/3 thickness (sharp bends); for K → 0.5 it moves to the mid-plane.
 
     **Springback**
-    Estimated via the Gardiner formula: Δθ ≈ θ × (3σ_y·r / E·t). Actual springback depends on tooling,
+    Estimated via the Gardiner formula: Δθ ≈ θ × (3σ_y·r / E·t). The overbend is the commanded angle
+    θc that springs back to the target: θc − Δθ(θc) = θ. Actual springback depends on tooling,
     lubrication, and work-hardening. Always validate with test bends.
 
     **Minimum Bend Radius**
@@ -1061,3 +815,20 @@ with st.expander("💡 Engineering Notes"):
     Bending perpendicular to the rolling direction needs 15–30 % larger r_min. Bending parallel to
     grain allows tighter radii but may cause cracking.
     """)
+
+
+# ─── Performance Debug Panel ─────────────────────────────────────────────
+if instrument.enabled():
+    run = instrument.current_run()
+    with st.expander("⏱ Performance (debug)"):
+        st.caption("This full rerun; fragment-only reruns are logged and "
+                   "counted in the totals but not shown here until the next full run.")
+        timings = pd.DataFrame(run.rows() if run else [])
+        if not timings.empty:
+            timings["ms"] = timings.pop("seconds") * 1e3
+            timings["max ms"] = timings.pop("max_seconds") * 1e3
+            timings["alloc KiB"] = timings.pop("alloc_bytes") / 1024
+            st.dataframe(timings, hide_index=True, width='stretch')
+        st.download_button("⬇ Totals (Prometheus text)", instrument.prometheus_text(),
+                           file_name="kfactor_metrics.txt", mime="text/plain")
+    instrument.end_run()